@@ -0,0 +1,437 @@
+package checkpoint
+
+import (
+	"bufio"
+	"bytes"
+	"container/heap"
+	"errors"
+	"fmt"
+	"os"
+	"strings"
+	"time"
+)
+
+const (
+	// catChunkSize is a size of formatted rows sent from a file worker at
+	// once.
+	catChunkSize = 64 * 1024
+	// catChunksInFlight is a count of chunks that a file worker could
+	// prepare in advance.
+	catChunksInFlight = 4
+)
+
+// errCatCanceled is returned by a file worker if the output is canceled.
+var errCatCanceled = errors.New("canceled")
+
+// filterRow returns true if the row matches the options. It also returns true
+// if rows after the row in a file could not match the options.
+func filterRow(row Row, opts Opts) (bool, bool) {
+	lsn := row.Header.LSN
+	replicaID := row.Header.ReplicaID
+	if len(opts.Replica) == 1 && replicaID != 0 &&
+		uint64(opts.Replica[0]) == replicaID && lsn >= opts.To {
+		// All next rows from the replica have bigger LSNs.
+		return false, true
+	}
+	if lsn < opts.From || lsn >= opts.To {
+		return false, false
+	}
+
+	spaceID, hasSpace := row.SpaceID()
+	if opts.Space == nil {
+		if hasSpace && spaceID < 512 && !opts.ShowSystem {
+			return false, false
+		}
+	} else if !hasSpace || !containsId(opts.Space, spaceID) {
+		return false, false
+	}
+	if opts.Replica != nil && (replicaID == 0 || !containsId(opts.Replica, replicaID)) {
+		return false, false
+	}
+	return true, false
+}
+
+// containsId returns true if the list contains the id.
+func containsId(list []int, id uint64) bool {
+	for _, v := range list {
+		if v >= 0 && uint64(v) == id {
+			return true
+		}
+	}
+	return false
+}
+
+// catJobs returns a count of files decoded in parallel.
+func catJobs(opts Opts) int {
+	if opts.Jobs < 1 {
+		return 1
+	}
+	return opts.Jobs
+}
+
+// rowKey is a key to merge rows from several files.
+type rowKey struct {
+	replicaID uint64
+	lsn       uint64
+}
+
+// less returns true if the key is less than the other one.
+func (key rowKey) less(other rowKey) bool {
+	if key.replicaID != other.replicaID {
+		return key.replicaID < other.replicaID
+	}
+	return key.lsn < other.lsn
+}
+
+// catChunk is a chunk of formatted rows of a file.
+type catChunk struct {
+	// data is formatted rows.
+	data []byte
+	// keys are keys of rows, filled for a merge only.
+	keys []rowKey
+	// ends are end offsets of rows in the data, filled for a merge only.
+	ends []int
+	// err is an error of the file processing. It is set for the last chunk.
+	err error
+}
+
+// catWorker decodes, filters and formats rows of a file into chunks. Decoding
+// is limited with the semaphore, if set.
+type catWorker struct {
+	path      string
+	opts      Opts
+	formatter rowFormatter
+	// keyed is true if keys and ends of rows should be filled.
+	keyed bool
+	// skip is true if the file has no rows in the LSN range.
+	skip bool
+	// sem limits a count of files decoded at the moment.
+	sem chan struct{}
+	// done is closed if the output is canceled.
+	done <-chan struct{}
+	// chunks is a channel for the prepared chunks. It is closed at the end.
+	chunks chan catChunk
+	// index is an index of the file.
+	index int
+	// progress collects counters of workers.
+	progress *catProgress
+	// stats contains counters of the file.
+	stats catFileStats
+	// reportedRead and reportedMatched are counts of rows added to the
+	// progress.
+	reportedRead    uint64
+	reportedMatched uint64
+}
+
+// acquire acquires the semaphore. It returns false if the output is
+// canceled.
+func (w *catWorker) acquire() bool {
+	if w.sem == nil {
+		return true
+	}
+	select {
+	case w.sem <- struct{}{}:
+		return true
+	case <-w.done:
+		return false
+	}
+}
+
+// release releases the semaphore.
+func (w *catWorker) release() {
+	if w.sem != nil {
+		<-w.sem
+	}
+}
+
+// send sends the chunk without holding the semaphore. It returns false if the
+// output is canceled.
+func (w *catWorker) send(chunk catChunk) bool {
+	w.release()
+	select {
+	case w.chunks <- chunk:
+	case <-w.done:
+		return false
+	}
+	return w.acquire()
+}
+
+// report adds counters of the file to the progress.
+func (w *catWorker) report() {
+	w.progress.add(w.stats.RowsRead-w.reportedRead, w.stats.RowsMatched-w.reportedMatched)
+	w.reportedRead = w.stats.RowsRead
+	w.reportedMatched = w.stats.RowsMatched
+}
+
+// run processes the file.
+func (w *catWorker) run() {
+	defer close(w.chunks)
+	start := time.Now()
+	w.stats = catFileStats{File: w.path, Skipped: w.skip, Spaces: map[uint64]uint64{}}
+	defer func() {
+		w.stats.Duration = time.Since(start).Seconds()
+		w.report()
+		w.progress.finish(w.index, w.stats)
+	}()
+	if w.skip || !w.acquire() {
+		return
+	}
+	if stat, err := os.Stat(w.path); err == nil {
+		w.stats.Size = stat.Size()
+	}
+
+	var chunk catChunk
+	buf := &bytes.Buffer{}
+	writer := bufio.NewWriter(buf)
+	err := readXlogRange(w.path, w.opts, func(row Row) (bool, error) {
+		w.stats.RowsRead++
+		if w.stats.RowsRead%catProgressRows == 0 {
+			w.report()
+		}
+		match, stop := filterRow(row, w.opts)
+		if match {
+			w.stats.RowsMatched++
+			if spaceID, ok := row.SpaceID(); ok {
+				w.stats.Spaces[spaceID]++
+			}
+			w.formatter(writer, row)
+			if w.keyed {
+				writer.Flush()
+				chunk.keys = append(chunk.keys, rowKey{
+					replicaID: row.Header.ReplicaID,
+					lsn:       row.Header.LSN,
+				})
+				chunk.ends = append(chunk.ends, buf.Len())
+			}
+			if buf.Len()+writer.Buffered() >= catChunkSize {
+				writer.Flush()
+				chunk.data = buf.Bytes()
+				if !w.send(chunk) {
+					return false, errCatCanceled
+				}
+				chunk = catChunk{}
+				buf = &bytes.Buffer{}
+				writer.Reset(buf)
+			}
+		}
+		return !stop, nil
+	})
+	if err == errCatCanceled {
+		return
+	}
+
+	writer.Flush()
+	chunk.data = buf.Bytes()
+	chunk.err = err
+	w.release()
+	select {
+	case w.chunks <- chunk:
+	case <-w.done:
+	}
+}
+
+// newCatWorkers creates workers for the files.
+func newCatWorkers(files []string, opts Opts, formatter rowFormatter, keyed bool,
+	sem chan struct{}, done <-chan struct{}, progress *catProgress) []*catWorker {
+	workers := make([]*catWorker, len(files))
+	skip := skipFiles(files, opts)
+	for i, file := range files {
+		workers[i] = &catWorker{
+			path:      file,
+			opts:      opts,
+			formatter: formatter,
+			keyed:     keyed,
+			skip:      skip[i],
+			sem:       sem,
+			done:      done,
+			chunks:    make(chan catChunk, catChunksInFlight),
+			index:     i,
+			progress:  progress,
+		}
+	}
+	return workers
+}
+
+// catFiles writes rows of the files one after another. Up to opts.Jobs next
+// files are decoded in advance.
+func catFiles(writer *bufio.Writer, files []string, opts Opts,
+	formatter rowFormatter, progress *catProgress) error {
+	done := make(chan struct{})
+	defer close(done)
+	workers := newCatWorkers(files, opts, formatter, false, nil, done, progress)
+
+	started := 0
+	for i, file := range files {
+		for ; started < len(files) && started < i+catJobs(opts); started++ {
+			go workers[started].run()
+		}
+
+		writer.Flush()
+		fmt.Fprintf(os.Stderr, "• Result of cat: the file \"%s\" is processed below •\n",
+			file)
+
+		printed := false
+		for chunk := range workers[i].chunks {
+			if len(chunk.data) > 0 {
+				printed = true
+				writer.Write(chunk.data)
+			}
+			if chunk.err != nil {
+				return fmt.Errorf("result of cat: %w", chunk.err)
+			}
+		}
+		if opts.Format == "yaml" && printed {
+			writer.WriteString("...\n\n")
+		}
+	}
+	return nil
+}
+
+// mergeCursor is a position in the chunks of a file.
+type mergeCursor struct {
+	worker *catWorker
+	chunk  catChunk
+	// pos is an index of the current row in the chunk.
+	pos int
+	// index is an index of the file.
+	index int
+}
+
+// next moves the cursor to the next row. It returns false if there are no
+// more rows.
+func (c *mergeCursor) next() (bool, error) {
+	c.pos++
+	for c.pos >= len(c.chunk.keys) {
+		if c.chunk.err != nil {
+			return false, c.chunk.err
+		}
+		chunk, ok := <-c.worker.chunks
+		if !ok {
+			return false, nil
+		}
+		c.chunk = chunk
+		c.pos = 0
+	}
+	return true, nil
+}
+
+// row returns the formatted current row.
+func (c *mergeCursor) row() []byte {
+	start := 0
+	if c.pos > 0 {
+		start = c.chunk.ends[c.pos-1]
+	}
+	return c.chunk.data[start:c.chunk.ends[c.pos]]
+}
+
+// mergeHeap is a heap of cursors ordered by keys of current rows.
+type mergeHeap []*mergeCursor
+
+func (h mergeHeap) Len() int { return len(h) }
+
+func (h mergeHeap) Less(i, j int) bool {
+	a, b := h[i].chunk.keys[h[i].pos], h[j].chunk.keys[h[j].pos]
+	if a == b {
+		return h[i].index < h[j].index
+	}
+	return a.less(b)
+}
+
+func (h mergeHeap) Swap(i, j int) { h[i], h[j] = h[j], h[i] }
+
+func (h *mergeHeap) Push(x any) { *h = append(*h, x.(*mergeCursor)) }
+
+func (h *mergeHeap) Pop() any {
+	old := *h
+	x := old[len(old)-1]
+	*h = old[:len(old)-1]
+	return x
+}
+
+// catMerge writes rows of the files merged in (replica id, LSN) order. Up to
+// opts.Jobs files are decoded at the moment.
+func catMerge(writer *bufio.Writer, files []string, opts Opts,
+	formatter rowFormatter, progress *catProgress) error {
+	done := make(chan struct{})
+	defer close(done)
+	sem := make(chan struct{}, catJobs(opts))
+	workers := newCatWorkers(files, opts, formatter, true, sem, done, progress)
+	for _, worker := range workers {
+		go worker.run()
+	}
+
+	quoted := make([]string, len(files))
+	for i, file := range files {
+		quoted[i] = fmt.Sprintf("%q", file)
+	}
+	writer.Flush()
+	fmt.Fprintf(os.Stderr, "• Result of cat: the files %s are merged below •\n",
+		strings.Join(quoted, ", "))
+
+	cursors := mergeHeap{}
+	for i, worker := range workers {
+		cursor := &mergeCursor{worker: worker, pos: -1, index: i}
+		ok, err := cursor.next()
+		if err != nil {
+			return fmt.Errorf("result of cat: %w", err)
+		}
+		if ok {
+			cursors = append(cursors, cursor)
+		}
+	}
+	heap.Init(&cursors)
+
+	printed := false
+	for len(cursors) > 0 {
+		cursor := cursors[0]
+		writer.Write(cursor.row())
+		printed = true
+
+		ok, err := cursor.next()
+		if err != nil {
+			return fmt.Errorf("result of cat: %w", err)
+		}
+		if ok {
+			heap.Fix(&cursors, 0)
+		} else {
+			heap.Pop(&cursors)
+		}
+	}
+	if opts.Format == "yaml" && printed {
+		writer.WriteString("...\n\n")
+	}
+	return nil
+}
+
+// Cat print the contents of .snap/.xlog files.
+// Returns an error if such occur during reading files.
+func Cat(files []string, opts Opts) error {
+	formatter, ok := rowFormatters[opts.Format]
+	if !ok {
+		return fmt.Errorf("unknown output format %q", opts.Format)
+	}
+
+	writer := bufio.NewWriterSize(os.Stdout, xlogReadBufferSize)
+	defer writer.Flush()
+
+	progress := newCatProgress(len(files))
+	stopReport := progress.report(os.Stderr, catProgressInterval)
+	var err error
+	if opts.Merge {
+		err = catMerge(writer, files, opts, formatter, progress)
+	} else {
+		err = catFiles(writer, files, opts, formatter, progress)
+	}
+	stopReport()
+	if err != nil {
+		return err
+	}
+
+	writer.Flush()
+	stats := progress.stats()
+	stats.print(os.Stderr)
+	if opts.StatsFile != "" {
+		return stats.write(opts.StatsFile)
+	}
+	return nil
+}
@@ -0,0 +1,120 @@
+package checkpoint
+
+import (
+	"bufio"
+	"bytes"
+	"math"
+	"os"
+	"path/filepath"
+	"sort"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+var catTestFiles = []string{"testdata/test.xlog", "testdata/test.snap", "testdata/test.xlog"}
+
+type catFunc func(*bufio.Writer, []string, Opts, rowFormatter, *catProgress) error
+
+func catTestOutput(t *testing.T, cat catFunc, files []string, opts Opts) string {
+	t.Helper()
+	var buf bytes.Buffer
+	writer := bufio.NewWriter(&buf)
+	progress := newCatProgress(len(files))
+	require.NoError(t, cat(writer, files, opts, rowFormatters[opts.Format], progress))
+	require.NoError(t, writer.Flush())
+	return buf.String()
+}
+
+func TestCatFiles_jobs(t *testing.T) {
+	opts := Opts{To: math.MaxUint64, Format: "yaml", ShowSystem: true}
+
+	var expected bytes.Buffer
+	for _, file := range catTestFiles {
+		writer := bufio.NewWriter(&expected)
+		err := ReadXlogFile(file, func(row Row) (bool, error) {
+			rowFormatters[opts.Format](writer, row)
+			return true, nil
+		})
+		require.NoError(t, err)
+		writer.WriteString("...\n\n")
+		require.NoError(t, writer.Flush())
+	}
+
+	for _, jobs := range []int{0, 1, 2, 8} {
+		opts.Jobs = jobs
+		assert.Equal(t, expected.String(), catTestOutput(t, catFiles, catTestFiles, opts))
+	}
+}
+
+func TestCatMerge(t *testing.T) {
+	opts := Opts{To: math.MaxUint64, Format: "json", ShowSystem: true, Jobs: 2}
+
+	type keyedRow struct {
+		key  rowKey
+		data string
+	}
+	var rows []keyedRow
+	for _, file := range catTestFiles {
+		err := ReadXlogFile(file, func(row Row) (bool, error) {
+			var buf bytes.Buffer
+			writer := bufio.NewWriter(&buf)
+			rowFormatters[opts.Format](writer, row)
+			require.NoError(t, writer.Flush())
+			rows = append(rows, keyedRow{
+				key:  rowKey{replicaID: row.Header.ReplicaID, lsn: row.Header.LSN},
+				data: buf.String(),
+			})
+			return true, nil
+		})
+		require.NoError(t, err)
+	}
+	sort.SliceStable(rows, func(i, j int) bool {
+		return rows[i].key.less(rows[j].key)
+	})
+	expected := ""
+	for _, row := range rows {
+		expected += row.data
+	}
+
+	assert.Equal(t, expected, catTestOutput(t, catMerge, catTestFiles, opts))
+}
+
+func TestCat_errors(t *testing.T) {
+	files := []string{"testdata/test.xlog", "testdata/not_exists.xlog", "testdata/test.snap"}
+	opts := Opts{To: math.MaxUint64, Format: "yaml", Jobs: 2}
+
+	for _, cat := range []catFunc{catFiles, catMerge} {
+		writer := bufio.NewWriter(&bytes.Buffer{})
+		err := cat(writer, files, opts, rowFormatters[opts.Format], newCatProgress(len(files)))
+		assert.ErrorContains(t, err, "no such file or directory")
+	}
+}
+
+func TestCatFiles_stats(t *testing.T) {
+	opts := Opts{To: math.MaxUint64, Format: "yaml", Space: []int{272}, Jobs: 2}
+	progress := newCatProgress(len(catTestFiles))
+	writer := bufio.NewWriter(&bytes.Buffer{})
+	require.NoError(t, catFiles(writer, catTestFiles, opts, rowFormatters[opts.Format],
+		progress))
+
+	stats := progress.stats()
+	require.Len(t, stats.Files, 3)
+	assert.Equal(t, "testdata/test.xlog", stats.Files[0].File)
+	assert.Equal(t, uint64(2), stats.Files[0].RowsRead)
+	assert.Equal(t, uint64(1), stats.Files[0].RowsMatched)
+	assert.Equal(t, int64(228), stats.Files[0].Size)
+	assert.Equal(t, uint64(515), stats.Files[1].RowsRead)
+	assert.Equal(t, uint64(2+515+2), stats.RowsRead)
+	assert.Equal(t, stats.RowsMatched, stats.Spaces[272])
+	assert.Equal(t, stats.Files[0].Size*2+stats.Files[1].Size, stats.Bytes)
+	assert.Equal(t, stats.RowsRead, progress.rowsRead.Load())
+	assert.Equal(t, stats.RowsMatched, progress.rowsMatched.Load())
+
+	path := filepath.Join(t.TempDir(), "stats.json")
+	require.NoError(t, stats.write(path))
+	data, err := os.ReadFile(path)
+	require.NoError(t, err)
+	assert.Contains(t, string(data), `"rows_read": 519`)
+}
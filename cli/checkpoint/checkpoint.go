@@ -4,7 +4,6 @@ import (
 	"bufio"
 	"bytes"
 	"fmt"
-	"os"
 	"os/exec"
 
 	"github.com/tarantool/tt/cli/cmdcontext"
@@ -19,27 +18,28 @@ type Opts struct {
 	Format     string
 	Replica    []int
 	ShowSystem bool
-}
-
-// Cat print the contents of .snap/.xlog files.
-// Returns an error if such occur during reading files.
-func Cat(tntCli cmdcontext.TarantoolCli) error {
-	cmd := exec.Command(tntCli.Executable, "-")
-	cmd.Stderr = os.Stderr
-	cmd.Stdout = os.Stdout
-
-	stdinPipe, err := cmd.StdinPipe()
-	if err != nil {
-		return err
-	}
-	stdinPipe.Write([]byte(catFile))
-	stdinPipe.Close()
-
-	if err := cmd.Run(); err != nil {
-		return fmt.Errorf("result of cat: %w", err)
-	}
-
-	return nil
+	// Jobs is a count of files decoded in parallel.
+	Jobs int
+	// Merge is true if rows of all files should be merged in (replica id,
+	// LSN) order.
+	Merge bool
+	// Index is true if a sparse LSN index of files should be used to seek to
+	// the first row in the LSN range. The index is stored near a file.
+	Index bool
+	// Window is a max count of operations sent by tt play without waiting
+	// for results.
+	Window int
+	// Connections is a count of connections used by tt play.
+	Connections int
+	// Partition is a way to distribute operations between connections of
+	// tt play: by a space ("space") or by a primary key ("key").
+	Partition string
+	// Journal is a path to a progress journal of tt play.
+	Journal string
+	// Resume is true if tt play should resume from the progress journal.
+	Resume bool
+	// StatsFile is a path to a file to write statistics in JSON format.
+	StatsFile string
 }
 
 // Play is playing the contents of .snap/.xlog files to another Tarantool instance.
@@ -0,0 +1,517 @@
+package checkpoint
+
+import (
+	"bufio"
+	"encoding/base64"
+	"encoding/binary"
+	"encoding/hex"
+	"fmt"
+	"math"
+	"strconv"
+	"strings"
+	"time"
+	"unicode/utf8"
+)
+
+// Extension types of MessagePack values from Tarantool.
+const (
+	extDecimal  = 1
+	extUUID     = 2
+	extDatetime = 4
+)
+
+// rowFormatter writes a row into a writer.
+type rowFormatter func(w *bufio.Writer, row Row)
+
+// rowFormatters contains row formatters for supported output formats.
+var rowFormatters = map[string]rowFormatter{
+	"yaml": writeYamlRow,
+	"json": writeJsonRow,
+	"lua":  writeLuaRow,
+}
+
+// headerFields returns fields of the row header in the output order.
+func headerFields(header RowHeader) []Field {
+	fields := []Field{{Key: "lsn", Value: header.LSN}}
+	if header.ReplicaID != 0 {
+		fields = append(fields, Field{Key: "replica_id", Value: header.ReplicaID})
+	}
+	if header.GroupID != 0 {
+		fields = append(fields, Field{Key: "group_id", Value: header.GroupID})
+	}
+	fields = append(fields, Field{Key: "type", Value: header.TypeName()})
+	if header.Timestamp != 0 {
+		fields = append(fields, Field{Key: "timestamp", Value: header.Timestamp})
+	}
+	// A row of a multi-statement transaction.
+	if header.TSN != header.LSN || !header.IsCommit {
+		fields = append(fields, Field{Key: "tsn", Value: header.TSN})
+		if header.IsCommit {
+			fields = append(fields, Field{Key: "commit", Value: true})
+		}
+	}
+	return fields
+}
+
+// rowFields returns the row as a map with HEADER and BODY keys.
+func rowFields(row Row) []Field {
+	fields := []Field{{Key: "HEADER", Value: headerFields(row.Header)}}
+	if row.Body != nil {
+		fields = append(fields, Field{Key: "BODY", Value: row.Body})
+	}
+	return fields
+}
+
+// formatFloat formats a floating point number the same way as Lua does.
+func formatFloat(v float64) string {
+	return strconv.FormatFloat(v, 'g', 14, 64)
+}
+
+// formatDecimal formats a decimal extension value.
+func formatDecimal(data []byte) (string, bool) {
+	decoder := mpDecoder{buf: data}
+	scaleValue, err := decoder.decode()
+	if err != nil {
+		return "", false
+	}
+	var scale int64
+	switch v := scaleValue.(type) {
+	case uint64:
+		scale = int64(v)
+	case int64:
+		scale = v
+	default:
+		return "", false
+	}
+
+	bcd := data[decoder.pos:]
+	if len(bcd) == 0 {
+		return "", false
+	}
+	digits := make([]byte, 0, 2*len(bcd))
+	for i, b := range bcd {
+		if i != 0 || b>>4 != 0 {
+			digits = append(digits, '0'+b>>4)
+		}
+		if i != len(bcd)-1 {
+			digits = append(digits, '0'+b&0x0f)
+		}
+	}
+	for _, digit := range digits {
+		if digit > '9' {
+			return "", false
+		}
+	}
+	sign := bcd[len(bcd)-1] & 0x0f
+	negative := sign == 0x0b || sign == 0x0d
+
+	str := strings.TrimLeft(string(digits), "0")
+	if scale > 0 {
+		if int64(len(str)) <= scale {
+			str = strings.Repeat("0", int(scale)-len(str)+1) + str
+		}
+		point := int64(len(str)) - scale
+		str = str[:point] + "." + str[point:]
+	} else if str == "" {
+		str = "0"
+	} else if scale < 0 {
+		str += strings.Repeat("0", int(-scale))
+	}
+	if negative && strings.Trim(str, "0.") != "" {
+		str = "-" + str
+	}
+	return str, true
+}
+
+// formatUUID formats an UUID extension value.
+func formatUUID(data []byte) (string, bool) {
+	if len(data) != 16 {
+		return "", false
+	}
+	str := hex.EncodeToString(data)
+	return str[0:8] + "-" + str[8:12] + "-" + str[12:16] + "-" + str[16:20] + "-" +
+		str[20:], true
+}
+
+// formatDatetime formats a datetime extension value.
+func formatDatetime(data []byte) (string, bool) {
+	if len(data) != 8 && len(data) != 16 {
+		return "", false
+	}
+	seconds := int64(binary.LittleEndian.Uint64(data[0:8]))
+	var nsec, tzoffset int64
+	if len(data) == 16 {
+		nsec = int64(int32(binary.LittleEndian.Uint32(data[8:12])))
+		tzoffset = int64(int16(binary.LittleEndian.Uint16(data[12:14])))
+	}
+	t := time.Unix(seconds, nsec).In(time.FixedZone("", int(tzoffset)*60))
+	return t.Format(time.RFC3339Nano), true
+}
+
+// formatExt returns a string representation of an extension value and a Lua
+// constructor for it.
+func formatExt(ext Ext) (string, string) {
+	switch ext.Type {
+	case extDecimal:
+		if str, ok := formatDecimal(ext.Data); ok {
+			return str, "require('decimal').new('" + str + "')"
+		}
+	case extUUID:
+		if str, ok := formatUUID(ext.Data); ok {
+			return str, "require('uuid').fromstr('" + str + "')"
+		}
+	case extDatetime:
+		if str, ok := formatDatetime(ext.Data); ok {
+			return str, "require('datetime').parse('" + str + "')"
+		}
+	}
+	str := fmt.Sprintf("ext(%d, 0x%s)", ext.Type, hex.EncodeToString(ext.Data))
+	return str, "'" + str + "'"
+}
+
+// yamlPlainAllowed returns true if the string could be written as a plain
+// YAML scalar in a block context.
+func yamlPlainAllowed(str string) bool {
+	if str == "" || str[0] == ' ' || str[len(str)-1] == ' ' {
+		return false
+	}
+	if strings.ContainsAny(str[:1], "-?:,[]{}#&*!|>'\"%@`0123456789+.~") {
+		return false
+	}
+	switch strings.ToLower(str) {
+	case "null", "true", "false", "yes", "no", "on", "off", "y", "n":
+		return false
+	}
+	if strings.Contains(str, ": ") || strings.Contains(str, " #") ||
+		strings.HasSuffix(str, ":") {
+		return false
+	}
+	for _, r := range str {
+		if r < 0x20 || r == 0x7f || r == utf8.RuneError {
+			return false
+		}
+	}
+	return true
+}
+
+// yamlPrintable returns true if the string could be written as a
+// single-quoted YAML scalar.
+func yamlPrintable(str string) bool {
+	if !utf8.ValidString(str) {
+		return false
+	}
+	for _, r := range str {
+		if r < 0x20 || r == 0x7f {
+			return false
+		}
+	}
+	return true
+}
+
+// writeYamlString writes a YAML string scalar.
+func writeYamlString(w *bufio.Writer, str string, flow bool) {
+	if !flow && yamlPlainAllowed(str) {
+		w.WriteString(str)
+	} else if yamlPrintable(str) {
+		w.WriteByte('\'')
+		w.WriteString(strings.ReplaceAll(str, "'", "''"))
+		w.WriteByte('\'')
+	} else if utf8.ValidString(str) {
+		w.WriteString(strconv.Quote(str))
+	} else {
+		w.WriteString("!!binary ")
+		w.WriteString(base64.StdEncoding.EncodeToString([]byte(str)))
+	}
+}
+
+// writeYamlValue writes a YAML value. Nested arrays and maps are written in
+// a flow style.
+func writeYamlValue(w *bufio.Writer, value any, flow bool) {
+	switch v := value.(type) {
+	case nil:
+		w.WriteString("null")
+	case bool:
+		w.WriteString(strconv.FormatBool(v))
+	case uint64:
+		w.WriteString(strconv.FormatUint(v, 10))
+	case int64:
+		w.WriteString(strconv.FormatInt(v, 10))
+	case float32:
+		writeYamlFloat(w, float64(v))
+	case float64:
+		writeYamlFloat(w, v)
+	case string:
+		writeYamlString(w, v, flow)
+	case []byte:
+		writeYamlString(w, string(v), flow)
+	case Ext:
+		str, _ := formatExt(v)
+		writeYamlString(w, str, flow)
+	case []any:
+		w.WriteByte('[')
+		for i, item := range v {
+			if i != 0 {
+				w.WriteString(", ")
+			}
+			writeYamlValue(w, item, true)
+		}
+		w.WriteByte(']')
+	case []Field:
+		w.WriteByte('{')
+		for i, field := range v {
+			if i != 0 {
+				w.WriteString(", ")
+			}
+			writeYamlValue(w, field.Key, true)
+			w.WriteString(": ")
+			writeYamlValue(w, field.Value, true)
+		}
+		w.WriteByte('}')
+	}
+}
+
+// writeYamlFloat writes a YAML floating point number.
+func writeYamlFloat(w *bufio.Writer, v float64) {
+	switch {
+	case math.IsNaN(v):
+		w.WriteString(".nan")
+	case math.IsInf(v, 1):
+		w.WriteString(".inf")
+	case math.IsInf(v, -1):
+		w.WriteString("-.inf")
+	default:
+		w.WriteString(formatFloat(v))
+	}
+}
+
+// writeYamlRow writes the row as a YAML document without the end marker.
+func writeYamlRow(w *bufio.Writer, row Row) {
+	w.WriteString("---\n")
+	for _, section := range rowFields(row) {
+		w.WriteString(section.Key.(string))
+		w.WriteString(":\n")
+		for _, field := range section.Value.([]Field) {
+			w.WriteString("  ")
+			writeYamlValue(w, field.Key, false)
+			w.WriteString(": ")
+			writeYamlValue(w, field.Value, false)
+			w.WriteByte('\n')
+		}
+	}
+}
+
+// writeJsonString writes a JSON string.
+func writeJsonString(w *bufio.Writer, str string) {
+	w.WriteByte('"')
+	for i := 0; i < len(str); i++ {
+		c := str[i]
+		switch c {
+		case '"':
+			w.WriteString(`\"`)
+		case '\\':
+			w.WriteString(`\\`)
+		case '/':
+			w.WriteString(`\/`)
+		case '\b':
+			w.WriteString(`\b`)
+		case '\f':
+			w.WriteString(`\f`)
+		case '\n':
+			w.WriteString(`\n`)
+		case '\r':
+			w.WriteString(`\r`)
+		case '\t':
+			w.WriteString(`\t`)
+		default:
+			if c < 0x20 || c == 0x7f {
+				fmt.Fprintf(w, `\u%04x`, c)
+			} else {
+				w.WriteByte(c)
+			}
+		}
+	}
+	w.WriteByte('"')
+}
+
+// writeJsonValue writes a JSON value.
+func writeJsonValue(w *bufio.Writer, value any) {
+	switch v := value.(type) {
+	case nil:
+		w.WriteString("null")
+	case bool:
+		w.WriteString(strconv.FormatBool(v))
+	case uint64:
+		w.WriteString(strconv.FormatUint(v, 10))
+	case int64:
+		w.WriteString(strconv.FormatInt(v, 10))
+	case float32:
+		writeJsonFloat(w, float64(v))
+	case float64:
+		writeJsonFloat(w, v)
+	case string:
+		writeJsonString(w, v)
+	case []byte:
+		writeJsonString(w, string(v))
+	case Ext:
+		str, _ := formatExt(v)
+		writeJsonString(w, str)
+	case []any:
+		w.WriteByte('[')
+		for i, item := range v {
+			if i != 0 {
+				w.WriteByte(',')
+			}
+			writeJsonValue(w, item)
+		}
+		w.WriteByte(']')
+	case []Field:
+		w.WriteByte('{')
+		for i, field := range v {
+			if i != 0 {
+				w.WriteByte(',')
+			}
+			if key, ok := field.Key.(string); ok {
+				writeJsonString(w, key)
+			} else {
+				w.WriteByte('"')
+				writeJsonValue(w, field.Key)
+				w.WriteByte('"')
+			}
+			w.WriteByte(':')
+			writeJsonValue(w, field.Value)
+		}
+		w.WriteByte('}')
+	}
+}
+
+// writeJsonFloat writes a JSON floating point number.
+func writeJsonFloat(w *bufio.Writer, v float64) {
+	switch {
+	case math.IsNaN(v):
+		w.WriteString("nan")
+	case math.IsInf(v, 1):
+		w.WriteString("inf")
+	case math.IsInf(v, -1):
+		w.WriteString("-inf")
+	default:
+		w.WriteString(formatFloat(v))
+	}
+}
+
+// writeJsonRow writes the row as a JSON object on a line.
+func writeJsonRow(w *bufio.Writer, row Row) {
+	writeJsonValue(w, rowFields(row))
+	w.WriteByte('\n')
+}
+
+// writeLuaString writes a Lua string with all bytes escaped.
+func writeLuaString(w *bufio.Writer, str string) {
+	const digits = "0123456789abcdef"
+	w.WriteByte('\'')
+	for i := 0; i < len(str); i++ {
+		w.WriteString(`\x`)
+		w.WriteByte(digits[str[i]>>4])
+		w.WriteByte(digits[str[i]&0x0f])
+	}
+	w.WriteByte('\'')
+}
+
+// writeLuaValue writes a Lua value.
+func writeLuaValue(w *bufio.Writer, value any) {
+	switch v := value.(type) {
+	case nil:
+		w.WriteString("box.NULL")
+	case bool:
+		w.WriteString(strconv.FormatBool(v))
+	case uint64:
+		w.WriteString(strconv.FormatUint(v, 10))
+	case int64:
+		w.WriteString(strconv.FormatInt(v, 10))
+	case float32:
+		writeLuaFloat(w, float64(v))
+	case float64:
+		writeLuaFloat(w, v)
+	case string:
+		writeLuaString(w, v)
+	case []byte:
+		writeLuaString(w, string(v))
+	case Ext:
+		_, constructor := formatExt(v)
+		w.WriteString(constructor)
+	case []any:
+		w.WriteByte('{')
+		for i, item := range v {
+			if i != 0 {
+				w.WriteString(", ")
+			}
+			w.WriteByte('[')
+			w.WriteString(strconv.Itoa(i + 1))
+			w.WriteString("] = ")
+			writeLuaValue(w, item)
+		}
+		w.WriteByte('}')
+	case []Field:
+		w.WriteByte('{')
+		for i, field := range v {
+			if i != 0 {
+				w.WriteString(", ")
+			}
+			w.WriteByte('[')
+			writeLuaValue(w, field.Key)
+			w.WriteString("] = ")
+			writeLuaValue(w, field.Value)
+		}
+		w.WriteByte('}')
+	}
+}
+
+// writeLuaFloat writes a Lua floating point number.
+func writeLuaFloat(w *bufio.Writer, v float64) {
+	switch {
+	case math.IsNaN(v):
+		w.WriteString("0/0")
+	case math.IsInf(v, 1):
+		w.WriteString("math.huge")
+	case math.IsInf(v, -1):
+		w.WriteString("-math.huge")
+	default:
+		w.WriteString(formatFloat(v))
+	}
+}
+
+// bodyValue returns a value of the body field with the name.
+func bodyValue(body []Field, name string) any {
+	for _, field := range body {
+		if field.Key == name {
+			return field.Value
+		}
+	}
+	return nil
+}
+
+// writeLuaRow writes the row as a Lua request to a space. Rows without a
+// space are skipped.
+func writeLuaRow(w *bufio.Writer, row Row) {
+	spaceID, ok := row.SpaceID()
+	if row.Header.Type == RowTypeNop || !ok {
+		return
+	}
+
+	op := strings.ToLower(row.Header.TypeName())
+	fmt.Fprintf(w, "box.space[%d]:%s(", spaceID, op)
+	switch op {
+	case "insert", "replace":
+		writeLuaValue(w, bodyValue(row.Body, "tuple"))
+	case "delete":
+		writeLuaValue(w, bodyValue(row.Body, "key"))
+	case "update":
+		writeLuaValue(w, bodyValue(row.Body, "key"))
+		w.WriteString(", ")
+		writeLuaValue(w, bodyValue(row.Body, "tuple"))
+	case "upsert":
+		writeLuaValue(w, bodyValue(row.Body, "tuple"))
+		w.WriteString(", ")
+		writeLuaValue(w, bodyValue(row.Body, "operations"))
+	}
+	w.WriteString(")\n")
+}
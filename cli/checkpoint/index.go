@@ -0,0 +1,372 @@
+package checkpoint
+
+import (
+	"bufio"
+	"encoding/json"
+	"errors"
+	"fmt"
+	"io"
+	"math"
+	"os"
+	"path/filepath"
+	"sort"
+	"strconv"
+	"strings"
+
+	"github.com/apex/log"
+)
+
+const (
+	// xlogSuffix is a suffix of .xlog files.
+	xlogSuffix = ".xlog"
+	// xlogFiletype is a file type of .xlog files.
+	xlogFiletype = "XLOG"
+	// xlogIndexSuffix is a suffix of a sparse LSN index of a file.
+	xlogIndexSuffix = ".lsnidx"
+	// xlogIndexStride is a minimal distance between offsets of index entries.
+	xlogIndexStride = 1 << 20
+)
+
+// hasLSNRange returns true if the options limit LSNs of rows.
+func hasLSNRange(opts Opts) bool {
+	return opts.From > 0 || opts.To < math.MaxUint64
+}
+
+// isReplicaShown returns true if rows of the replica could match the options.
+func isReplicaShown(opts Opts, id uint64) bool {
+	return opts.Replica == nil || containsId(opts.Replica, id)
+}
+
+// xlogSignature returns a vclock signature from a name of an .xlog file.
+func xlogSignature(path string) (uint64, bool) {
+	name := filepath.Base(path)
+	if !strings.HasSuffix(name, xlogSuffix) {
+		return 0, false
+	}
+	signature, err := strconv.ParseUint(strings.TrimSuffix(name, xlogSuffix), 10, 64)
+	return signature, err == nil
+}
+
+// readXlogFileMeta reads a meta information of a .snap/.xlog file.
+func readXlogFileMeta(path string) (XlogMeta, error) {
+	file, err := os.Open(path)
+	if err != nil {
+		return XlogMeta{}, err
+	}
+	defer file.Close()
+	return readXlogMeta(bufio.NewReader(file))
+}
+
+// xlogName is a name of an .xlog file with its vclock signature.
+type xlogName struct {
+	name      string
+	signature uint64
+}
+
+// xlogNames caches sorted .xlog files of directories.
+type xlogNames map[string][]xlogName
+
+// get returns sorted .xlog files of the directory.
+func (names xlogNames) get(dir string) []xlogName {
+	if list, ok := names[dir]; ok {
+		return list
+	}
+	list := []xlogName{}
+	if entries, err := os.ReadDir(dir); err == nil {
+		for _, entry := range entries {
+			if signature, ok := xlogSignature(entry.Name()); ok && !entry.IsDir() {
+				list = append(list, xlogName{name: entry.Name(), signature: signature})
+			}
+		}
+	}
+	sort.Slice(list, func(i, j int) bool {
+		return list[i].signature < list[j].signature
+	})
+	names[dir] = list
+	return list
+}
+
+// nextXlogVclock returns a vclock at the beginning of the .xlog file of the
+// same instance that follows the file. It bounds LSNs of rows in the file.
+func nextXlogVclock(path string, signature uint64, meta XlogMeta,
+	names xlogNames) (Vclock, bool) {
+	dir := filepath.Dir(path)
+	list := names.get(dir)
+	i := sort.Search(len(list), func(i int) bool {
+		return list[i].signature > signature
+	})
+	if i == len(list) {
+		return nil, false
+	}
+	next, err := readXlogFileMeta(filepath.Join(dir, list[i].name))
+	if err != nil || next.Filetype != xlogFiletype || next.InstanceUUID != meta.InstanceUUID {
+		return nil, false
+	}
+	return next.Vclock, true
+}
+
+// xlogMayMatch returns true if the file could contain rows in the LSN range
+// of the options. A range of LSNs of an .xlog file is bounded by the vclock
+// of the file and the vclock of the next .xlog file in the directory.
+func xlogMayMatch(path string, opts Opts, names xlogNames) bool {
+	signature, ok := xlogSignature(path)
+	if !ok {
+		return true
+	}
+	meta, err := readXlogFileMeta(path)
+	if err != nil || meta.Filetype != xlogFiletype {
+		return true
+	}
+
+	end, ok := nextXlogVclock(path, signature, meta, names)
+	if !ok {
+		// Rows of any replica could be written into the last file.
+		if opts.Replica == nil {
+			return true
+		}
+		for _, id := range opts.Replica {
+			if id >= 0 && meta.Vclock[uint64(id)]+1 < opts.To {
+				return true
+			}
+		}
+		return false
+	}
+
+	for id, last := range end {
+		first := meta.Vclock[id] + 1
+		if isReplicaShown(opts, id) && first <= last && first < opts.To &&
+			last >= opts.From {
+			return true
+		}
+	}
+	return false
+}
+
+// skipFiles returns true for files without rows in the LSN range of the
+// options. Files are checked by their names and headers only.
+func skipFiles(files []string, opts Opts) []bool {
+	skip := make([]bool, len(files))
+	if !hasLSNRange(opts) {
+		return skip
+	}
+	names := xlogNames{}
+	for i, file := range files {
+		skip[i] = !xlogMayMatch(file, opts, names)
+	}
+	return skip
+}
+
+// FilterFiles returns files that could contain rows in the LSN range of the
+// options.
+func FilterFiles(files []string, opts Opts) []string {
+	filtered := []string{}
+	for i, skip := range skipFiles(files, opts) {
+		if !skip {
+			filtered = append(filtered, files[i])
+		}
+	}
+	return filtered
+}
+
+// xlogIndexEntry is an entry of a sparse LSN index.
+type xlogIndexEntry struct {
+	// Offset is an offset of a block in the file.
+	Offset int64 `json:"offset"`
+	// Vclock contains max LSNs of rows before the offset.
+	Vclock Vclock `json:"vclock"`
+}
+
+// before returns true if all rows before the entry are out of the LSN range
+// of the options.
+func (entry xlogIndexEntry) before(opts Opts) bool {
+	for id, lsn := range entry.Vclock {
+		if isReplicaShown(opts, id) && lsn >= opts.From {
+			return false
+		}
+	}
+	return true
+}
+
+// xlogIndex is a sparse LSN index of a .snap/.xlog file. It is stored near
+// the file with xlogIndexSuffix.
+type xlogIndex struct {
+	// Instance is an instance UUID from the file header.
+	Instance string `json:"instance"`
+	// Vclock is a vclock from the file header.
+	Vclock Vclock `json:"vclock"`
+	// Size is a size of the file at the moment of indexing.
+	Size int64 `json:"size"`
+	// Entries are entries of the index sorted by offsets. The last entry
+	// points to the end of the last complete block.
+	Entries []xlogIndexEntry `json:"entries"`
+}
+
+// seekOffset returns an offset of a block to start reading rows in the LSN
+// range of the options.
+func (index *xlogIndex) seekOffset(opts Opts) int64 {
+	i := sort.Search(len(index.Entries), func(i int) bool {
+		return !index.Entries[i].before(opts)
+	})
+	if i > 0 {
+		i--
+	}
+	return index.Entries[i].Offset
+}
+
+// copyVclock returns a copy of the vclock.
+func copyVclock(vclock Vclock) Vclock {
+	ret := make(Vclock, len(vclock))
+	for id, lsn := range vclock {
+		ret[id] = lsn
+	}
+	return ret
+}
+
+// equalVclocks returns true if vclocks are equal.
+func equalVclocks(a, b Vclock) bool {
+	if len(a) != len(b) {
+		return false
+	}
+	for id, lsn := range a {
+		if other, ok := b[id]; !ok || other != lsn {
+			return false
+		}
+	}
+	return true
+}
+
+// loadXlogIndex loads an index of the file. It returns false if there is no
+// valid index.
+func loadXlogIndex(path string, meta XlogMeta, size int64) (xlogIndex, bool) {
+	index := xlogIndex{}
+	data, err := os.ReadFile(path + xlogIndexSuffix)
+	if err != nil {
+		return index, false
+	}
+	if err := json.Unmarshal(data, &index); err != nil {
+		return index, false
+	}
+	if index.Instance != meta.InstanceUUID || !equalVclocks(index.Vclock, meta.Vclock) ||
+		index.Size > size || len(index.Entries) == 0 {
+		return index, false
+	}
+	return index, true
+}
+
+// writeXlogIndex writes the index of the file.
+func writeXlogIndex(path string, index xlogIndex) error {
+	data, err := json.Marshal(index)
+	if err != nil {
+		return err
+	}
+	tmp, err := os.CreateTemp(filepath.Dir(path), filepath.Base(path)+xlogIndexSuffix+".*")
+	if err != nil {
+		return err
+	}
+	_, err = tmp.Write(data)
+	if closeErr := tmp.Close(); err == nil {
+		err = closeErr
+	}
+	if err == nil {
+		err = os.Rename(tmp.Name(), path+xlogIndexSuffix)
+	}
+	if err != nil {
+		os.Remove(tmp.Name())
+	}
+	return err
+}
+
+// updateXlogIndex returns an index of the file opened with the reader. The
+// index is created or extended with new blocks of the file and written near
+// the file.
+func updateXlogIndex(path string, file *os.File, reader *XlogReader) (xlogIndex, error) {
+	stat, err := file.Stat()
+	if err != nil {
+		return xlogIndex{}, err
+	}
+	index, ok := loadXlogIndex(path, reader.Meta, stat.Size())
+	if ok && index.Size == stat.Size() {
+		return index, nil
+	}
+
+	vclock := Vclock{}
+	if ok {
+		// Continue from the end of the indexed part.
+		last := index.Entries[len(index.Entries)-1]
+		vclock = copyVclock(last.Vclock)
+		if len(index.Entries) > 1 &&
+			last.Offset-index.Entries[len(index.Entries)-2].Offset < xlogIndexStride {
+			index.Entries = index.Entries[:len(index.Entries)-1]
+		}
+		if err := reader.seek(last.Offset); err != nil {
+			return index, err
+		}
+	} else {
+		index = xlogIndex{Instance: reader.Meta.InstanceUUID, Vclock: reader.Meta.Vclock}
+	}
+
+	block := int64(-1)
+	for {
+		row, err := reader.next(false)
+		if errors.Is(err, io.EOF) {
+			break
+		}
+		if err != nil {
+			return index, err
+		}
+		if reader.blockOffset != block {
+			block = reader.blockOffset
+			if len(index.Entries) == 0 ||
+				block-index.Entries[len(index.Entries)-1].Offset >= xlogIndexStride {
+				index.Entries = append(index.Entries, xlogIndexEntry{
+					Offset: block,
+					Vclock: copyVclock(vclock),
+				})
+			}
+		}
+		if row.Header.LSN > vclock[row.Header.ReplicaID] {
+			vclock[row.Header.ReplicaID] = row.Header.LSN
+		}
+	}
+	if len(index.Entries) == 0 ||
+		index.Entries[len(index.Entries)-1].Offset != reader.endOffset {
+		index.Entries = append(index.Entries, xlogIndexEntry{
+			Offset: reader.endOffset,
+			Vclock: vclock,
+		})
+	}
+	index.Size = stat.Size()
+
+	if err := writeXlogIndex(path, index); err != nil {
+		log.Warnf("Failed to write an LSN index of %q: %s", path, err)
+	}
+	return index, nil
+}
+
+// readXlogRange calls the handler for each row of a .snap/.xlog file like
+// ReadXlogFile. If opts.Index is set, reading starts from a block found with
+// a sparse LSN index of the file.
+func readXlogRange(path string, opts Opts, handler func(row Row) (bool, error)) error {
+	if !opts.Index || opts.From == 0 {
+		return ReadXlogFile(path, handler)
+	}
+
+	file, err := os.Open(path)
+	if err != nil {
+		return err
+	}
+	defer file.Close()
+
+	reader, err := NewXlogReader(file)
+	if err != nil {
+		return fmt.Errorf("failed to read %q: %w", path, err)
+	}
+	index, err := updateXlogIndex(path, file, reader)
+	if err != nil {
+		return fmt.Errorf("failed to read %q: %w", path, err)
+	}
+	if err := reader.seek(index.seekOffset(opts)); err != nil {
+		return fmt.Errorf("failed to read %q: %w", path, err)
+	}
+	return readXlogRows(path, reader, handler)
+}
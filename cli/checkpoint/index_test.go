@@ -0,0 +1,125 @@
+package checkpoint
+
+import (
+	"math"
+	"os"
+	"path/filepath"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func writeXlogHeader(t *testing.T, path string, vclock string) {
+	t.Helper()
+	data := "XLOG\n0.13\nVersion: 2.11.1\nInstance: foo\nVClock: " + vclock + "\n\n"
+	require.NoError(t, os.WriteFile(path, []byte(data), 0644))
+}
+
+func TestSkipFiles(t *testing.T) {
+	dir := t.TempDir()
+	files := []string{
+		filepath.Join(dir, "00000000000000000000.xlog"),
+		filepath.Join(dir, "00000000000000000010.xlog"),
+		filepath.Join(dir, "00000000000000000025.xlog"),
+		filepath.Join(dir, "00000000000000000040.xlog"),
+	}
+	writeXlogHeader(t, files[0], "{}")
+	writeXlogHeader(t, files[1], "{1: 10}")
+	writeXlogHeader(t, files[2], "{1: 20, 2: 5}")
+	writeXlogHeader(t, files[3], "{1: 30, 2: 10}")
+
+	cases := []struct {
+		Name     string
+		Opts     Opts
+		Expected []bool
+	}{
+		{"no_range", Opts{To: math.MaxUint64}, []bool{false, false, false, false}},
+		{"from", Opts{From: 15, To: math.MaxUint64}, []bool{true, false, false, false}},
+		{"to", Opts{To: 11}, []bool{false, false, false, false}},
+		{"to_replica", Opts{To: 11, Replica: []int{1}}, []bool{false, true, true, true}},
+		{"from_replica", Opts{From: 6, To: math.MaxUint64, Replica: []int{2}},
+			[]bool{true, true, false, false}},
+	}
+
+	for _, tc := range cases {
+		t.Run(tc.Name, func(t *testing.T) {
+			assert.Equal(t, tc.Expected, skipFiles(files, tc.Opts))
+		})
+	}
+
+	opts := Opts{From: 100, To: math.MaxUint64}
+	assert.Equal(t, []string{files[3], "testdata/test.xlog"},
+		FilterFiles(append(files, "testdata/test.xlog"), opts))
+}
+
+func TestXlogIndex_seekOffset(t *testing.T) {
+	index := xlogIndex{
+		Entries: []xlogIndexEntry{
+			{Offset: 100, Vclock: Vclock{}},
+			{Offset: 200, Vclock: Vclock{1: 10}},
+			{Offset: 300, Vclock: Vclock{1: 20, 2: 3}},
+			{Offset: 400, Vclock: Vclock{1: 30, 2: 8}},
+		},
+	}
+
+	cases := []struct {
+		Opts     Opts
+		Expected int64
+	}{
+		{Opts{From: 1}, 100},
+		{Opts{From: 15}, 200},
+		{Opts{From: 5, Replica: []int{2}}, 300},
+		{Opts{From: 100}, 400},
+	}
+
+	for _, tc := range cases {
+		assert.Equal(t, tc.Expected, index.seekOffset(tc.Opts))
+	}
+}
+
+func TestReadXlogRange_index(t *testing.T) {
+	data, err := os.ReadFile("testdata/test.xlog")
+	require.NoError(t, err)
+	path := filepath.Join(t.TempDir(), "test.xlog")
+
+	readRows := func(opts Opts) []Row {
+		var rows []Row
+		err := readXlogRange(path, opts, func(row Row) (bool, error) {
+			if match, _ := filterRow(row, opts); match {
+				rows = append(rows, row)
+			}
+			return true, nil
+		})
+		require.NoError(t, err)
+		return rows
+	}
+
+	// The file is written at the moment: the second block is truncated.
+	const partialSize = 160
+	require.NoError(t, os.WriteFile(path, data[:partialSize], 0644))
+	opts := Opts{From: 1, To: math.MaxUint64, ShowSystem: true, Index: true}
+	assert.Len(t, readRows(opts), 1)
+	meta, err := readXlogFileMeta(path)
+	require.NoError(t, err)
+	partialIndex, ok := loadXlogIndex(path, meta, int64(len(data)))
+	require.True(t, ok)
+	assert.Equal(t, int64(partialSize), partialIndex.Size)
+
+	// The index is extended with new blocks.
+	require.NoError(t, os.WriteFile(path, data, 0644))
+	opts.Index = false
+	expected := readRows(opts)
+	require.Len(t, expected, 2)
+	opts.Index = true
+	assert.Equal(t, expected, readRows(opts))
+	extended, err := os.ReadFile(path + xlogIndexSuffix)
+	require.NoError(t, err)
+
+	// The index is the same as a created one.
+	require.NoError(t, os.Remove(path+xlogIndexSuffix))
+	assert.Equal(t, expected, readRows(opts))
+	created, err := os.ReadFile(path + xlogIndexSuffix)
+	require.NoError(t, err)
+	assert.Equal(t, string(created), string(extended))
+}
@@ -0,0 +1,74 @@
+package checkpoint
+
+import (
+	"encoding/json"
+	"fmt"
+	"os"
+	"path/filepath"
+)
+
+// PlayJournal is a progress journal of tt play.
+type PlayJournal struct {
+	// File is an absolute path to the last played file. The path is not
+	// cleaned: the play script joins the working directory and the argument.
+	File string `json:"file"`
+	// Vclock contains LSNs of the last applied rows of the file.
+	Vclock Vclock `json:"vclock"`
+	// FileDone is true if all rows of the file are applied.
+	FileDone bool `json:"file_done"`
+}
+
+// ReadPlayJournal reads a progress journal of tt play.
+func ReadPlayJournal(path string) (PlayJournal, error) {
+	journal := PlayJournal{}
+	data, err := os.ReadFile(path)
+	if err != nil {
+		return journal, fmt.Errorf("failed to read the journal: %w", err)
+	}
+	if err := json.Unmarshal(data, &journal); err != nil {
+		return journal, fmt.Errorf("failed to parse the journal %q: %w", path, err)
+	}
+	return journal, nil
+}
+
+// isJournalFile returns true if the file is the file from the journal. The
+// same file could be reached by different paths, for example via symlinks.
+func (journal PlayJournal) isJournalFile(file string) (bool, error) {
+	path, err := filepath.Abs(file)
+	if err != nil {
+		return false, err
+	}
+	if path == filepath.Clean(journal.File) {
+		return true, nil
+	}
+	journalInfo, err := os.Stat(journal.File)
+	if err != nil {
+		return false, nil
+	}
+	info, err := os.Stat(path)
+	if err != nil {
+		return false, nil
+	}
+	return os.SameFile(info, journalInfo), nil
+}
+
+// ResumeFiles returns files that are not played yet according to the
+// journal. Rows of the first returned file up to the returned vclock are
+// applied already.
+func (journal PlayJournal) ResumeFiles(files []string) ([]string, Vclock, error) {
+	for i, file := range files {
+		found, err := journal.isJournalFile(file)
+		if err != nil {
+			return nil, nil, err
+		}
+		if !found {
+			continue
+		}
+		if journal.FileDone {
+			return files[i+1:], nil, nil
+		}
+		return files[i:], journal.Vclock, nil
+	}
+	return nil, nil, fmt.Errorf("the file %q from the journal is not found in the files",
+		journal.File)
+}
@@ -0,0 +1,78 @@
+package checkpoint
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestReadPlayJournal(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "journal")
+	require.NoError(t, os.WriteFile(path,
+		[]byte(`{"file":"/a/1.xlog","vclock":{"0":3,"1":10},"file_done":false}`), 0644))
+
+	journal, err := ReadPlayJournal(path)
+	require.NoError(t, err)
+	assert.Equal(t, PlayJournal{
+		File:   "/a/1.xlog",
+		Vclock: Vclock{0: 3, 1: 10},
+	}, journal)
+
+	require.NoError(t, os.WriteFile(path, []byte(`{`), 0644))
+	_, err = ReadPlayJournal(path)
+	assert.ErrorContains(t, err, "failed to parse the journal")
+
+	_, err = ReadPlayJournal(filepath.Join(t.TempDir(), "not_exists"))
+	assert.ErrorContains(t, err, "failed to read the journal")
+}
+
+func TestPlayJournal_ResumeFiles(t *testing.T) {
+	files := []string{"/a/1.xlog", "/a/2.xlog", "/a/3.xlog"}
+
+	journal := PlayJournal{File: "/a/2.xlog", Vclock: Vclock{1: 10}}
+	resumed, vclock, err := journal.ResumeFiles(files)
+	require.NoError(t, err)
+	assert.Equal(t, files[1:], resumed)
+	assert.Equal(t, Vclock{1: 10}, vclock)
+
+	journal.FileDone = true
+	resumed, vclock, err = journal.ResumeFiles(files)
+	require.NoError(t, err)
+	assert.Equal(t, files[2:], resumed)
+	assert.Nil(t, vclock)
+
+	journal.File = "/a/4.xlog"
+	_, _, err = journal.ResumeFiles(files)
+	assert.ErrorContains(t, err, "is not found in the files")
+}
+
+func TestPlayJournal_ResumeFiles_paths(t *testing.T) {
+	dir := t.TempDir()
+	require.NoError(t, os.MkdirAll(filepath.Join(dir, "wal"), 0755))
+	require.NoError(t, os.MkdirAll(filepath.Join(dir, "cwd"), 0755))
+	require.NoError(t, os.Symlink(filepath.Join(dir, "wal"), filepath.Join(dir, "link")))
+	for _, name := range []string{"1.xlog", "2.xlog"} {
+		require.NoError(t, os.WriteFile(filepath.Join(dir, "wal", name), []byte{}, 0644))
+	}
+
+	wd, err := os.Getwd()
+	require.NoError(t, err)
+	require.NoError(t, os.Chdir(filepath.Join(dir, "cwd")))
+	t.Cleanup(func() { os.Chdir(wd) })
+
+	files := []string{"../wal/1.xlog", "../wal/2.xlog"}
+	for _, journalFile := range []string{
+		filepath.Join(dir, "wal", "2.xlog"),
+		filepath.Join(dir, "cwd", "..", "wal", "2.xlog"),
+		filepath.Join(dir, "link", "2.xlog"),
+	} {
+		journal := PlayJournal{File: journalFile, Vclock: Vclock{1: 10}}
+		resumed, vclock, err := journal.ResumeFiles(files)
+		require.NoError(t, err, journalFile)
+		assert.Equal(t, files[1:], resumed, journalFile)
+		assert.Equal(t, Vclock{1: 10}, vclock, journalFile)
+	}
+}
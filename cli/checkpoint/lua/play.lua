@@ -5,11 +5,134 @@
 -- The --from flag passes through 'TT_CLI_PLAY_FROM'.
 -- The --to flag passes through 'TT_CLI_PLAY_TO'.
 -- The --replica flags passes through 'TT_CLI_PLAY_REPLICAS'.
+-- The --window flag passes through 'TT_CLI_PLAY_WINDOW'.
+-- The --connections flag passes through 'TT_CLI_PLAY_CONNECTIONS'.
+-- The --partition flag passes through 'TT_CLI_PLAY_PARTITION'.
+-- The --journal flag passes through 'TT_CLI_PLAY_JOURNAL'.
+-- A vclock of applied rows of the first file passes through
+-- 'TT_CLI_PLAY_RESUME_VCLOCK' for --resume.
+-- The --stats-file flag passes through 'TT_CLI_PLAY_STATS_FILE'.
 
 local log = require('log')
 local xlog = require('xlog')
 local json = require('json')
 local netbox = require('net.box')
+local digest = require('digest')
+local msgpack = require('msgpack')
+local fio = require('fio')
+local clock = require('clock')
+
+-- Interval in seconds between writes of the journal.
+local JOURNAL_INTERVAL = 1
+-- Interval in seconds between progress lines.
+local PROGRESS_INTERVAL = 5
+-- Upper bounds in seconds of buckets of apply latency histograms. The last
+-- bucket of a histogram counts the rest. An apply latency is a time between
+-- sending of an operation and receiving of its response, responses are
+-- checked on each send in the order of operations.
+local LATENCY_BUCKETS = {
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1,
+}
+
+local function new_histogram()
+    local counts = {}
+    for i = 1, #LATENCY_BUCKETS + 1 do
+        counts[i] = 0
+    end
+    return {buckets = LATENCY_BUCKETS, counts = counts, count = 0, sum = 0}
+end
+
+local function histogram_observe(histogram, value)
+    local i = 1
+    while i <= #LATENCY_BUCKETS and value > LATENCY_BUCKETS[i] do
+        i = i + 1
+    end
+    histogram.counts[i] = histogram.counts[i] + 1
+    histogram.count = histogram.count + 1
+    histogram.sum = histogram.sum + value
+end
+
+-- Statistics of playing: counters of rows in total, per file and per space.
+local function new_stats()
+    return {
+        start = clock.monotonic(),
+        progress_time = clock.monotonic(),
+        rows_read = 0,
+        rows_filtered = 0,
+        rows_applied = 0,
+        bytes = 0,
+        latency = new_histogram(),
+        files = {},
+        spaces = {},
+    }
+end
+
+local function stats_rate(value, duration)
+    if duration <= 0 then
+        return 0
+    end
+    return value / duration
+end
+
+-- Count the applied operation of the space with the latency.
+local function stats_applied(stats, sid, latency)
+    local key = tostring(sid)
+    local space = stats.spaces[key]
+    if space == nil then
+        space = {rows_applied = 0, latency = new_histogram()}
+        stats.spaces[key] = space
+    end
+    space.rows_applied = space.rows_applied + 1
+    histogram_observe(space.latency, latency)
+    histogram_observe(stats.latency, latency)
+    stats.rows_applied = stats.rows_applied + 1
+    local file = stats.files[#stats.files]
+    file.rows_applied = file.rows_applied + 1
+end
+
+local function print_progress(stats)
+    local duration = clock.monotonic() - stats.start
+    print(string.format('• Play progress: %d rows read, %d applied, %d filtered, ' ..
+                        '%.0f rows/s •', stats.rows_read, stats.rows_applied,
+                        stats.rows_filtered, stats_rate(stats.rows_read, duration)))
+    io.stdout:flush()
+end
+
+local function print_summary(stats)
+    local duration = clock.monotonic() - stats.start
+    local latency = stats_rate(stats.latency.sum, stats.latency.count) * 1000
+    print(string.format('• Play summary: %d files, %d rows read, %d applied, ' ..
+                        '%d filtered in %.3f s (%.0f rows/s, %.1f MB/s), ' ..
+                        'average apply latency %.3f ms •',
+                        #stats.files, stats.rows_read, stats.rows_applied,
+                        stats.rows_filtered, duration,
+                        stats_rate(stats.rows_read, duration),
+                        stats_rate(stats.bytes, duration) / 1024 / 1024, latency))
+    io.stdout:flush()
+end
+
+-- Write the statistics into the file in JSON format.
+local function write_stats(path, stats)
+    local data = json.encode({
+        duration = clock.monotonic() - stats.start,
+        rows_read = stats.rows_read,
+        rows_filtered = stats.rows_filtered,
+        rows_applied = stats.rows_applied,
+        bytes = stats.bytes,
+        latency = stats.latency,
+        files = stats.files,
+        spaces = setmetatable(stats.spaces, {__serialize = 'map'}),
+    })
+    local fh, err = fio.open(path, {'O_WRONLY', 'O_CREAT', 'O_TRUNC'},
+                             tonumber('644', 8))
+    if fh == nil then
+        log.error('Fatal error: failed to write the statistics "%s": %s', path, err)
+        os.exit(1)
+    end
+    fh:write(data)
+    fh:close()
+end
 
 local function find_in_list(id, list)
     if type(list) == 'number' then
@@ -23,13 +146,17 @@ local function find_in_list(id, list)
     return false
 end
 
-local function filter_xlog(gen, param, state, opts, cb)
+local function filter_xlog(gen, param, state, opts, cb, stats)
     local from, to, spaces = opts.from, opts.to, opts.space
     local show_system, replicas = opts['show-system'], opts.replica
+    local resume = opts.resume
+    local file = stats.files[#stats.files]
 
     for lsn, record in gen, param, state do
         local sid = record.BODY and record.BODY.space_id
         local rid = record.HEADER.replica_id
+        stats.rows_read = stats.rows_read + 1
+        file.rows_read = file.rows_read + 1
         if replicas and #replicas == 1 and replicas[1] == rid and lsn >= to then
             -- Stop, as we've finished reading tuple with lsn == to
             -- and the next lsn's will be bigger.
@@ -37,11 +164,186 @@ local function filter_xlog(gen, param, state, opts, cb)
         elseif (lsn < from) or (lsn >= to) or
            (not spaces and sid and sid < 512 and not show_system) or
            (spaces and (sid == nil or not find_in_list(sid, spaces))) or
-           (replicas and not find_in_list(rid, replicas)) then
-            -- Pass this tuple, luacheck: ignore.
+           (replicas and not find_in_list(rid, replicas)) or
+           (resume and resume[rid or 0] and lsn <= resume[rid or 0]) then
+            stats.rows_filtered = stats.rows_filtered + 1
+            file.rows_filtered = file.rows_filtered + 1
         else
             cb(record)
         end
+        if clock.monotonic() - stats.progress_time >= PROGRESS_INTERVAL then
+            print_progress(stats)
+            stats.progress_time = clock.monotonic()
+        end
+    end
+end
+
+-- A pipeline sends operations to a remote instance asynchronously, up to
+-- the window size of operations are in flight.
+local function new_pipeline(window, stats)
+    return {
+        window = window,
+        stats = stats,
+        -- Queue of sent operations: {future, sid, lsn, time}.
+        queue = {},
+        first = 1,
+        last = 0,
+        -- Count of operations in flight per space.
+        in_flight = {},
+    }
+end
+
+-- Wait for the oldest operation in flight.
+local function pipeline_wait(pipeline)
+    local request = pipeline.queue[pipeline.first]
+    pipeline.queue[pipeline.first] = nil
+    pipeline.first = pipeline.first + 1
+    pipeline.in_flight[request.sid] = pipeline.in_flight[request.sid] - 1
+
+    local ok, res, err = pcall(request.future.wait_result, request.future)
+    if not ok then
+        err = res
+    end
+    if err ~= nil then
+        log.error('Fatal error: failed to apply the operation with lsn %s: %s',
+                  request.lsn, err)
+        os.exit(1)
+    end
+    stats_applied(pipeline.stats, request.sid, clock.monotonic() - request.time)
+end
+
+-- Complete operations with received responses from the head of the queue.
+-- Otherwise the pipeline waits for an operation only when it is full, and
+-- a latency would include a time of the operation in the queue.
+local function pipeline_drain(pipeline)
+    while pipeline.first <= pipeline.last and
+          pipeline.queue[pipeline.first].future:is_ready() do
+        pipeline_wait(pipeline)
+    end
+end
+
+-- Wait for all operations in flight.
+local function pipeline_flush(pipeline)
+    while pipeline.first <= pipeline.last do
+        pipeline_wait(pipeline)
+    end
+end
+
+-- Send the operation of the record to the space.
+local function pipeline_send(pipeline, so, record)
+    local sid = so.id
+    pipeline_drain(pipeline)
+    -- A memtx space applies operations of a connection in the order of
+    -- receiving, for other engines operations of a space are sent one by
+    -- one to keep the order.
+    if so.engine ~= 'memtx' then
+        while (pipeline.in_flight[sid] or 0) > 0 do
+            pipeline_wait(pipeline)
+        end
+    end
+    while pipeline.last - pipeline.first + 1 >= pipeline.window do
+        pipeline_wait(pipeline)
+    end
+
+    local args = {}
+    table.insert(args, so)
+    table.insert(args, record.BODY.key)
+    table.insert(args, record.BODY.tuple)
+    table.insert(args, record.BODY.operations)
+    table.insert(args, {is_async = true})
+    local future = so[record.HEADER.type:lower()](unpack(args))
+
+    pipeline.last = pipeline.last + 1
+    pipeline.queue[pipeline.last] = {
+        future = future,
+        sid = sid,
+        lsn = record.HEADER.lsn,
+        time = clock.monotonic(),
+    }
+    pipeline.in_flight[sid] = (pipeline.in_flight[sid] or 0) + 1
+end
+
+-- Returns a primary key of the record.
+local function record_key(so, record)
+    if record.BODY.key ~= nil then
+        return record.BODY.key
+    end
+    local tuple, pk = record.BODY.tuple, so.index[0]
+    if tuple == nil or pk == nil then
+        return nil
+    end
+    local key = {}
+    for _, part in ipairs(pk.parts) do
+        table.insert(key, tuple[part.fieldno])
+    end
+    return key
+end
+
+-- Returns an index of a connection for the record. Records of a space or
+-- records with a primary key are always sent to the same connection.
+local function route_record(so, record, opts)
+    if opts.connections == 1 then
+        return 1
+    end
+    if opts.partition == 'key' then
+        local key = record_key(so, record)
+        if key ~= nil then
+            return digest.crc32(msgpack.encode(key)) % opts.connections + 1
+        end
+    end
+    return so.id % opts.connections + 1
+end
+
+-- Remove the temporary journal file and exit on a journal write error.
+local function journal_error(path, tmp_path, err)
+    fio.unlink(tmp_path)
+    log.error('Fatal error: failed to write the journal "%s": %s', path, tostring(err))
+    os.exit(1)
+end
+
+-- Write the progress journal: the file and a vclock of applied rows of
+-- the file. The journal is replaced atomically and durably: the temporary
+-- file is synced before the rename and the directory is synced after it.
+local function write_journal(path, file, vclock, file_done)
+    local vclock_map = {}
+    for id, lsn in pairs(vclock) do
+        vclock_map[tostring(id)] = lsn
+    end
+    local data = json.encode({
+        file = fio.abspath(file),
+        vclock = setmetatable(vclock_map, {__serialize = 'map'}),
+        file_done = file_done,
+    })
+
+    local tmp_path = path .. '.tmp'
+    local fh, err = fio.open(tmp_path, {'O_WRONLY', 'O_CREAT', 'O_TRUNC'},
+                             tonumber('644', 8))
+    if fh == nil then
+        journal_error(path, tmp_path, err)
+    end
+    local ok
+    ok, err = fh:write(data)
+    if ok then
+        ok, err = fh:fsync()
+    end
+    fh:close()
+    if not ok then
+        journal_error(path, tmp_path, err)
+    end
+    ok, err = fio.rename(tmp_path, path)
+    if not ok then
+        journal_error(path, tmp_path, err)
+    end
+
+    local dir
+    dir, err = fio.open(fio.dirname(path), {'O_RDONLY'})
+    if dir == nil then
+        journal_error(path, tmp_path, err)
+    end
+    ok, err = dir:fsync()
+    dir:close()
+    if not ok then
+        journal_error(path, tmp_path, err)
     end
 end
 
@@ -52,35 +354,79 @@ local function play(positional_arguments, keyword_arguments, opts)
         log.error('Internal error: empty URI is provided')
         os.exit(1)
     end
-    local remote = netbox.new(uri, opts)
-    if not remote:wait_connected() then
-        log.error('Fatal error: no connection to the host "%s"', uri)
-        os.exit(1)
+    local stats = new_stats()
+    local remotes = {}
+    for i = 1, filter_opts.connections do
+        local remote = netbox.new(uri, opts)
+        if not remote:wait_connected() then
+            log.error('Fatal error: no connection to the host "%s"', uri)
+            os.exit(1)
+        end
+        remotes[i] = {conn = remote, pipeline = new_pipeline(filter_opts.window, stats)}
+    end
+    local function flush()
+        for _, remote in ipairs(remotes) do
+            pipeline_flush(remote.pipeline)
+        end
     end
+
+    local journal = filter_opts.journal
     for _, file in ipairs(positional_arguments) do
         print(string.format('• Play is processing file "%s" •', file))
         io.stdout:flush()
+        local file_stat = fio.stat(file)
+        local file_stats = {
+            file = file,
+            size = file_stat and file_stat.size or 0,
+            rows_read = 0,
+            rows_filtered = 0,
+            rows_applied = 0,
+            duration = 0,
+        }
+        table.insert(stats.files, file_stats)
+        local file_start = clock.monotonic()
+        -- Rows of the resumed file are applied up to the vclock.
+        local vclock = table.copy(filter_opts.resume or {})
+        local journal_time = clock.monotonic()
         local gen, param, state = xlog.pairs(file)
         filter_xlog(gen, param, state, filter_opts, function(record)
             local sid = record.BODY and record.BODY.space_id
             if sid ~= nil then
-                local args, so = {}, remote.space[sid]
+                local so = remotes[1].conn.space[sid]
                 if so == nil then
                    log.error('Fatal error: no space #%s, stopping work', sid)
                    os.exit(1)
                 end
-                table.insert(args, so)
-                table.insert(args, record.BODY.key)
-                table.insert(args, record.BODY.tuple)
-                table.insert(args, record.BODY.operations)
-                so[record.HEADER.type:lower()](unpack(args))
+                local remote = remotes[route_record(so, record, filter_opts)]
+                pipeline_send(remote.pipeline, remote.conn.space[sid], record)
+            end
+            vclock[record.HEADER.replica_id or 0] = record.HEADER.lsn
+            if journal and clock.monotonic() - journal_time >= JOURNAL_INTERVAL then
+                -- The journal contains applied rows only.
+                flush()
+                write_journal(journal, file, vclock, false)
+                journal_time = clock.monotonic()
             end
-        end)
+        end, stats)
+        filter_opts.resume = nil
+        -- All operations of the file are applied before the next file.
+        flush()
+        if journal then
+            write_journal(journal, file, vclock, true)
+        end
+        file_stats.duration = clock.monotonic() - file_start
+        stats.bytes = stats.bytes + file_stats.size
         print(string.format('• Done with file "%s" •', file))
         io.stdout:flush()
     end
+    print_summary(stats)
+    if filter_opts.stats_file then
+        write_stats(filter_opts.stats_file, stats)
+    end
     print('\n• Play result: completed successfully •')
-    remote:close()
+    for _, remote in ipairs(remotes) do
+        remote.conn:close()
+    end
 end
 
 local function str_to_bool(value)
@@ -137,6 +483,29 @@ local function main()
         end
     end
 
+    local window = tonumber(os.getenv('TT_CLI_PLAY_WINDOW'))
+    if window == nil or window < 1 then
+        window = 1
+    end
+    keyword_arguments['window'] = window
+
+    local connections = tonumber(os.getenv('TT_CLI_PLAY_CONNECTIONS'))
+    if connections == nil or connections < 1 then
+        connections = 1
+    end
+    keyword_arguments['connections'] = connections
+    keyword_arguments['partition'] = os.getenv('TT_CLI_PLAY_PARTITION') or 'space'
+    keyword_arguments['journal'] = os.getenv('TT_CLI_PLAY_JOURNAL')
+    keyword_arguments['stats_file'] = os.getenv('TT_CLI_PLAY_STATS_FILE')
+
+    local resume = os.getenv('TT_CLI_PLAY_RESUME_VCLOCK')
+    if resume ~= nil then
+        keyword_arguments['resume'] = {}
+        for id, lsn in pairs(json.decode(resume)) do
+            keyword_arguments['resume'][tonumber(id)] = lsn
+        end
+    end
+
     local opts = {
         user = os.getenv('TT_CLI_PLAY_USERNAME'),
         password = os.getenv('TT_CLI_PLAY_PASSWORD'),
@@ -0,0 +1,289 @@
+package checkpoint
+
+import (
+	"encoding/binary"
+	"errors"
+	"fmt"
+	"math"
+)
+
+// errShortBuffer is returned if a MessagePack value is truncated.
+var errShortBuffer = errors.New("unexpected end of a MessagePack value")
+
+// Field is a key-value pair of a MessagePack map. Maps are decoded into
+// []Field to keep the order of keys from a file.
+type Field struct {
+	// Key is a key of the pair.
+	Key any
+	// Value is a value of the pair.
+	Value any
+}
+
+// Ext is a MessagePack extension value.
+type Ext struct {
+	// Type is an extension type.
+	Type int8
+	// Data is an extension data.
+	Data []byte
+}
+
+// mpDecoder decodes MessagePack values from a buffer. Decoded strings and
+// binaries are copied, so the buffer could be reused after decoding.
+type mpDecoder struct {
+	buf []byte
+	pos int
+}
+
+// len returns a count of bytes left in the buffer.
+func (d *mpDecoder) len() int {
+	return len(d.buf) - d.pos
+}
+
+// next returns the next n bytes from the buffer.
+func (d *mpDecoder) next(n int) ([]byte, error) {
+	if n < 0 || d.len() < n {
+		return nil, errShortBuffer
+	}
+	ret := d.buf[d.pos : d.pos+n]
+	d.pos += n
+	return ret, nil
+}
+
+// readByte returns the next byte from the buffer.
+func (d *mpDecoder) readByte() (byte, error) {
+	if d.len() < 1 {
+		return 0, errShortBuffer
+	}
+	d.pos++
+	return d.buf[d.pos-1], nil
+}
+
+// readLen reads a big-endian length of the size.
+func (d *mpDecoder) readLen(size int) (int, error) {
+	b, err := d.next(size)
+	if err != nil {
+		return 0, err
+	}
+	switch size {
+	case 1:
+		return int(b[0]), nil
+	case 2:
+		return int(binary.BigEndian.Uint16(b)), nil
+	default:
+		return int(binary.BigEndian.Uint32(b)), nil
+	}
+}
+
+// decodeMapLen decodes a map header.
+func (d *mpDecoder) decodeMapLen() (int, error) {
+	code, err := d.readByte()
+	if err != nil {
+		return 0, err
+	}
+	switch {
+	case code >= 0x80 && code <= 0x8f:
+		return int(code & 0x0f), nil
+	case code == 0xde:
+		return d.readLen(2)
+	case code == 0xdf:
+		return d.readLen(4)
+	}
+	return 0, fmt.Errorf("unexpected MessagePack code 0x%02x, a map is expected", code)
+}
+
+// decodeUint decodes an unsigned integer. A non-negative signed integer is
+// accepted too.
+func (d *mpDecoder) decodeUint() (uint64, error) {
+	value, err := d.decode()
+	if err != nil {
+		return 0, err
+	}
+	switch v := value.(type) {
+	case uint64:
+		return v, nil
+	case int64:
+		if v >= 0 {
+			return uint64(v), nil
+		}
+	}
+	return 0, fmt.Errorf("unexpected MessagePack value %v, an unsigned integer is expected",
+		value)
+}
+
+// decodeFloat decodes a floating point number. An integer is accepted too.
+func (d *mpDecoder) decodeFloat() (float64, error) {
+	value, err := d.decode()
+	if err != nil {
+		return 0, err
+	}
+	switch v := value.(type) {
+	case float64:
+		return v, nil
+	case float32:
+		return float64(v), nil
+	case uint64:
+		return float64(v), nil
+	case int64:
+		return float64(v), nil
+	}
+	return 0, fmt.Errorf("unexpected MessagePack value %v, a number is expected", value)
+}
+
+// decodeArray decodes an array of the size.
+func (d *mpDecoder) decodeArray(size int) ([]any, error) {
+	if size > d.len() {
+		return nil, errShortBuffer
+	}
+	ret := make([]any, size)
+	for i := range ret {
+		var err error
+		if ret[i], err = d.decode(); err != nil {
+			return nil, err
+		}
+	}
+	return ret, nil
+}
+
+// decodeMap decodes a map of the size.
+func (d *mpDecoder) decodeMap(size int) ([]Field, error) {
+	if 2*size > d.len() {
+		return nil, errShortBuffer
+	}
+	ret := make([]Field, size)
+	for i := range ret {
+		var err error
+		if ret[i].Key, err = d.decode(); err != nil {
+			return nil, err
+		}
+		if ret[i].Value, err = d.decode(); err != nil {
+			return nil, err
+		}
+	}
+	return ret, nil
+}
+
+// decodeString decodes a string of the size.
+func (d *mpDecoder) decodeString(size int) (string, error) {
+	b, err := d.next(size)
+	return string(b), err
+}
+
+// decodeBinary decodes a binary of the size.
+func (d *mpDecoder) decodeBinary(size int) ([]byte, error) {
+	b, err := d.next(size)
+	if err != nil {
+		return nil, err
+	}
+	return append([]byte{}, b...), nil
+}
+
+// decodeExt decodes an extension value with data of the size.
+func (d *mpDecoder) decodeExt(size int) (Ext, error) {
+	typ, err := d.readByte()
+	if err != nil {
+		return Ext{}, err
+	}
+	data, err := d.decodeBinary(size)
+	return Ext{Type: int8(typ), Data: data}, err
+}
+
+// decode decodes a MessagePack value into: nil, bool, int64, uint64,
+// float32, float64, string, []byte, []any, []Field or Ext.
+func (d *mpDecoder) decode() (any, error) {
+	code, err := d.readByte()
+	if err != nil {
+		return nil, err
+	}
+
+	switch {
+	case code <= 0x7f:
+		return uint64(code), nil
+	case code >= 0xe0:
+		return int64(int8(code)), nil
+	case code >= 0x80 && code <= 0x8f:
+		return d.decodeMap(int(code & 0x0f))
+	case code >= 0x90 && code <= 0x9f:
+		return d.decodeArray(int(code & 0x0f))
+	case code >= 0xa0 && code <= 0xbf:
+		return d.decodeString(int(code & 0x1f))
+	}
+
+	switch code {
+	case 0xc0:
+		return nil, nil
+	case 0xc2:
+		return false, nil
+	case 0xc3:
+		return true, nil
+	case 0xc4, 0xc5, 0xc6:
+		size, err := d.readLen(1 << (code - 0xc4))
+		if err != nil {
+			return nil, err
+		}
+		return d.decodeBinary(size)
+	case 0xc7, 0xc8, 0xc9:
+		size, err := d.readLen(1 << (code - 0xc7))
+		if err != nil {
+			return nil, err
+		}
+		return d.decodeExt(size)
+	case 0xca:
+		b, err := d.next(4)
+		if err != nil {
+			return nil, err
+		}
+		return math.Float32frombits(binary.BigEndian.Uint32(b)), nil
+	case 0xcb:
+		b, err := d.next(8)
+		if err != nil {
+			return nil, err
+		}
+		return math.Float64frombits(binary.BigEndian.Uint64(b)), nil
+	case 0xcc, 0xcd, 0xce, 0xcf:
+		b, err := d.next(1 << (code - 0xcc))
+		if err != nil {
+			return nil, err
+		}
+		var v uint64
+		for _, c := range b {
+			v = v<<8 | uint64(c)
+		}
+		return v, nil
+	case 0xd0, 0xd1, 0xd2, 0xd3:
+		b, err := d.next(1 << (code - 0xd0))
+		if err != nil {
+			return nil, err
+		}
+		switch len(b) {
+		case 1:
+			return int64(int8(b[0])), nil
+		case 2:
+			return int64(int16(binary.BigEndian.Uint16(b))), nil
+		case 4:
+			return int64(int32(binary.BigEndian.Uint32(b))), nil
+		default:
+			return int64(binary.BigEndian.Uint64(b)), nil
+		}
+	case 0xd4, 0xd5, 0xd6, 0xd7, 0xd8:
+		return d.decodeExt(1 << (code - 0xd4))
+	case 0xd9, 0xda, 0xdb:
+		size, err := d.readLen(1 << (code - 0xd9))
+		if err != nil {
+			return nil, err
+		}
+		return d.decodeString(size)
+	case 0xdc, 0xdd:
+		size, err := d.readLen(2 << (code - 0xdc))
+		if err != nil {
+			return nil, err
+		}
+		return d.decodeArray(size)
+	case 0xde, 0xdf:
+		size, err := d.readLen(2 << (code - 0xde))
+		if err != nil {
+			return nil, err
+		}
+		return d.decodeMap(size)
+	}
+	return nil, fmt.Errorf("unexpected MessagePack code 0x%02x", code)
+}
@@ -0,0 +1,168 @@
+package checkpoint
+
+import (
+	"encoding/json"
+	"fmt"
+	"io"
+	"os"
+	"sync"
+	"sync/atomic"
+	"time"
+)
+
+const (
+	// catProgressInterval is an interval between progress lines of tt cat.
+	catProgressInterval = 5 * time.Second
+	// catProgressRows is a count of rows read by a file worker between
+	// updates of the progress.
+	catProgressRows = 4096
+)
+
+// catFileStats contains counters of a file processed by tt cat.
+type catFileStats struct {
+	// File is a path to the file.
+	File string `json:"file"`
+	// Size is a size of the file.
+	Size int64 `json:"size"`
+	// Skipped is true if the file is skipped without reading rows.
+	Skipped bool `json:"skipped"`
+	// RowsRead is a count of read rows.
+	RowsRead uint64 `json:"rows_read"`
+	// RowsMatched is a count of rows matched the options.
+	RowsMatched uint64 `json:"rows_matched"`
+	// Duration is a time of processing the file in seconds.
+	Duration float64 `json:"duration"`
+	// Spaces contains counts of matched rows per space id.
+	Spaces map[uint64]uint64 `json:"spaces"`
+}
+
+// catStats contains counters of tt cat.
+type catStats struct {
+	// Duration is a time of processing all files in seconds.
+	Duration float64 `json:"duration"`
+	// RowsRead is a count of read rows.
+	RowsRead uint64 `json:"rows_read"`
+	// RowsMatched is a count of rows matched the options.
+	RowsMatched uint64 `json:"rows_matched"`
+	// Bytes is a total size of read files.
+	Bytes int64 `json:"bytes"`
+	// Files contains counters per file.
+	Files []catFileStats `json:"files"`
+	// Spaces contains counts of matched rows per space id.
+	Spaces map[uint64]uint64 `json:"spaces"`
+}
+
+// rate returns a count per second.
+func rate(count float64, duration float64) float64 {
+	if duration <= 0 {
+		return 0
+	}
+	return count / duration
+}
+
+// print prints a summary of the statistics.
+func (stats catStats) print(writer io.Writer) {
+	fmt.Fprintf(writer, "• Cat summary: %d files, %d rows read, %d rows matched in %.3f s"+
+		" (%.0f rows/s, %.1f MB/s) •\n",
+		len(stats.Files), stats.RowsRead, stats.RowsMatched, stats.Duration,
+		rate(float64(stats.RowsRead), stats.Duration),
+		rate(float64(stats.Bytes), stats.Duration)/1024/1024)
+}
+
+// write writes the statistics into the file in JSON format.
+func (stats catStats) write(path string) error {
+	data, err := json.MarshalIndent(stats, "", "  ")
+	if err != nil {
+		return err
+	}
+	if err := os.WriteFile(path, data, 0644); err != nil {
+		return fmt.Errorf("failed to write the statistics: %w", err)
+	}
+	return nil
+}
+
+// catProgress collects counters of file workers of tt cat.
+type catProgress struct {
+	start       time.Time
+	rowsRead    atomic.Uint64
+	rowsMatched atomic.Uint64
+
+	mutex sync.Mutex
+	files []catFileStats
+}
+
+// newCatProgress creates a progress of processing the count of files.
+func newCatProgress(count int) *catProgress {
+	return &catProgress{
+		start: time.Now(),
+		files: make([]catFileStats, count),
+	}
+}
+
+// add adds counts of rows processed by a file worker.
+func (progress *catProgress) add(read, matched uint64) {
+	progress.rowsRead.Add(read)
+	progress.rowsMatched.Add(matched)
+}
+
+// finish saves counters of the processed file with the index.
+func (progress *catProgress) finish(index int, stats catFileStats) {
+	progress.mutex.Lock()
+	defer progress.mutex.Unlock()
+	progress.files[index] = stats
+}
+
+// print prints the current progress.
+func (progress *catProgress) print(writer io.Writer) {
+	read := progress.rowsRead.Load()
+	fmt.Fprintf(writer, "• Cat progress: %d rows read, %d rows matched, %.0f rows/s •\n",
+		read, progress.rowsMatched.Load(),
+		rate(float64(read), time.Since(progress.start).Seconds()))
+}
+
+// report prints the progress into the writer with the interval until the
+// returned function is called.
+func (progress *catProgress) report(writer io.Writer, interval time.Duration) func() {
+	done := make(chan struct{})
+	var wg sync.WaitGroup
+	wg.Add(1)
+	go func() {
+		defer wg.Done()
+		ticker := time.NewTicker(interval)
+		defer ticker.Stop()
+		for {
+			select {
+			case <-ticker.C:
+				progress.print(writer)
+			case <-done:
+				return
+			}
+		}
+	}()
+	return func() {
+		close(done)
+		wg.Wait()
+	}
+}
+
+// stats returns statistics of processed files.
+func (progress *catProgress) stats() catStats {
+	progress.mutex.Lock()
+	defer progress.mutex.Unlock()
+	stats := catStats{
+		Duration: time.Since(progress.start).Seconds(),
+		Files:    append([]catFileStats{}, progress.files...),
+		Spaces:   map[uint64]uint64{},
+	}
+	for _, file := range progress.files {
+		stats.RowsRead += file.RowsRead
+		stats.RowsMatched += file.RowsMatched
+		if !file.Skipped {
+			stats.Bytes += file.Size
+		}
+		for id, count := range file.Spaces {
+			stats.Spaces[id] += count
+		}
+	}
+	return stats
+}
@@ -0,0 +1,571 @@
+package checkpoint
+
+import (
+	"bufio"
+	"encoding/binary"
+	"errors"
+	"fmt"
+	"hash/crc32"
+	"io"
+	"os"
+	"strconv"
+	"strings"
+	"sync"
+
+	"github.com/klauspost/compress/zstd"
+)
+
+const (
+	// xlogFixheaderSize is a size of a header of a block of rows.
+	xlogFixheaderSize = 19
+	// xlogReadBufferSize is a size of a read buffer for a file.
+	xlogReadBufferSize = 1 << 20
+)
+
+// Markers of blocks in a file, stored in the host byte order of the writer
+// (little-endian).
+const (
+	xlogRowMarker  uint32 = 0xab0bbad5
+	xlogZRowMarker uint32 = 0xba0bbad5
+	xlogEOFMarker  uint32 = 0xedad10d5
+)
+
+// Request types of rows.
+const (
+	RowTypeNop = 12
+)
+
+// rowTypeNames maps request types to names.
+var rowTypeNames = map[uint64]string{
+	0:  "OK",
+	1:  "SELECT",
+	2:  "INSERT",
+	3:  "REPLACE",
+	4:  "UPDATE",
+	5:  "DELETE",
+	6:  "CALL_16",
+	7:  "AUTH",
+	8:  "EVAL",
+	9:  "UPSERT",
+	10: "CALL",
+	11: "EXECUTE",
+	12: "NOP",
+	13: "PREPARE",
+	14: "BEGIN",
+	15: "COMMIT",
+	16: "ROLLBACK",
+	30: "RAFT",
+	31: "RAFT_PROMOTE",
+	32: "RAFT_DEMOTE",
+	40: "RAFT_CONFIRM",
+	41: "RAFT_ROLLBACK",
+}
+
+// Keys of a row header.
+const (
+	rowKeyType          = 0x00
+	rowKeySync          = 0x01
+	rowKeyReplicaID     = 0x02
+	rowKeyLSN           = 0x03
+	rowKeyTimestamp     = 0x04
+	rowKeySchemaVersion = 0x05
+	rowKeyGroupID       = 0x07
+	rowKeyTSN           = 0x08
+	rowKeyFlags         = 0x09
+	rowKeyStreamID      = 0x0a
+)
+
+// rowFlagCommit is set for the last row of a transaction.
+const rowFlagCommit = 0x01
+
+// Keys of a row body.
+const (
+	RowKeySpaceID = 0x10
+)
+
+// rowBodyKeyNames maps keys of a row body to names.
+var rowBodyKeyNames = map[uint64]string{
+	0x10: "space_id",
+	0x11: "index_id",
+	0x12: "limit",
+	0x13: "offset",
+	0x14: "iterator",
+	0x15: "index_base",
+	0x20: "key",
+	0x21: "tuple",
+	0x22: "function_name",
+	0x23: "user_name",
+	0x24: "instance_uuid",
+	0x25: "cluster_uuid",
+	0x26: "vclock",
+	0x27: "expression",
+	0x28: "operations",
+	0x29: "ballot",
+	0x2a: "tuple_meta",
+	0x2b: "options",
+}
+
+// RowHeader is a header of a row.
+type RowHeader struct {
+	// Type is a request type.
+	Type uint64
+	// ReplicaID is an id of a replica that produced the row, 0 if unknown.
+	ReplicaID uint64
+	// GroupID is a replication group id.
+	GroupID uint64
+	// LSN is a log sequence number of the row.
+	LSN uint64
+	// TSN is a transaction sequence number. It is equal to LSN for a
+	// single-statement transaction.
+	TSN uint64
+	// Timestamp is a time of the row in seconds since the epoch.
+	Timestamp float64
+	// IsCommit is true for the last row of a transaction.
+	IsCommit bool
+}
+
+// TypeName returns a name of the request type of the row.
+func (header RowHeader) TypeName() string {
+	if name, ok := rowTypeNames[header.Type]; ok {
+		return name
+	}
+	return strconv.FormatUint(header.Type, 10)
+}
+
+// Row is a row of a .snap/.xlog file.
+type Row struct {
+	// Header is a header of the row.
+	Header RowHeader
+	// Body is a body of the row. Known keys are replaced with names. It is nil
+	// if the row has no body.
+	Body []Field
+}
+
+// SpaceID returns a space id of the row and true or false if the row has no
+// space id.
+func (row Row) SpaceID() (uint64, bool) {
+	for _, field := range row.Body {
+		if field.Key == rowBodyKeyNames[RowKeySpaceID] {
+			id, ok := field.Value.(uint64)
+			return id, ok
+		}
+	}
+	return 0, false
+}
+
+// Vclock is a vector clock: a replica id to LSN.
+type Vclock map[uint64]uint64
+
+// XlogMeta is a meta information of a .snap/.xlog file.
+type XlogMeta struct {
+	// Filetype is a type of the file: SNAP, XLOG, etc.
+	Filetype string
+	// Version is a version of a Tarantool that created the file.
+	Version string
+	// InstanceUUID is an UUID of an instance that created the file.
+	InstanceUUID string
+	// Vclock is a vector clock at the beginning of the file.
+	Vclock Vclock
+	// PrevVclock is a vector clock at the beginning of a previous file, if
+	// known.
+	PrevVclock Vclock
+}
+
+// parseVclock parses a vector clock in format "{1: 10, 2: 5}".
+func parseVclock(str string) (Vclock, error) {
+	vclock := Vclock{}
+	str = strings.TrimSpace(str)
+	if !strings.HasPrefix(str, "{") || !strings.HasSuffix(str, "}") {
+		return nil, fmt.Errorf("invalid vclock %q", str)
+	}
+	str = strings.TrimSpace(str[1 : len(str)-1])
+	if str == "" {
+		return vclock, nil
+	}
+	for _, component := range strings.Split(str, ",") {
+		id, lsn, found := strings.Cut(component, ":")
+		if !found {
+			return nil, fmt.Errorf("invalid vclock component %q", component)
+		}
+		idValue, err := strconv.ParseUint(strings.TrimSpace(id), 10, 32)
+		if err != nil {
+			return nil, fmt.Errorf("invalid vclock component %q: %w", component, err)
+		}
+		lsnValue, err := strconv.ParseUint(strings.TrimSpace(lsn), 10, 64)
+		if err != nil {
+			return nil, fmt.Errorf("invalid vclock component %q: %w", component, err)
+		}
+		vclock[idValue] = lsnValue
+	}
+	return vclock, nil
+}
+
+// readXlogMeta reads a meta information from the beginning of a file.
+func readXlogMeta(reader *bufio.Reader) (XlogMeta, error) {
+	meta := XlogMeta{}
+	readLine := func() (string, error) {
+		line, err := reader.ReadString('\n')
+		if err != nil {
+			if err == io.EOF {
+				err = io.ErrUnexpectedEOF
+			}
+			return "", fmt.Errorf("failed to read a file header: %w", err)
+		}
+		return strings.TrimSuffix(line, "\n"), nil
+	}
+
+	var err error
+	if meta.Filetype, err = readLine(); err != nil {
+		return meta, err
+	}
+	version, err := readLine()
+	if err != nil {
+		return meta, err
+	}
+	if version != "0.12" && version != "0.13" {
+		return meta, fmt.Errorf("unsupported file format version %q", version)
+	}
+
+	for {
+		line, err := readLine()
+		if err != nil {
+			return meta, err
+		}
+		if line == "" {
+			break
+		}
+		key, value, found := strings.Cut(line, ":")
+		if !found {
+			return meta, fmt.Errorf("invalid file header line %q", line)
+		}
+		value = strings.TrimSpace(value)
+		switch key {
+		case "Version":
+			meta.Version = value
+		case "Instance", "Server":
+			meta.InstanceUUID = value
+		case "VClock":
+			if meta.Vclock, err = parseVclock(value); err != nil {
+				return meta, err
+			}
+		case "PrevVClock":
+			if meta.PrevVclock, err = parseVclock(value); err != nil {
+				return meta, err
+			}
+		}
+	}
+	return meta, nil
+}
+
+var (
+	// zstdDecoder is a shared decoder for compressed blocks. It is safe for
+	// concurrent use with DecodeAll.
+	zstdDecoder     *zstd.Decoder
+	zstdDecoderErr  error
+	zstdDecoderOnce sync.Once
+)
+
+// getZstdDecoder returns the shared decoder for compressed blocks.
+func getZstdDecoder() (*zstd.Decoder, error) {
+	zstdDecoderOnce.Do(func() {
+		zstdDecoder, zstdDecoderErr = zstd.NewReader(nil)
+	})
+	return zstdDecoder, zstdDecoderErr
+}
+
+// countingReader counts bytes read from a reader.
+type countingReader struct {
+	reader io.Reader
+	count  int64
+}
+
+// Read reads from the reader and counts the read bytes.
+func (r *countingReader) Read(p []byte) (int, error) {
+	n, err := r.reader.Read(p)
+	r.count += int64(n)
+	return n, err
+}
+
+// XlogReader reads rows of a .snap/.xlog file.
+type XlogReader struct {
+	// Meta is a meta information of the file.
+	Meta XlogMeta
+
+	source *countingReader
+	reader *bufio.Reader
+	// blockOffset is an offset of the current block in the file.
+	blockOffset int64
+	// endOffset is an offset of the end of the last complete block.
+	endOffset int64
+	// block is a buffer for a raw block of rows.
+	block []byte
+	// rows is a buffer for decompressed rows.
+	rows []byte
+	// decoder decodes rows of the current block.
+	decoder mpDecoder
+	// blocks is a count of read blocks.
+	blocks int
+	eof    bool
+}
+
+// NewXlogReader creates a new reader of a .snap/.xlog file from the reader.
+func NewXlogReader(reader io.Reader) (*XlogReader, error) {
+	source := &countingReader{reader: reader}
+	bufReader := bufio.NewReaderSize(source, xlogReadBufferSize)
+	meta, err := readXlogMeta(bufReader)
+	if err != nil {
+		return nil, err
+	}
+	r := &XlogReader{
+		Meta:   meta,
+		source: source,
+		reader: bufReader,
+	}
+	r.blockOffset = r.offset()
+	r.endOffset = r.blockOffset
+	return r, nil
+}
+
+// offset returns an offset of the next unread byte of the file.
+func (r *XlogReader) offset() int64 {
+	return r.source.count - int64(r.reader.Buffered())
+}
+
+// seek moves the reader to a block at the offset of the file. The source
+// reader must implement io.Seeker.
+func (r *XlogReader) seek(offset int64) error {
+	seeker, ok := r.source.reader.(io.Seeker)
+	if !ok {
+		return fmt.Errorf("the file is not seekable")
+	}
+	if _, err := seeker.Seek(offset, io.SeekStart); err != nil {
+		return err
+	}
+	r.source.count = offset
+	r.reader.Reset(r.source)
+	r.decoder = mpDecoder{}
+	r.blockOffset = offset
+	r.endOffset = offset
+	r.eof = false
+	return nil
+}
+
+// nextBlock reads the next block of rows. It returns io.EOF at the end of
+// the file. A truncated block at the end of the file is treated as the end of
+// the file, since the file could be written at the moment.
+func (r *XlogReader) nextBlock() error {
+	var fixheader [xlogFixheaderSize]byte
+	offset := r.offset()
+	if _, err := io.ReadFull(r.reader, fixheader[:4]); err != nil {
+		if err == io.ErrUnexpectedEOF {
+			err = io.EOF
+		}
+		return err
+	}
+
+	magic := binary.LittleEndian.Uint32(fixheader[:4])
+	if magic == xlogEOFMarker {
+		return io.EOF
+	}
+	if magic != xlogRowMarker && magic != xlogZRowMarker {
+		return fmt.Errorf("unexpected block marker 0x%08x", magic)
+	}
+
+	if _, err := io.ReadFull(r.reader, fixheader[4:]); err != nil {
+		if err == io.ErrUnexpectedEOF {
+			err = io.EOF
+		}
+		return err
+	}
+	decoder := mpDecoder{buf: fixheader[4:]}
+	size, err := decoder.decodeUint()
+	if err != nil {
+		return fmt.Errorf("invalid block header: %w", err)
+	}
+	// A checksum of the previous block is not used.
+	if _, err := decoder.decodeUint(); err != nil {
+		return fmt.Errorf("invalid block header: %w", err)
+	}
+	crc, err := decoder.decodeUint()
+	if err != nil {
+		return fmt.Errorf("invalid block header: %w", err)
+	}
+
+	if uint64(cap(r.block)) < size {
+		r.block = make([]byte, size)
+	}
+	r.block = r.block[:size]
+	if _, err := io.ReadFull(r.reader, r.block); err != nil {
+		if err == io.ErrUnexpectedEOF {
+			err = io.EOF
+		}
+		return err
+	}
+	r.blocks++
+	if uint64(blockChecksum(r.block)) != crc {
+		return fmt.Errorf("block %d checksum mismatch", r.blocks)
+	}
+
+	rows := r.block
+	if magic == xlogZRowMarker {
+		decoder, err := getZstdDecoder()
+		if err != nil {
+			return fmt.Errorf("failed to create a zstd decoder: %w", err)
+		}
+		if rows, err = decoder.DecodeAll(r.block, r.rows[:0]); err != nil {
+			return fmt.Errorf("failed to decompress block %d: %w", r.blocks, err)
+		}
+		r.rows = rows
+	}
+	r.decoder = mpDecoder{buf: rows}
+	r.blockOffset = offset
+	r.endOffset = r.offset()
+	return nil
+}
+
+// crc32cTable is a table for CRC32-C checksums of blocks.
+var crc32cTable = crc32.MakeTable(crc32.Castagnoli)
+
+// blockChecksum returns a checksum of a block. Tarantool calculates CRC32-C
+// without the initial and the final inversion.
+func blockChecksum(data []byte) uint32 {
+	return ^crc32.Update(^uint32(0), crc32cTable, data)
+}
+
+// decodeRowHeader decodes a row header.
+func decodeRowHeader(decoder *mpDecoder) (RowHeader, error) {
+	header := RowHeader{IsCommit: true}
+	size, err := decoder.decodeMapLen()
+	if err != nil {
+		return header, err
+	}
+
+	tsnFound := false
+	for i := 0; i < size; i++ {
+		key, err := decoder.decodeUint()
+		if err != nil {
+			return header, err
+		}
+		switch key {
+		case rowKeyType:
+			header.Type, err = decoder.decodeUint()
+		case rowKeyReplicaID:
+			header.ReplicaID, err = decoder.decodeUint()
+		case rowKeyGroupID:
+			header.GroupID, err = decoder.decodeUint()
+		case rowKeyLSN:
+			header.LSN, err = decoder.decodeUint()
+		case rowKeyTSN:
+			header.TSN, err = decoder.decodeUint()
+			tsnFound = true
+		case rowKeyTimestamp:
+			header.Timestamp, err = decoder.decodeFloat()
+		case rowKeyFlags:
+			var flags uint64
+			flags, err = decoder.decodeUint()
+			header.IsCommit = flags&rowFlagCommit != 0
+		default:
+			// rowKeySync, rowKeySchemaVersion, rowKeyStreamID and unknown
+			// keys are not needed.
+			_, err = decoder.decode()
+		}
+		if err != nil {
+			return header, fmt.Errorf("invalid row header key %d: %w", key, err)
+		}
+	}
+	if !tsnFound {
+		header.TSN = header.LSN
+	}
+	return header, nil
+}
+
+// decodeRowBody decodes a row body.
+func decodeRowBody(decoder *mpDecoder) ([]Field, error) {
+	size, err := decoder.decodeMapLen()
+	if err != nil {
+		return nil, err
+	}
+	body, err := decoder.decodeMap(size)
+	if err != nil {
+		return nil, err
+	}
+	for i, field := range body {
+		if key, ok := field.Key.(uint64); ok {
+			if name, ok := rowBodyKeyNames[key]; ok {
+				body[i].Key = name
+			}
+		}
+	}
+	return body, nil
+}
+
+// Next returns the next row from the file. It returns io.EOF at the end of
+// the file.
+func (r *XlogReader) Next() (Row, error) {
+	return r.next(true)
+}
+
+// next returns the next row from the file. A body of the row is skipped if
+// decodeBody is false.
+func (r *XlogReader) next(decodeBody bool) (Row, error) {
+	row := Row{}
+	for r.decoder.len() == 0 {
+		if r.eof {
+			return row, io.EOF
+		}
+		if err := r.nextBlock(); err != nil {
+			if err == io.EOF {
+				r.eof = true
+			}
+			return row, err
+		}
+	}
+
+	var err error
+	if row.Header, err = decodeRowHeader(&r.decoder); err != nil {
+		return row, fmt.Errorf("failed to decode a row header: %w", err)
+	}
+	if r.decoder.len() > 0 && row.Header.Type != RowTypeNop {
+		if !decodeBody {
+			if _, err = r.decoder.decode(); err != nil {
+				return row, fmt.Errorf("failed to decode a row body: %w", err)
+			}
+		} else if row.Body, err = decodeRowBody(&r.decoder); err != nil {
+			return row, fmt.Errorf("failed to decode a row body: %w", err)
+		}
+	}
+	return row, nil
+}
+
+// ReadXlogFile calls the handler for each row of a .snap/.xlog file. It
+// stops if the handler returns false or an error.
+func ReadXlogFile(path string, handler func(row Row) (bool, error)) error {
+	file, err := os.Open(path)
+	if err != nil {
+		return err
+	}
+	defer file.Close()
+
+	reader, err := NewXlogReader(file)
+	if err != nil {
+		return fmt.Errorf("failed to read %q: %w", path, err)
+	}
+	return readXlogRows(path, reader, handler)
+}
+
+// readXlogRows calls the handler for each next row of the reader of the file.
+func readXlogRows(path string, reader *XlogReader, handler func(row Row) (bool, error)) error {
+	for {
+		row, err := reader.Next()
+		if errors.Is(err, io.EOF) {
+			return nil
+		}
+		if err != nil {
+			return fmt.Errorf("failed to read %q: %w", path, err)
+		}
+		next, err := handler(row)
+		if err != nil || !next {
+			return err
+		}
+	}
+}
@@ -0,0 +1,251 @@
+package checkpoint
+
+import (
+	"bufio"
+	"bytes"
+	"math"
+	"strings"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestReadXlogFile_xlog(t *testing.T) {
+	var rows []Row
+	err := ReadXlogFile("testdata/test.xlog", func(row Row) (bool, error) {
+		rows = append(rows, row)
+		return true, nil
+	})
+	require.NoError(t, err)
+	require.Len(t, rows, 2)
+
+	assert.Equal(t, RowHeader{
+		Type:      4,
+		ReplicaID: 1,
+		LSN:       1,
+		TSN:       1,
+		Timestamp: 1650033990.995323,
+		IsCommit:  true,
+	}, rows[0].Header)
+	assert.Equal(t, []Field{
+		{Key: "space_id", Value: uint64(272)},
+		{Key: "index_base", Value: uint64(1)},
+		{Key: "key", Value: []any{"max_id"}},
+		{Key: "tuple", Value: []any{[]any{"+", uint64(2), uint64(1)}}},
+	}, rows[0].Body)
+
+	assert.Equal(t, "INSERT", rows[1].Header.TypeName())
+	spaceID, ok := rows[1].SpaceID()
+	assert.True(t, ok)
+	assert.Equal(t, uint64(280), spaceID)
+}
+
+func TestReadXlogFile_snap(t *testing.T) {
+	count := 0
+	var first Row
+	err := ReadXlogFile("testdata/test.snap", func(row Row) (bool, error) {
+		if count == 0 {
+			first = row
+		}
+		count++
+		return true, nil
+	})
+	require.NoError(t, err)
+	assert.Equal(t, 515, count)
+	assert.Equal(t, []Field{
+		{Key: "space_id", Value: uint64(272)},
+		{Key: "tuple", Value: []any{"cluster", "7a228ed0-85fd-4716-9165-a7e459edac62"}},
+	}, first.Body)
+}
+
+func TestReadXlogFile_stop(t *testing.T) {
+	count := 0
+	err := ReadXlogFile("testdata/test.snap", func(row Row) (bool, error) {
+		count++
+		return count < 3, nil
+	})
+	require.NoError(t, err)
+	assert.Equal(t, 3, count)
+}
+
+func TestNewXlogReader_meta(t *testing.T) {
+	reader, err := NewXlogReader(strings.NewReader("XLOG\n0.13\n" +
+		"Version: 2.11.1\nInstance: foo\nVClock: {1: 10, 2: 5}\n" +
+		"PrevVClock: {1: 3}\n\n"))
+	require.NoError(t, err)
+	assert.Equal(t, XlogMeta{
+		Filetype:     "XLOG",
+		Version:      "2.11.1",
+		InstanceUUID: "foo",
+		Vclock:       Vclock{1: 10, 2: 5},
+		PrevVclock:   Vclock{1: 3},
+	}, reader.Meta)
+
+	_, err = reader.Next()
+	assert.ErrorContains(t, err, "EOF")
+}
+
+func TestNewXlogReader_errors(t *testing.T) {
+	cases := []struct {
+		Data     string
+		Expected string
+	}{
+		{"XLOG\n", "failed to read a file header"},
+		{"XLOG\n0.11\n\n", "unsupported file format version"},
+		{"XLOG\n0.13\nfoo\n\n", "invalid file header line"},
+		{"XLOG\n0.13\nVClock: {1}\n\n", "invalid vclock component"},
+	}
+
+	for _, tc := range cases {
+		t.Run(tc.Expected, func(t *testing.T) {
+			_, err := NewXlogReader(strings.NewReader(tc.Data))
+			assert.ErrorContains(t, err, tc.Expected)
+		})
+	}
+}
+
+func TestMpDecoder_decode(t *testing.T) {
+	cases := []struct {
+		Data     []byte
+		Expected any
+	}{
+		{[]byte{0xc0}, nil},
+		{[]byte{0xc3}, true},
+		{[]byte{0x05}, uint64(5)},
+		{[]byte{0xff}, int64(-1)},
+		{[]byte{0xcd, 0x01, 0x00}, uint64(256)},
+		{[]byte{0xd1, 0xff, 0x00}, int64(-256)},
+		{[]byte{0xcb, 0x3f, 0xf8, 0, 0, 0, 0, 0, 0}, 1.5},
+		{[]byte{0xa3, 'f', 'o', 'o'}, "foo"},
+		{[]byte{0xc4, 0x02, 0x01, 0x02}, []byte{0x01, 0x02}},
+		{[]byte{0x92, 0x01, 0xa1, 'a'}, []any{uint64(1), "a"}},
+		{[]byte{0x81, 0x01, 0x02}, []Field{{Key: uint64(1), Value: uint64(2)}}},
+		{[]byte{0xd4, 0x05, 0x01}, Ext{Type: 5, Data: []byte{0x01}}},
+	}
+
+	for _, tc := range cases {
+		decoder := mpDecoder{buf: tc.Data}
+		value, err := decoder.decode()
+		require.NoError(t, err)
+		assert.Equal(t, tc.Expected, value)
+		assert.Equal(t, 0, decoder.len())
+	}
+
+	for _, data := range [][]byte{{}, {0xcd, 0x01}, {0x92, 0x01}, {0xdd, 0xff, 0xff, 0xff, 0xff}} {
+		decoder := mpDecoder{buf: data}
+		_, err := decoder.decode()
+		assert.ErrorIs(t, err, errShortBuffer)
+	}
+}
+
+func TestFilterRow(t *testing.T) {
+	newRow := func(lsn, replicaID, spaceID uint64) Row {
+		return Row{
+			Header: RowHeader{LSN: lsn, ReplicaID: replicaID},
+			Body:   []Field{{Key: "space_id", Value: spaceID}},
+		}
+	}
+	defaultOpts := Opts{To: math.MaxUint64}
+
+	cases := []struct {
+		Name  string
+		Row   Row
+		Opts  Opts
+		Match bool
+		Stop  bool
+	}{
+		{"user", newRow(1, 1, 512), defaultOpts, true, false},
+		{"system", newRow(1, 1, 280), defaultOpts, false, false},
+		{"system_shown", newRow(1, 1, 280), Opts{To: math.MaxUint64, ShowSystem: true},
+			true, false},
+		{"from", newRow(1, 1, 512), Opts{From: 2, To: math.MaxUint64}, false, false},
+		{"to", newRow(2, 1, 512), Opts{To: 2}, false, false},
+		{"to_replica", newRow(2, 1, 512), Opts{To: 2, Replica: []int{1}}, false, true},
+		{"space", newRow(1, 1, 280), Opts{To: math.MaxUint64, Space: []int{280}},
+			true, false},
+		{"other_space", newRow(1, 1, 512), Opts{To: math.MaxUint64, Space: []int{280}},
+			false, false},
+		{"replica", newRow(1, 2, 512), Opts{To: math.MaxUint64, Replica: []int{1, 2}},
+			true, false},
+		{"other_replica", newRow(1, 3, 512), Opts{To: math.MaxUint64, Replica: []int{1}},
+			false, false},
+	}
+
+	for _, tc := range cases {
+		t.Run(tc.Name, func(t *testing.T) {
+			match, stop := filterRow(tc.Row, tc.Opts)
+			assert.Equal(t, tc.Match, match)
+			assert.Equal(t, tc.Stop, stop)
+		})
+	}
+}
+
+func TestRowFormatters(t *testing.T) {
+	row := Row{
+		Header: RowHeader{
+			Type:      2,
+			ReplicaID: 1,
+			LSN:       5,
+			TSN:       5,
+			Timestamp: 1650033990.995323,
+			IsCommit:  true,
+		},
+		Body: []Field{
+			{Key: "space_id", Value: uint64(512)},
+			{Key: "tuple", Value: []any{
+				uint64(1), "it's", nil, -1.5, []Field{{Key: "a", Value: true}},
+				Ext{Type: extUUID, Data: bytes.Repeat([]byte{0xab}, 16)},
+			}},
+		},
+	}
+
+	cases := []struct {
+		Format   string
+		Expected string
+	}{
+		{"yaml", "---\nHEADER:\n  lsn: 5\n  replica_id: 1\n  type: INSERT\n" +
+			"  timestamp: 1650033990.9953\nBODY:\n  space_id: 512\n" +
+			"  tuple: [1, 'it''s', null, -1.5, {'a': true}, " +
+			"'abababab-abab-abab-abab-abababababab']\n"},
+		{"json", `{"HEADER":{"lsn":5,"replica_id":1,"type":"INSERT",` +
+			`"timestamp":1650033990.9953},"BODY":{"space_id":512,` +
+			`"tuple":[1,"it's",null,-1.5,{"a":true},` +
+			`"abababab-abab-abab-abab-abababababab"]}}` + "\n"},
+		{"lua", `box.space[512]:insert({[1] = 1, [2] = '\x69\x74\x27\x73', ` +
+			`[3] = box.NULL, [4] = -1.5, [5] = {['\x61'] = true}, ` +
+			`[6] = require('uuid').fromstr('abababab-abab-abab-abab-abababababab')})` +
+			"\n"},
+	}
+
+	for _, tc := range cases {
+		t.Run(tc.Format, func(t *testing.T) {
+			var buf bytes.Buffer
+			w := bufio.NewWriter(&buf)
+			rowFormatters[tc.Format](w, row)
+			require.NoError(t, w.Flush())
+			assert.Equal(t, tc.Expected, buf.String())
+		})
+	}
+}
+
+func TestFormatDecimal(t *testing.T) {
+	cases := []struct {
+		Data     []byte
+		Expected string
+	}{
+		{[]byte{0x00, 0x0c}, "0"},
+		{[]byte{0x00, 0x1c}, "1"},
+		{[]byte{0x02, 0x01, 0x23, 0x4d}, "-12.34"},
+		{[]byte{0x03, 0x5c}, "0.005"},
+		{[]byte{0xff, 0x1c}, "10"},
+	}
+
+	for _, tc := range cases {
+		t.Run(tc.Expected, func(t *testing.T) {
+			str, ok := formatDecimal(tc.Data)
+			assert.True(t, ok)
+			assert.Equal(t, tc.Expected, str)
+		})
+	}
+}
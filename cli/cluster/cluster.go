@@ -2,7 +2,9 @@ package cluster
 
 import (
 	"fmt"
+	"sort"
 	"strings"
+	"sync"
 	"time"
 
 	"gopkg.in/yaml.v2"
@@ -223,13 +225,18 @@ func MakeClusterConfig(config *Config) (ClusterConfig, error) {
 	return cconfig, nil
 }
 
+// copyExclude returns a copy of a configuration exclude some path.
+func copyExclude(config *Config, excludePath []string) *Config {
+	configCopy := NewConfig()
+	configCopy.Merge(config)
+	configCopy.Set(excludePath, nil)
+	return configCopy
+}
+
 // mergeExclude merges a high priority configuration with a low priority
 // configuration exclude some path.
 func mergeExclude(high, low *Config, excludePath []string) {
-	lowCopy := NewConfig()
-	lowCopy.Merge(low)
-	lowCopy.Set(excludePath, nil)
-	high.Merge(lowCopy)
+	high.Merge(copyExclude(low, excludePath))
 }
 
 // findInstance finds an instance with the name in the config and returns
@@ -294,6 +301,163 @@ func Instantiate(cluster ClusterConfig, name string) *Config {
 	return iconfig
 }
 
+// instanceLocation describes a location of an instance in a cluster
+// configuration.
+type instanceLocation struct {
+	// group is a group name.
+	group string
+	// replicaset is a replicaset name.
+	replicaset string
+}
+
+// CompiledClusterConfig is a cluster configuration with an index of
+// instances. It allows to find and to instantiate an instance without a scan
+// of all groups and replicasets. Scope configurations and instantiated
+// configurations are memoized, so the object must not be modified after
+// the compilation.
+type CompiledClusterConfig struct {
+	// ClusterConfig is a source cluster configuration.
+	ClusterConfig
+	// names is a sorted list of instance names.
+	names []string
+	// locations is an index of instance locations by an instance name.
+	locations map[string]instanceLocation
+	// mutex protects memoized configurations.
+	mutex sync.Mutex
+	// global is a memoized configuration of the global scope.
+	global *Config
+	// groups are memoized configurations of group scopes.
+	groups map[string]*Config
+	// replicasets are memoized configurations of replicaset scopes.
+	replicasets map[instanceLocation]*Config
+	// instances are memoized instantiated configurations.
+	instances map[string]*Config
+}
+
+// CompileClusterConfig creates a compiled cluster configuration from the
+// cluster configuration.
+func CompileClusterConfig(cluster ClusterConfig) *CompiledClusterConfig {
+	compiled := &CompiledClusterConfig{
+		ClusterConfig: cluster,
+		locations:     make(map[string]instanceLocation),
+		groups:        make(map[string]*Config),
+		replicasets:   make(map[instanceLocation]*Config),
+		instances:     make(map[string]*Config),
+	}
+
+	for gname, group := range cluster.Groups {
+		for rname, replicaset := range group.Replicasets {
+			for iname := range replicaset.Instances {
+				if _, ok := compiled.locations[iname]; ok {
+					continue
+				}
+				compiled.locations[iname] = instanceLocation{
+					group:      gname,
+					replicaset: rname,
+				}
+				compiled.names = append(compiled.names, iname)
+			}
+		}
+	}
+	sort.Strings(compiled.names)
+
+	return compiled
+}
+
+// Instances returns a sorted list of instance names from the cluster config.
+func (compiled *CompiledClusterConfig) Instances() []string {
+	return append([]string{}, compiled.names...)
+}
+
+// HasInstance returns true if an instance with the name exists in the config.
+func (compiled *CompiledClusterConfig) HasInstance(name string) bool {
+	_, ok := compiled.locations[name]
+	return ok
+}
+
+// Instantiate returns a fetched instance config from the cluster config. It
+// works the same way as the Instantiate function, but the result is
+// memoized. The result must not be modified.
+func (compiled *CompiledClusterConfig) Instantiate(name string) *Config {
+	compiled.mutex.Lock()
+	defer compiled.mutex.Unlock()
+
+	if iconfig, ok := compiled.instances[name]; ok {
+		return iconfig
+	}
+
+	iconfig := NewConfig()
+	if location, ok := compiled.locations[name]; ok {
+		// The scopes are merged one by one in the same order as in the
+		// Instantiate function to get the same result.
+		group := compiled.Groups[location.group]
+		replicaset := group.Replicasets[location.replicaset]
+		if instance := replicaset.Instances[name]; instance.RawConfig != nil {
+			iconfig.Merge(instance.RawConfig)
+		}
+		iconfig.Merge(compiled.getReplicaset(location))
+		iconfig.Merge(compiled.getGroup(location.group))
+	}
+	iconfig.Merge(compiled.getGlobal())
+
+	compiled.instances[name] = iconfig
+	return iconfig
+}
+
+// GetInstanceConfig returns a full configuration for an instance with the
+// name. It works the same way as the GetInstanceConfig function.
+func (compiled *CompiledClusterConfig) GetInstanceConfig(
+	instance string) (InstanceConfig, error) {
+	if !compiled.HasInstance(instance) {
+		return InstanceConfig{}, fmt.Errorf("an instance %q not found", instance)
+	}
+
+	mainEnvConfig, err := mainEnvCollector.Collect()
+	if err != nil {
+		fmtErr := "failed to collect a config from environment variables: %w"
+		return InstanceConfig{}, fmt.Errorf(fmtErr, err)
+	}
+
+	iconfig := NewConfig()
+	iconfig.Merge(mainEnvConfig)
+	iconfig.Merge(compiled.Instantiate(instance))
+
+	return MakeInstanceConfig(iconfig)
+}
+
+// getGlobal returns a memoized configuration of the global scope. It must be
+// called under the mutex.
+func (compiled *CompiledClusterConfig) getGlobal() *Config {
+	if compiled.global == nil {
+		compiled.global = copyExclude(compiled.RawConfig, []string{groupsLabel})
+	}
+	return compiled.global
+}
+
+// getGroup returns a memoized configuration of a group scope. It must be
+// called under the mutex.
+func (compiled *CompiledClusterConfig) getGroup(name string) *Config {
+	config, ok := compiled.groups[name]
+	if !ok {
+		group := compiled.Groups[name]
+		config = copyExclude(group.RawConfig, []string{replicasetsLabel})
+		compiled.groups[name] = config
+	}
+	return config
+}
+
+// getReplicaset returns a memoized configuration of a replicaset scope. It
+// must be called under the mutex.
+func (compiled *CompiledClusterConfig) getReplicaset(location instanceLocation) *Config {
+	config, ok := compiled.replicasets[location]
+	if !ok {
+		replicaset := compiled.Groups[location.group].Replicasets[location.replicaset]
+		config = copyExclude(replicaset.RawConfig, []string{instancesLabel})
+		compiled.replicasets[location] = config
+	}
+	return config
+}
+
 // collectEtcdConfig collects a configuration from etcd with options from
 // the cluster configuration.
 func collectEtcdConfig(collectors CollectorFactory,
@@ -323,11 +487,10 @@ func collectEtcdConfig(collectors CollectorFactory,
 		opts.Timeout = defaultEtcdTimeout
 	}
 
-	etcd, err := ConnectEtcd(opts)
+	etcd, err := ConnectEtcdShared(opts)
 	if err != nil {
 		return nil, fmt.Errorf("unable to connect to etcd: %w", err)
 	}
-	defer etcd.Close()
 
 	etcdCollector, err := collectors.NewEtcd(etcd, etcdConfig.Prefix, "", opts.Timeout)
 	if err != nil {
@@ -400,8 +563,9 @@ func collectTarantoolConfig(collectors CollectorFactory,
 }
 
 // GetClusterConfig returns a cluster configuration loaded from a path to
-// a config file. It uses a a config file, etcd and default environment
-// variables as sources. The function returns a cluster config as is, without
+// a config file. It uses a a config file, etcd, tarantool config storage and
+// default environment variables as sources. The remote sources are fetched
+// concurrently. The function returns a cluster config as is, without
 // merging of settings from scopes: global, group, replicaset, instance.
 func GetClusterConfig(collectors CollectorFactory, path string) (ClusterConfig, error) {
 	ret := ClusterConfig{}
@@ -434,20 +598,35 @@ func GetClusterConfig(collectors CollectorFactory, path string) (ClusterConfig,
 	if err != nil {
 		return ret, fmt.Errorf("unable to parse cluster config from file: %w", err)
 	}
+
+	// Remote sources are independent, so they are collected concurrently.
+	// The results are merged in the priority order: etcd, tarantool config
+	// storage.
+	remoteCollectors := []func(CollectorFactory, ClusterConfig) (*Config, error){}
 	if len(clusterConfig.Config.Etcd.Endpoints) > 0 {
-		etcdConfig, err := collectEtcdConfig(collectors, clusterConfig)
-		if err != nil {
-			return ret, err
-		}
-		config.Merge(etcdConfig)
+		remoteCollectors = append(remoteCollectors, collectEtcdConfig)
 	}
-
 	if len(clusterConfig.Config.Storage.Endpoints) > 0 {
-		tarantoolConfig, err := collectTarantoolConfig(collectors, clusterConfig)
-		if err != nil {
-			return ret, err
+		remoteCollectors = append(remoteCollectors, collectTarantoolConfig)
+	}
+
+	remoteConfigs := make([]*Config, len(remoteCollectors))
+	remoteErrs := make([]error, len(remoteCollectors))
+	var wg sync.WaitGroup
+	for i, collect := range remoteCollectors {
+		wg.Add(1)
+		go func(i int, collect func(CollectorFactory, ClusterConfig) (*Config, error)) {
+			defer wg.Done()
+			remoteConfigs[i], remoteErrs[i] = collect(collectors, clusterConfig)
+		}(i, collect)
+	}
+	wg.Wait()
+
+	for i := range remoteCollectors {
+		if remoteErrs[i] != nil {
+			return ret, remoteErrs[i]
 		}
-		config.Merge(tarantoolConfig)
+		config.Merge(remoteConfigs[i])
 	}
 
 	defaultEnvConfig, err := defaultEnvCollector.Collect()
@@ -534,6 +534,59 @@ func TestGetInstanceConfig_noinstance(t *testing.T) {
 	assert.EqualError(t, err, expected)
 }
 
+func TestCompiledClusterConfig_Instances(t *testing.T) {
+	config := cluster.NewConfig()
+	config.Set([]string{"foo"}, "bar")
+	config.Set([]string{"groups", "g", "replicasets", "rr", "foo"}, "bar")
+	config.Set([]string{
+		"groups", "g", "replicasets", "r", "instances", "b", "foo"}, "bar")
+	config.Set([]string{
+		"groups", "g", "replicasets", "rr", "instances", "a", "foo"}, "bar")
+	config.Set([]string{
+		"groups", "gg", "replicasets", "r", "instances", "c", "foo"}, "bar")
+	cconfig, err := cluster.MakeClusterConfig(config)
+	require.NoError(t, err)
+
+	compiled := cluster.CompileClusterConfig(cconfig)
+	assert.Equal(t, []string{"a", "b", "c"}, compiled.Instances())
+	assert.True(t, compiled.HasInstance("a"))
+	assert.True(t, compiled.HasInstance("c"))
+	assert.False(t, compiled.HasInstance("r"))
+	assert.False(t, compiled.HasInstance("unknown"))
+}
+
+func TestCompiledClusterConfig_Instantiate(t *testing.T) {
+	collectors := cluster.NewCollectorFactory()
+	cconfig, err := cluster.GetClusterConfig(collectors, "testdata/app/config.yaml")
+	require.NoError(t, err)
+
+	compiled := cluster.CompileClusterConfig(cconfig)
+	for _, name := range append(cluster.Instances(cconfig), "unknown") {
+		t.Run(name, func(t *testing.T) {
+			iconfig := compiled.Instantiate(name)
+			assert.Equal(t, cluster.Instantiate(cconfig, name).String(),
+				iconfig.String())
+			assert.Same(t, iconfig, compiled.Instantiate(name))
+		})
+	}
+}
+
+func TestCompiledClusterConfig_GetInstanceConfig(t *testing.T) {
+	collectors := cluster.NewCollectorFactory()
+	cconfig, err := cluster.GetClusterConfig(collectors, "testdata/app/config.yaml")
+	require.NoError(t, err)
+	compiled := cluster.CompileClusterConfig(cconfig)
+
+	expected, err := cluster.GetInstanceConfig(cconfig, "c")
+	require.NoError(t, err)
+	config, err := compiled.GetInstanceConfig("c")
+	require.NoError(t, err)
+	assert.Equal(t, expected.RawConfig.String(), config.RawConfig.String())
+
+	_, err = compiled.GetInstanceConfig("unknown")
+	assert.EqualError(t, err, "an instance \"unknown\" not found")
+}
+
 func TestReplaceInstanceConfig_not_found(t *testing.T) {
 	config := cluster.NewConfig()
 	cconfig, err := cluster.MakeClusterConfig(config)
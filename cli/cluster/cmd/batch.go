@@ -0,0 +1,224 @@
+package cmd
+
+import (
+	"errors"
+	"fmt"
+	"net/url"
+	"os"
+	"path/filepath"
+	"sync"
+
+	"gopkg.in/yaml.v2"
+
+	"github.com/tarantool/tt/cli/cluster"
+)
+
+// batchConcurrency is a maximum count of targets processed concurrently.
+const batchConcurrency = 16
+
+// BatchTarget describes a target of a batch command.
+type BatchTarget struct {
+	// Prefix is a base path to a configuration. A prefix from URI is used if
+	// it is empty.
+	Prefix string `yaml:"prefix"`
+	// Key is a target configuration key in the prefix.
+	Key string `yaml:"key"`
+	// Name is a name of an instance in the cluster configuration.
+	Name string `yaml:"name"`
+	// Source is a path to a configuration file to publish. A relative path
+	// is relative to the manifest directory.
+	Source string `yaml:"source"`
+}
+
+// BatchManifest describes targets of a batch command.
+type BatchManifest struct {
+	// Targets is a list of targets.
+	Targets []BatchTarget `yaml:"targets"`
+}
+
+// BatchResult is a result of a batch command for a target.
+type BatchResult struct {
+	// Target is the target.
+	Target BatchTarget
+	// Err is an error for the target, if any.
+	Err error
+}
+
+// LoadBatchManifest loads a batch manifest from the path.
+func LoadBatchManifest(path string) (BatchManifest, error) {
+	manifest := BatchManifest{}
+
+	data, err := os.ReadFile(path)
+	if err != nil {
+		return manifest, fmt.Errorf("failed to read a batch manifest %q: %w", path, err)
+	}
+	if err := yaml.UnmarshalStrict(data, &manifest); err != nil {
+		return manifest, fmt.Errorf("failed to parse a batch manifest %q: %w", path, err)
+	}
+
+	dir := filepath.Dir(path)
+	for i, target := range manifest.Targets {
+		if target.Source != "" && !filepath.IsAbs(target.Source) {
+			manifest.Targets[i].Source = filepath.Join(dir, target.Source)
+		}
+	}
+	return manifest, nil
+}
+
+// BatchResultsError returns an error that joins errors of the results.
+func BatchResultsError(results []BatchResult) error {
+	var errs []error
+	for _, result := range results {
+		if result.Err != nil {
+			errs = append(errs, fmt.Errorf("prefix %q: %w",
+				result.Target.Prefix, result.Err))
+		}
+	}
+	return errors.Join(errs...)
+}
+
+// runBatch calls the handler for each target and its index concurrently. It
+// returns results in the order of the targets.
+func runBatch(targets []BatchTarget,
+	handler func(i int, target BatchTarget) error) []BatchResult {
+	results := make([]BatchResult, len(targets))
+	sem := make(chan struct{}, batchConcurrency)
+
+	var wg sync.WaitGroup
+	for i, target := range targets {
+		results[i].Target = target
+
+		wg.Add(1)
+		sem <- struct{}{}
+		go func(i int, target BatchTarget) {
+			defer wg.Done()
+			defer func() { <-sem }()
+			results[i].Err = handler(i, target)
+		}(i, target)
+	}
+	wg.Wait()
+
+	return results
+}
+
+// connectBatch establishes a shared connection for the batch and resolves
+// target prefixes.
+func connectBatch(uri *url.URL, connOpts connectOpts,
+	manifest BatchManifest) (storageConn, UriOpts, []BatchTarget, error) {
+	uriOpts, err := ParseUriOpts(uri)
+	if err != nil {
+		return storageConn{}, uriOpts, nil, fmt.Errorf("invalid URL %q: %w", uri, err)
+	}
+	if uriOpts.Key != "" || uriOpts.Instance != "" {
+		return storageConn{}, uriOpts, nil,
+			fmt.Errorf("key and name arguments are not supported in URL for a batch, " +
+				"use the manifest instead")
+	}
+
+	targets := make([]BatchTarget, len(manifest.Targets))
+	for i, target := range manifest.Targets {
+		if target.Prefix == "" {
+			target.Prefix = uriOpts.Prefix
+		}
+		targets[i] = target
+	}
+
+	storage, err := connectStorage(uriOpts, connOpts)
+	if err != nil {
+		return storageConn{}, uriOpts, nil, err
+	}
+	return storage, uriOpts, targets, nil
+}
+
+// PublishBatchUri publishes configurations from the manifest over a single
+// connection to URI. Targets are published concurrently. It returns results
+// in the order of the manifest targets or an error if a connection could not
+// be established.
+func PublishBatchUri(publishCtx PublishCtx, uri *url.URL,
+	manifest BatchManifest) ([]BatchResult, error) {
+	connOpts := connectOpts{
+		Username: publishCtx.Username,
+		Password: publishCtx.Password,
+	}
+	storage, uriOpts, targets, err := connectBatch(uri, connOpts, manifest)
+	if err != nil {
+		return nil, err
+	}
+	defer storage.Close()
+
+	return runBatch(targets, func(_ int, target BatchTarget) error {
+		if target.Source == "" {
+			return fmt.Errorf("source file is not specified")
+		}
+		src, err := os.ReadFile(target.Source)
+		if err != nil {
+			return fmt.Errorf("failed to read path %q: %w", target.Source, err)
+		}
+		config, err := cluster.NewYamlCollector(src).Collect()
+		if err != nil {
+			return fmt.Errorf("failed to read a configuration from path %q: %w",
+				target.Source, err)
+		}
+
+		targetCtx := publishCtx
+		targetCtx.Src = src
+		targetCtx.Config = config
+		if err := publishCtxValidateConfig(targetCtx, target.Name); err != nil {
+			return err
+		}
+
+		publisher, collector, err := storage.createPublisherAndCollector(
+			publishCtx.Publishers, publishCtx.Collectors,
+			target.Prefix, target.Key, uriOpts.Timeout)
+		if err != nil {
+			return err
+		}
+
+		if target.Name == "" {
+			return publisher.Publish(src)
+		}
+		return replaceInstanceConfig(target.Name, config, collector, publisher)
+	}), nil
+}
+
+// ShowBatchUri shows configurations from the manifest over a single
+// connection to URI. Configurations are collected concurrently and printed
+// as YAML documents in the order of the manifest targets.
+func ShowBatchUri(showCtx ShowCtx, uri *url.URL,
+	manifest BatchManifest) ([]BatchResult, error) {
+	connOpts := connectOpts{
+		Username: showCtx.Username,
+		Password: showCtx.Password,
+	}
+	storage, uriOpts, targets, err := connectBatch(uri, connOpts, manifest)
+	if err != nil {
+		return nil, err
+	}
+	defer storage.Close()
+
+	configs := make([]*cluster.Config, len(targets))
+	results := runBatch(targets, func(i int, target BatchTarget) error {
+		_, collector, err := storage.createPublisherAndCollector(
+			nil, showCtx.Collectors, target.Prefix, target.Key, uriOpts.Timeout)
+		if err != nil {
+			return err
+		}
+
+		config, err := collector.Collect()
+		if err != nil {
+			return fmt.Errorf("failed to collect a configuration: %w", err)
+		}
+		configs[i] = config
+		return nil
+	})
+
+	for i, result := range results {
+		if result.Err != nil {
+			continue
+		}
+		fmt.Printf("--- # %s\n", result.Target.Prefix)
+		err := printRawClusterConfig(configs[i], result.Target.Name, showCtx.Validate)
+		results[i].Err = err
+	}
+	return results, nil
+}
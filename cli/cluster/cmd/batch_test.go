@@ -0,0 +1,101 @@
+package cmd
+
+import (
+	"fmt"
+	"os"
+	"path/filepath"
+	"sync/atomic"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestLoadBatchManifest(t *testing.T) {
+	dir := t.TempDir()
+	path := filepath.Join(dir, "manifest.yaml")
+	err := os.WriteFile(path, []byte(`targets:
+  - prefix: /foo
+    source: foo.yaml
+  - prefix: /bar
+    key: bar
+    name: instance
+    source: /bar.yaml
+`), 0644)
+	require.NoError(t, err)
+
+	manifest, err := LoadBatchManifest(path)
+	require.NoError(t, err)
+	assert.Equal(t, BatchManifest{
+		Targets: []BatchTarget{
+			{Prefix: "/foo", Source: filepath.Join(dir, "foo.yaml")},
+			{Prefix: "/bar", Key: "bar", Name: "instance", Source: "/bar.yaml"},
+		},
+	}, manifest)
+}
+
+func TestLoadBatchManifest_errors(t *testing.T) {
+	dir := t.TempDir()
+
+	_, err := LoadBatchManifest(filepath.Join(dir, "not_exist.yaml"))
+	assert.ErrorContains(t, err, "failed to read a batch manifest")
+
+	path := filepath.Join(dir, "manifest.yaml")
+	err = os.WriteFile(path, []byte("targets:\n  - unknown: foo\n"), 0644)
+	require.NoError(t, err)
+
+	_, err = LoadBatchManifest(path)
+	assert.ErrorContains(t, err, "failed to parse a batch manifest")
+}
+
+func TestRunBatch(t *testing.T) {
+	var targets []BatchTarget
+	for i := 0; i < 3*batchConcurrency; i++ {
+		targets = append(targets, BatchTarget{Prefix: fmt.Sprintf("/%d", i)})
+	}
+
+	var running, maxRunning int32
+	results := runBatch(targets, func(i int, target BatchTarget) error {
+		current := atomic.AddInt32(&running, 1)
+		defer atomic.AddInt32(&running, -1)
+		for {
+			prev := atomic.LoadInt32(&maxRunning)
+			if current <= prev ||
+				atomic.CompareAndSwapInt32(&maxRunning, prev, current) {
+				break
+			}
+		}
+		time.Sleep(time.Millisecond)
+
+		if i%2 == 1 {
+			return fmt.Errorf("error %d", i)
+		}
+		return nil
+	})
+
+	require.Len(t, results, len(targets))
+	assert.LessOrEqual(t, maxRunning, int32(batchConcurrency))
+	for i, result := range results {
+		assert.Equal(t, targets[i], result.Target)
+		if i%2 == 1 {
+			assert.EqualError(t, result.Err, fmt.Sprintf("error %d", i))
+		} else {
+			assert.NoError(t, result.Err)
+		}
+	}
+}
+
+func TestBatchResultsError(t *testing.T) {
+	assert.NoError(t, BatchResultsError(nil))
+	assert.NoError(t, BatchResultsError([]BatchResult{
+		{Target: BatchTarget{Prefix: "/foo"}},
+	}))
+
+	err := BatchResultsError([]BatchResult{
+		{Target: BatchTarget{Prefix: "/foo"}, Err: fmt.Errorf("foo")},
+		{Target: BatchTarget{Prefix: "/bar"}},
+		{Target: BatchTarget{Prefix: "/zoo"}, Err: fmt.Errorf("zoo")},
+	})
+	assert.EqualError(t, err, "prefix \"/foo\": foo\nprefix \"/zoo\": zoo")
+}
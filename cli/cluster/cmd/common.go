@@ -4,6 +4,8 @@ import (
 	"errors"
 	"fmt"
 	"os"
+	"sync"
+	"time"
 
 	clientv3 "go.etcd.io/etcd/client/v3"
 
@@ -52,7 +54,8 @@ func printClusterConfig(cconfig cluster.ClusterConfig,
 // printInstanceConfig prints an instance configuration in the cluster.
 func printInstanceConfig(config cluster.ClusterConfig,
 	instance string, full, validate bool) error {
-	if !cluster.HasInstance(config, instance) {
+	compiled := cluster.CompileClusterConfig(config)
+	if !compiled.HasInstance(instance) {
 		return fmt.Errorf("instance %q not found", instance)
 	}
 
@@ -61,10 +64,10 @@ func printInstanceConfig(config cluster.ClusterConfig,
 		iconfig *cluster.Config
 	)
 	if full {
-		ic, _ := cluster.GetInstanceConfig(config, instance)
+		ic, _ := compiled.GetInstanceConfig(instance)
 		iconfig = ic.RawConfig
 	} else {
-		iconfig = cluster.Instantiate(config, instance)
+		iconfig = compiled.Instantiate(instance)
 	}
 
 	if validate {
@@ -98,21 +101,22 @@ func validateRawClusterConfig(config *cluster.Config) error {
 // validateClusterConfig validates a cluster configuration.
 func validateClusterConfig(cconfig cluster.ClusterConfig, full bool) error {
 	var errs []error
-	if err := cluster.Validate(cconfig.RawConfig, cluster.TarantoolSchema); err != nil {
+	if err := cluster.CompiledTarantoolSchema.Validate(cconfig.RawConfig); err != nil {
 		err = fmt.Errorf("an invalid cluster configuration: %s", err)
 		errs = append(errs, err)
 	}
 
-	for _, name := range cluster.Instances(cconfig) {
+	compiled := cluster.CompileClusterConfig(cconfig)
+	for _, name := range compiled.Instances() {
 		var iconfig *cluster.Config
 		if full {
-			ic, err := cluster.GetInstanceConfig(cconfig, name)
+			ic, err := compiled.GetInstanceConfig(name)
 			if err != nil {
 				return err
 			}
 			iconfig = ic.RawConfig
 		} else {
-			iconfig = cluster.Instantiate(cconfig, name)
+			iconfig = compiled.Instantiate(name)
 		}
 		if err := validateInstanceConfig(iconfig, name); err != nil {
 			errs = append(errs, err)
@@ -124,7 +128,7 @@ func validateClusterConfig(cconfig cluster.ClusterConfig, full bool) error {
 
 // validateInstanceConfig validates an instance configuration.
 func validateInstanceConfig(config *cluster.Config, name string) error {
-	if err := cluster.Validate(config, cluster.TarantoolSchema); err != nil {
+	if err := cluster.CompiledTarantoolSchema.Validate(config); err != nil {
 		return fmt.Errorf("an invalid instance %q configuration: %w", name, err)
 	}
 	return nil
@@ -183,65 +187,127 @@ func connectEtcd(uriOpts UriOpts, connOpts connectOpts) (*clientv3.Client, error
 	return etcdcli, nil
 }
 
-// createPublisher creates a new data publisher and collector based on UriOpts.
-func createPublisherAndCollector(
-	publishers cluster.DataPublisherFactory,
-	collectors cluster.CollectorFactory,
-	connOpts connectOpts,
-	opts UriOpts) (cluster.DataPublisher, cluster.Collector, func(), error) {
-	prefix, key, timeout := opts.Prefix, opts.Key, opts.Timeout
+// storageConn is an established connection to tarantool config storage or
+// to etcd.
+type storageConn struct {
+	// conn is a connection to tarantool config storage.
+	conn connector.Connector
+	// etcdcli is a connection to etcd.
+	etcdcli *clientv3.Client
+}
 
+// lockedConnector serializes requests to a connector, so it could be shared
+// between goroutines.
+type lockedConnector struct {
+	connector.Connector
+	mutex *sync.Mutex
+}
+
+// Eval passes Lua expression for evaluation.
+func (conn lockedConnector) Eval(expr string, args []any,
+	opts connector.RequestOpts) ([]any, error) {
+	conn.mutex.Lock()
+	defer conn.mutex.Unlock()
+	return conn.Connector.Eval(expr, args, opts)
+}
+
+// connectStorage establishes a connection to tarantool config storage or to
+// etcd based on UriOpts. The connection could be shared between goroutines.
+func connectStorage(opts UriOpts, connOpts connectOpts) (storageConn, error) {
 	conn, errTarantool := connectTarantool(opts, connOpts)
 	if errTarantool == nil {
-		var (
-			publisher cluster.DataPublisher
-			collector cluster.Collector
-			err       error
-		)
+		return storageConn{
+			conn: lockedConnector{Connector: conn, mutex: &sync.Mutex{}},
+		}, nil
+	}
+
+	etcdcli, errEtcd := connectEtcd(opts, connOpts)
+	if errEtcd == nil {
+		return storageConn{etcdcli: etcdcli}, nil
+	}
+
+	return storageConn{},
+		fmt.Errorf("failed to establish a connection to tarantool or etcd: %w, %w",
+			errTarantool, errEtcd)
+}
+
+// Close closes the connection.
+func (storage storageConn) Close() {
+	if storage.conn != nil {
+		storage.conn.Close()
+	}
+	if storage.etcdcli != nil {
+		storage.etcdcli.Close()
+	}
+}
+
+// createPublisherAndCollector creates a new data publisher and collector for
+// the prefix and the key over the connection. A publisher or a collector is
+// not created if the factory is nil.
+func (storage storageConn) createPublisherAndCollector(
+	publishers cluster.DataPublisherFactory,
+	collectors cluster.CollectorFactory,
+	prefix, key string,
+	timeout time.Duration) (cluster.DataPublisher, cluster.Collector, error) {
+	var (
+		publisher cluster.DataPublisher
+		collector cluster.Collector
+		err       error
+	)
+
+	if storage.conn != nil {
 		if publishers != nil {
-			publisher, err = publishers.NewTarantool(conn, prefix, key, timeout)
+			publisher, err = publishers.NewTarantool(storage.conn, prefix, key, timeout)
 			if err != nil {
-				return nil, nil, nil,
+				return nil, nil,
 					fmt.Errorf("failed to create tarantool config storage publisher: %w", err)
 			}
 		}
 
 		if collectors != nil {
-			collector, err = collectors.NewTarantool(conn, prefix, key, timeout)
+			collector, err = collectors.NewTarantool(storage.conn, prefix, key, timeout)
 			if err != nil {
-				return nil, nil, nil,
+				return nil, nil,
 					fmt.Errorf("failed to create tarantool config storage collector: %w", err)
 			}
 		}
-		return publisher, collector, func() { conn.Close() }, nil
+		return publisher, collector, nil
 	}
 
-	etcdcli, errEtcd := connectEtcd(opts, connOpts)
-	if errEtcd == nil {
-		var (
-			publisher cluster.DataPublisher
-			collector cluster.Collector
-			err       error
-		)
-		if publishers != nil {
-			publisher, err = publishers.NewEtcd(etcdcli, prefix, key, timeout)
-			if err != nil {
-				return nil, nil, nil,
-					fmt.Errorf("failed to create etcd publisher: %w", err)
-			}
+	if publishers != nil {
+		publisher, err = publishers.NewEtcd(storage.etcdcli, prefix, key, timeout)
+		if err != nil {
+			return nil, nil,
+				fmt.Errorf("failed to create etcd publisher: %w", err)
 		}
+	}
 
-		if collectors != nil {
-			collector, err = collectors.NewEtcd(etcdcli, prefix, key, timeout)
-			if err != nil {
-				return nil, nil, nil,
-					fmt.Errorf("failed to create etcd collector: %w", err)
-			}
+	if collectors != nil {
+		collector, err = collectors.NewEtcd(storage.etcdcli, prefix, key, timeout)
+		if err != nil {
+			return nil, nil,
+				fmt.Errorf("failed to create etcd collector: %w", err)
 		}
-		return publisher, collector, func() { etcdcli.Close() }, nil
+	}
+	return publisher, collector, nil
+}
+
+// createPublisher creates a new data publisher and collector based on UriOpts.
+func createPublisherAndCollector(
+	publishers cluster.DataPublisherFactory,
+	collectors cluster.CollectorFactory,
+	connOpts connectOpts,
+	opts UriOpts) (cluster.DataPublisher, cluster.Collector, func(), error) {
+	storage, err := connectStorage(opts, connOpts)
+	if err != nil {
+		return nil, nil, nil, err
 	}
 
-	return nil, nil, nil,
-		fmt.Errorf("failed to establish a connection to tarantool or etcd: %w, %w",
-			errTarantool, errEtcd)
+	publisher, collector, err := storage.createPublisherAndCollector(
+		publishers, collectors, opts.Prefix, opts.Key, opts.Timeout)
+	if err != nil {
+		storage.Close()
+		return nil, nil, nil, err
+	}
+	return publisher, collector, storage.Close, nil
 }
@@ -1,6 +1,7 @@
 package cluster
 
 import (
+	"sync"
 	"time"
 
 	clientv3 "go.etcd.io/etcd/client/v3"
@@ -22,13 +23,39 @@ type CollectorFactory interface {
 }
 
 // collectorsFactory is a type that implements a default CollectorFactory.
-type collectorsFactory struct{}
+type collectorsFactory struct {
+	// cached is true if etcd collectors for a whole prefix are shared
+	// within a process and cache data.
+	cached bool
+}
+
+// etcdCacheKey identifies a shared etcd cache.
+type etcdCacheKey struct {
+	etcdcli *clientv3.Client
+	prefix  string
+	timeout time.Duration
+}
+
+var (
+	// sharedEtcdCaches contains process-wide etcd caches.
+	sharedEtcdCaches = map[etcdCacheKey]*EtcdAllCache{}
+	// sharedEtcdCachesMutex protects sharedEtcdCaches.
+	sharedEtcdCachesMutex sync.Mutex
+)
 
 // NewCollectorFactory creates a new CollectorFactory.
 func NewCollectorFactory() CollectorFactory {
 	return collectorsFactory{}
 }
 
+// NewCachedCollectorFactory creates a new CollectorFactory that shares etcd
+// collectors for a whole prefix within a process. The collectors are kept up
+// to date with etcd watches, so it is useful for long-running processes that
+// collect a configuration repeatedly.
+func NewCachedCollectorFactory() CollectorFactory {
+	return collectorsFactory{cached: true}
+}
+
 // NewFiler creates a new file configuration collector.
 func (factory collectorsFactory) NewFile(path string) (Collector, error) {
 	return NewFileCollector(path), nil
@@ -38,11 +65,30 @@ func (factory collectorsFactory) NewFile(path string) (Collector, error) {
 func (factory collectorsFactory) NewEtcd(etcdcli *clientv3.Client,
 	prefix, key string, timeout time.Duration) (Collector, error) {
 	if key == "" {
-		return NewEtcdAllCollector(etcdcli, prefix, timeout), nil
+		if factory.cached {
+			return getSharedEtcdCache(etcdcli, prefix, timeout), nil
+		}
+		return NewEtcdPagedCollector(etcdcli, prefix, DefaultEtcdPageSize, timeout), nil
 	}
 	return NewEtcdKeyCollector(etcdcli, prefix, key, timeout), nil
 }
 
+// getSharedEtcdCache returns a process-wide etcd cache for the arguments.
+func getSharedEtcdCache(etcdcli *clientv3.Client,
+	prefix string, timeout time.Duration) *EtcdAllCache {
+	key := etcdCacheKey{etcdcli: etcdcli, prefix: prefix, timeout: timeout}
+
+	sharedEtcdCachesMutex.Lock()
+	defer sharedEtcdCachesMutex.Unlock()
+
+	cache, ok := sharedEtcdCaches[key]
+	if !ok {
+		cache = NewEtcdAllCache(etcdcli, prefix, timeout)
+		sharedEtcdCaches[key] = cache
+	}
+	return cache
+}
+
 // NewTarantool creates creates a new tarantool config storage configuration
 // collector.
 func (factory collectorsFactory) NewTarantool(conn connector.Connector,
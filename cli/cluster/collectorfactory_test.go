@@ -34,7 +34,8 @@ func TestCollectorFactory(t *testing.T) {
 		{
 			Name:      "etcd_all",
 			Collector: noErr(factory.NewEtcd(etcdcli, "foo", "", 1)),
-			Expected:  cluster.NewEtcdAllCollector(etcdcli, "foo", 1),
+			Expected: cluster.NewEtcdPagedCollector(etcdcli, "foo",
+				cluster.DefaultEtcdPageSize, 1),
 		},
 		{
 			Name:      "etcd_key",
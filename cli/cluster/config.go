@@ -203,14 +203,76 @@ func (config *Config) ForEach(path []string, fun func(path []string, value any))
 	}
 }
 
+// copyMergeValue returns a copy of a low priority value to set it into
+// a high priority configuration. Maps are copied recursively without values
+// with non-string keys and nil values. It returns nil if there is nothing
+// to set.
+func copyMergeValue(value any) any {
+	src, ok := value.(map[any]any)
+	if !ok {
+		return value
+	}
+	if len(src) == 0 {
+		// It is a value itself.
+		return make(map[any]any)
+	}
+
+	dst := make(map[any]any, len(src))
+	for k, v := range src {
+		if _, ok := k.(string); !ok {
+			continue
+		}
+		if v = copyMergeValue(v); v != nil {
+			dst[k] = v
+		}
+	}
+	if len(dst) == 0 {
+		return nil
+	}
+	return dst
+}
+
+// mergeMaps merges a low priority map into a high priority map recursively.
+// A value from the low priority map is set only if the high priority map
+// has not a value for the key. Maps are merged deeply.
+func mergeMaps(high, low map[any]any) {
+	for k, lowValue := range low {
+		if _, ok := k.(string); !ok || lowValue == nil {
+			continue
+		}
+
+		highValue := high[k]
+		if highValue == nil {
+			if value := copyMergeValue(lowValue); value != nil {
+				high[k] = value
+			}
+		} else if highMap, ok := highValue.(map[any]any); ok {
+			if lowMap, ok := lowValue.(map[any]any); ok && len(lowMap) > 0 {
+				mergeMaps(highMap, lowMap)
+			}
+		}
+	}
+}
+
 // Merge merges a configuration to the current. The outside configuration has
 // a low priority.
 func (config *Config) Merge(low *Config) {
-	low.ForEach(nil, func(path []string, value any) {
-		if _, err := config.Get(path); err != nil {
-			config.Set(path, value)
+	if low.paths == nil {
+		return
+	}
+
+	if config.paths == nil {
+		if value := copyMergeValue(low.paths); value != nil {
+			config.paths = value
 		}
-	})
+		return
+	}
+
+	highMap, highOk := config.paths.(map[any]any)
+	lowMap, lowOk := low.paths.(map[any]any)
+	if highOk && lowOk {
+		mergeMaps(highMap, lowMap)
+	}
 }
 
 // UnmarshalYAML helps to unmarshal the configuration from a YAML document.
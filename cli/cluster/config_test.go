@@ -379,3 +379,54 @@ func TestConfig_merge_data_and_empty_instances(t *testing.T) {
 		})
 	}
 }
+
+// makeBenchmarkConfig creates a cluster configuration with the instances
+// amount.
+func makeBenchmarkConfig(b *testing.B, instances int, value any) *cluster.Config {
+	const (
+		groups      = 10
+		replicasets = 10
+	)
+
+	config := cluster.NewConfig()
+	for i := 0; i < instances; i++ {
+		path := []string{
+			"groups", fmt.Sprintf("group-%03d", i%groups),
+			"replicasets", fmt.Sprintf("replicaset-%03d", i/groups%replicasets),
+			"instances", fmt.Sprintf("instance-%04d", i),
+		}
+		leaves := [][]string{
+			[]string{"iproto", "listen", "uri"},
+			[]string{"iproto", "advertise", "peer", "login"},
+			[]string{"database", "mode"},
+			[]string{"memtx", "memory"},
+			[]string{"log", "level"},
+			[]string{"roles_cfg", "foo", "bar"},
+		}
+		for _, leaf := range leaves {
+			err := config.Set(append(append([]string{}, path...), leaf...), value)
+			require.NoError(b, err)
+		}
+	}
+	return config
+}
+
+func BenchmarkConfig_Merge_empty(b *testing.B) {
+	low := makeBenchmarkConfig(b, 1000, 1)
+
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		high := cluster.NewConfig()
+		high.Merge(low)
+	}
+}
+
+func BenchmarkConfig_Merge_overlap(b *testing.B) {
+	high := makeBenchmarkConfig(b, 1000, 1)
+	low := makeBenchmarkConfig(b, 1000, 2)
+
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		high.Merge(low)
+	}
+}
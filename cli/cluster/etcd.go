@@ -8,9 +8,12 @@ import (
 	"io/fs"
 	"os"
 	"path/filepath"
+	"sort"
 	"strings"
+	"sync"
 	"time"
 
+	"go.etcd.io/etcd/api/v3/mvccpb"
 	"go.etcd.io/etcd/client/pkg/v3/transport"
 	clientv3 "go.etcd.io/etcd/client/v3"
 	"go.uber.org/zap"
@@ -83,12 +86,64 @@ func ConnectEtcd(opts EtcdOpts) (*clientv3.Client, error) {
 	})
 }
 
+var (
+	// sharedEtcdClients contains process-wide etcd clients per options.
+	sharedEtcdClients = map[string]*clientv3.Client{}
+	// sharedEtcdClientsMutex protects sharedEtcdClients.
+	sharedEtcdClientsMutex sync.Mutex
+)
+
+// ConnectEtcdShared returns a process-wide etcd client for the specified
+// options. A new client is created only on the first call for the options,
+// next calls return the same client. The client must not be closed by
+// a caller.
+func ConnectEtcdShared(opts EtcdOpts) (*clientv3.Client, error) {
+	key := fmt.Sprintf("%#v", opts)
+
+	sharedEtcdClientsMutex.Lock()
+	defer sharedEtcdClientsMutex.Unlock()
+
+	if etcdcli, ok := sharedEtcdClients[key]; ok {
+		return etcdcli, nil
+	}
+
+	etcdcli, err := ConnectEtcd(opts)
+	if err != nil {
+		return nil, err
+	}
+	sharedEtcdClients[key] = etcdcli
+	return etcdcli, nil
+}
+
 // EtcdGetter is the interface that wraps get from etcd method.
 type EtcdGetter interface {
 	// Get retrieves key-value pairs for a key.
 	Get(ctx context.Context, key string, opts ...clientv3.OpOption) (*clientv3.GetResponse, error)
 }
 
+// etcdKvsValues returns values of the key-value pairs.
+func etcdKvsValues(kvs []*mvccpb.KeyValue) [][]byte {
+	values := make([][]byte, len(kvs))
+	for i, kv := range kvs {
+		values[i] = kv.Value
+	}
+	return values
+}
+
+// mergeEtcdKvs decodes values of the key-value pairs concurrently and merges
+// them into the configuration in the order of the pairs.
+func mergeEtcdKvs(cconfig *Config, kvs []*mvccpb.KeyValue) error {
+	configs, errs := collectYamls(etcdKvsValues(kvs))
+	for i, kv := range kvs {
+		if errs[i] != nil {
+			fmtErr := "failed to decode etcd config for key %q: %w"
+			return fmt.Errorf(fmtErr, string(kv.Key), errs[i])
+		}
+		cconfig.Merge(configs[i])
+	}
+	return nil
+}
+
 // EtcdAllCollector collects data from a etcd connection for a whole prefix.
 type EtcdAllCollector struct {
 	getter  EtcdGetter
@@ -127,18 +182,298 @@ func (collector EtcdAllCollector) Collect() (*Config, error) {
 			prefix)
 	}
 
-	for _, kv := range resp.Kvs {
-		if config, err := NewYamlCollector(kv.Value).Collect(); err != nil {
-			fmtErr := "failed to decode etcd config for key %q: %w"
-			return nil, fmt.Errorf(fmtErr, string(kv.Key), err)
-		} else {
-			cconfig.Merge(config)
+	if err := mergeEtcdKvs(cconfig, resp.Kvs); err != nil {
+		return nil, err
+	}
+
+	return cconfig, nil
+}
+
+// DefaultEtcdPageSize is a default count of keys fetched from etcd by
+// a single request.
+const DefaultEtcdPageSize = 1000
+
+// getEtcdPrefixPaged fetches key-value pairs for the prefix page by page in
+// the key order. All pages are fetched at the revision of the first page, so
+// the result is consistent. The handler is called for each page. It returns
+// the revision of the data.
+func getEtcdPrefixPaged(ctx context.Context, getter EtcdGetter,
+	prefix string, pageSize int64,
+	handler func(kvs []*mvccpb.KeyValue) error) (int64, error) {
+	end := clientv3.GetPrefixRangeEnd(prefix)
+	key := prefix
+	var rev int64
+
+	for {
+		opts := []clientv3.OpOption{
+			clientv3.WithRange(end),
+			clientv3.WithLimit(pageSize),
+		}
+		if rev != 0 {
+			opts = append(opts, clientv3.WithRev(rev))
+		}
+
+		resp, err := getter.Get(ctx, key, opts...)
+		if err != nil {
+			return 0, fmt.Errorf("failed to fetch data from etcd: %w", err)
+		}
+		if rev == 0 && resp.Header != nil {
+			rev = resp.Header.Revision
+		}
+		if err := handler(resp.Kvs); err != nil {
+			return 0, err
+		}
+
+		if !resp.More || len(resp.Kvs) == 0 {
+			return rev, nil
 		}
+		// The next page starts right after the last key.
+		key = string(resp.Kvs[len(resp.Kvs)-1].Key) + "\x00"
+	}
+}
+
+// EtcdPagedCollector collects data from a etcd connection for a whole prefix
+// page by page. It does not hit etcd request size limits and decodes each
+// page as it arrives.
+type EtcdPagedCollector struct {
+	getter   EtcdGetter
+	prefix   string
+	pageSize int64
+	timeout  time.Duration
+}
+
+// NewEtcdPagedCollector creates a new paged collector for etcd from the whole
+// prefix.
+func NewEtcdPagedCollector(getter EtcdGetter, prefix string, pageSize int64,
+	timeout time.Duration) EtcdPagedCollector {
+	return EtcdPagedCollector{
+		getter:   getter,
+		prefix:   prefix,
+		pageSize: pageSize,
+		timeout:  timeout,
+	}
+}
+
+// Collect collects a configuration from the specified prefix with the
+// specified timeout for the whole collection.
+func (collector EtcdPagedCollector) Collect() (*Config, error) {
+	prefix := getConfigPrefix(collector.prefix)
+	ctx := context.Background()
+	if collector.timeout != 0 {
+		var cancel context.CancelFunc
+		ctx, cancel = context.WithTimeout(ctx, collector.timeout)
+		defer cancel()
+	}
+
+	cconfig := NewConfig()
+	found := false
+	_, err := getEtcdPrefixPaged(ctx, collector.getter, prefix, collector.pageSize,
+		func(kvs []*mvccpb.KeyValue) error {
+			found = found || len(kvs) > 0
+			return mergeEtcdKvs(cconfig, kvs)
+		})
+	if err != nil {
+		return nil, err
 	}
 
+	if !found {
+		return nil, fmt.Errorf("a configuration data not found in etcd for prefix %q",
+			prefix)
+	}
 	return cconfig, nil
 }
 
+// EtcdGetWatcher is the interface that adds Watch method to EtcdGetter.
+type EtcdGetWatcher interface {
+	EtcdGetter
+	// Watch watches on a key or a prefix.
+	Watch(ctx context.Context, key string,
+		opts ...clientv3.OpOption) clientv3.WatchChan
+}
+
+// etcdCacheEntry is a decoded value of a key.
+type etcdCacheEntry struct {
+	// config is a decoded configuration.
+	config *Config
+	// err is a decoding error.
+	err error
+}
+
+// EtcdAllCache collects data from a etcd connection for a whole prefix and
+// caches it. It reads the whole prefix once and then keeps the data up to
+// date with a watch from the revision of the read, so a repeated collection
+// does not read the prefix again.
+type EtcdAllCache struct {
+	getter  EtcdGetWatcher
+	prefix  string
+	timeout time.Duration
+
+	// mutex protects fields below.
+	mutex sync.Mutex
+	// entries are decoded values per a key.
+	entries map[string]etcdCacheEntry
+	// valid is true if the data is kept up to date by the watch.
+	valid bool
+	// generation is incremented on each read of the whole prefix. It helps
+	// to ignore events from previous watches.
+	generation int
+	// cancel stops the current watch.
+	cancel context.CancelFunc
+}
+
+// NewEtcdAllCache creates a new cached collector for etcd from the whole
+// prefix.
+func NewEtcdAllCache(getter EtcdGetWatcher, prefix string,
+	timeout time.Duration) *EtcdAllCache {
+	return &EtcdAllCache{
+		getter:  getter,
+		prefix:  prefix,
+		timeout: timeout,
+	}
+}
+
+// newEtcdCacheEntry creates a cache entry for a decoded value of a key.
+func newEtcdCacheEntry(key string, config *Config, err error) etcdCacheEntry {
+	if err != nil {
+		fmtErr := "failed to decode etcd config for key %q: %w"
+		return etcdCacheEntry{err: fmt.Errorf(fmtErr, key, err)}
+	}
+	return etcdCacheEntry{config: config}
+}
+
+// decodeEtcdCacheEntry decodes a value of a key.
+func decodeEtcdCacheEntry(key string, value []byte) etcdCacheEntry {
+	config, err := NewYamlCollector(value).Collect()
+	return newEtcdCacheEntry(key, config, err)
+}
+
+// load reads the whole prefix and starts a watch from the revision of the
+// read. It must be called under the mutex.
+func (cache *EtcdAllCache) load() error {
+	if cache.cancel != nil {
+		cache.cancel()
+		cache.cancel = nil
+	}
+	cache.generation++
+
+	prefix := getConfigPrefix(cache.prefix)
+	ctx := context.Background()
+	if cache.timeout != 0 {
+		var cancel context.CancelFunc
+		ctx, cancel = context.WithTimeout(ctx, cache.timeout)
+		defer cancel()
+	}
+
+	entries := map[string]etcdCacheEntry{}
+	rev, err := getEtcdPrefixPaged(ctx, cache.getter, prefix, DefaultEtcdPageSize,
+		func(kvs []*mvccpb.KeyValue) error {
+			configs, errs := collectYamls(etcdKvsValues(kvs))
+			for i, kv := range kvs {
+				key := string(kv.Key)
+				entries[key] = newEtcdCacheEntry(key, configs[i], errs[i])
+			}
+			return nil
+		})
+	if err != nil {
+		return err
+	}
+	cache.entries = entries
+
+	opts := []clientv3.OpOption{clientv3.WithPrefix()}
+	if rev != 0 {
+		opts = append(opts, clientv3.WithRev(rev+1))
+	}
+	watchCtx, cancel := context.WithCancel(context.Background())
+	watchChan := cache.getter.Watch(clientv3.WithRequireLeader(watchCtx), prefix, opts...)
+
+	cache.cancel = cancel
+	cache.valid = true
+	go cache.watch(watchChan, cache.generation)
+
+	return nil
+}
+
+// watch applies events from the watch channel to the cache. The cache
+// becomes invalid if the watch fails or stops.
+func (cache *EtcdAllCache) watch(watchChan clientv3.WatchChan, generation int) {
+	for resp := range watchChan {
+		cache.mutex.Lock()
+		if cache.generation != generation {
+			cache.mutex.Unlock()
+			return
+		}
+		if resp.Err() != nil {
+			cache.valid = false
+			cache.mutex.Unlock()
+			return
+		}
+		for _, event := range resp.Events {
+			key := string(event.Kv.Key)
+			switch event.Type {
+			case clientv3.EventTypePut:
+				cache.entries[key] = decodeEtcdCacheEntry(key, event.Kv.Value)
+			case clientv3.EventTypeDelete:
+				delete(cache.entries, key)
+			}
+		}
+		cache.mutex.Unlock()
+	}
+
+	cache.mutex.Lock()
+	if cache.generation == generation {
+		cache.valid = false
+	}
+	cache.mutex.Unlock()
+}
+
+// Collect collects a configuration from the specified prefix. The prefix is
+// read from etcd only on the first call or if the watch has failed.
+func (cache *EtcdAllCache) Collect() (*Config, error) {
+	cache.mutex.Lock()
+	defer cache.mutex.Unlock()
+
+	if !cache.valid {
+		if err := cache.load(); err != nil {
+			return nil, err
+		}
+	}
+
+	if len(cache.entries) == 0 {
+		return nil, fmt.Errorf("a configuration data not found in etcd for prefix %q",
+			getConfigPrefix(cache.prefix))
+	}
+
+	keys := make([]string, 0, len(cache.entries))
+	for key := range cache.entries {
+		keys = append(keys, key)
+	}
+	sort.Strings(keys)
+
+	cconfig := NewConfig()
+	for _, key := range keys {
+		entry := cache.entries[key]
+		if entry.err != nil {
+			return nil, entry.err
+		}
+		cconfig.Merge(entry.config)
+	}
+
+	return cconfig, nil
+}
+
+// Close stops the watch.
+func (cache *EtcdAllCache) Close() {
+	cache.mutex.Lock()
+	defer cache.mutex.Unlock()
+
+	if cache.cancel != nil {
+		cache.cancel()
+		cache.cancel = nil
+	}
+	cache.valid = false
+	cache.generation++
+}
+
 // EtcdKeyCollector collects data from a etcd connection for a whole prefix.
 type EtcdKeyCollector struct {
 	getter  EtcdGetter
@@ -301,6 +636,124 @@ func (publisher EtcdAllDataPublisher) Publish(data []byte) error {
 	return nil
 }
 
+// EtcdDiffDataPublisher publishes a data into etcd to a prefix or to a key
+// of the prefix. It writes only changes: the value is put only if it differs
+// from the stored one and other keys of the prefix are deleted only if they
+// exist. All changes are made in a single transaction guarded by revisions of
+// the read data.
+type EtcdDiffDataPublisher struct {
+	getter  EtcdTxnGetter
+	prefix  string
+	key     string
+	timeout time.Duration
+}
+
+// NewEtcdDiffDataPublisher creates a new EtcdDiffDataPublisher object to
+// publish a data to etcd with the prefix and the key during the timeout. The
+// data is published to the whole prefix if the key is empty.
+func NewEtcdDiffDataPublisher(getter EtcdTxnGetter,
+	prefix, key string, timeout time.Duration) EtcdDiffDataPublisher {
+	return EtcdDiffDataPublisher{
+		getter:  getter,
+		prefix:  prefix,
+		key:     key,
+		timeout: timeout,
+	}
+}
+
+// etcdDiff returns comparisons and operations of a transaction that puts
+// the value into the key and deletes other read keys. The comparisons ensure
+// that the read data has not been changed. There are no operations if the
+// data is already up to date.
+func etcdDiff(resp *clientv3.GetResponse, prefix, key, value string) ([]clientv3.Cmp,
+	[]clientv3.Op) {
+	var (
+		cmps  []clientv3.Cmp
+		ops   []clientv3.Op
+		found bool
+	)
+	for _, kv := range resp.Kvs {
+		kvKey := string(kv.Key)
+		cmps = append(cmps, clientv3.Compare(clientv3.ModRevision(kvKey), "=",
+			kv.ModRevision))
+		if kvKey == key {
+			found = true
+			if string(kv.Value) != value {
+				ops = append(ops, clientv3.OpPut(key, value))
+			}
+		} else {
+			ops = append(ops, clientv3.OpDelete(kvKey))
+		}
+	}
+	if !found {
+		cmps = append(cmps, clientv3.Compare(clientv3.Version(key), "=", 0))
+		ops = append(ops, clientv3.OpPut(key, value))
+	}
+	if prefix != "" && resp.Header != nil {
+		// No new keys with the prefix.
+		cmp := clientv3.Compare(clientv3.ModRevision(prefix), "<",
+			resp.Header.Revision+1).WithPrefix()
+		cmps = append(cmps, cmp)
+	}
+	return cmps, ops
+}
+
+// Publish publishes the configuration into etcd to the given prefix or to
+// the given key.
+func (publisher EtcdDiffDataPublisher) Publish(data []byte) error {
+	if data == nil {
+		return fmt.Errorf("failed to publish data into etcd: data does not exist")
+	}
+
+	prefix := getConfigPrefix(publisher.prefix)
+	key := prefix + "all"
+	if publisher.key != "" {
+		key = prefix + publisher.key
+	}
+	ctx := context.Background()
+	if publisher.timeout != 0 {
+		var cancel context.CancelFunc
+		ctx, cancel = context.WithTimeout(ctx, publisher.timeout)
+		defer cancel()
+	}
+
+	for {
+		select {
+		case <-ctx.Done():
+			return ctx.Err()
+		default:
+		}
+
+		var (
+			resp *clientv3.GetResponse
+			err  error
+		)
+		rangePrefix := ""
+		if publisher.key == "" {
+			rangePrefix = prefix
+			resp, err = publisher.getter.Get(ctx, prefix, clientv3.WithPrefix())
+		} else {
+			resp, err = publisher.getter.Get(ctx, key)
+		}
+		if err != nil {
+			return fmt.Errorf("failed to fetch data from etcd: %w", err)
+		}
+
+		cmps, ops := etcdDiff(resp, rangePrefix, key, string(data))
+		if len(ops) == 0 {
+			return nil
+		}
+
+		tresp, err := publisher.getter.Txn(ctx).If(cmps...).Then(ops...).Commit()
+		if err != nil {
+			return fmt.Errorf("failed to put data into etcd: %w", err)
+		}
+		if tresp != nil && tresp.Succeeded {
+			return nil
+		}
+	}
+}
+
 // EtcdPutter is the interface that wraps put from etcd method.
 type EtcdPutter interface {
 	// Put puts a key-value pair into etcd.
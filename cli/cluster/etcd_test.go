@@ -8,6 +8,7 @@ import (
 
 	"github.com/stretchr/testify/assert"
 	"github.com/stretchr/testify/require"
+	"go.etcd.io/etcd/api/v3/etcdserverpb"
 	"go.etcd.io/etcd/api/v3/mvccpb"
 	clientv3 "go.etcd.io/etcd/client/v3"
 
@@ -211,6 +212,34 @@ func TestEtcdAllCollector_Collect_merge(t *testing.T) {
 	}
 }
 
+func TestEtcdAllCollector_Collect_many(t *testing.T) {
+	kvs := []*mvccpb.KeyValue{}
+	for i := 0; i < 100; i++ {
+		kvs = append(kvs, &mvccpb.KeyValue{
+			Key:   []byte(fmt.Sprintf("k%03d", i)),
+			Value: []byte(fmt.Sprintf("f: %d\nk%03d: %d\n", i, i, i)),
+		})
+	}
+	mock := &MockEtcdGetter{
+		Kvs: kvs,
+	}
+
+	config, err := cluster.NewEtcdAllCollector(mock, "foo", 0).Collect()
+	require.NoError(t, err)
+	value, err := config.Get([]string{"f"})
+	require.NoError(t, err)
+	assert.Equal(t, 0, value)
+	value, err = config.Get([]string{"k099"})
+	require.NoError(t, err)
+	assert.Equal(t, 99, value)
+
+	kvs[70].Value = []byte("f: a\n- b\n")
+	kvs[50].Value = []byte("f: a\n- b\n")
+	config, err = cluster.NewEtcdAllCollector(mock, "foo", 0).Collect()
+	assert.Nil(t, config)
+	assert.ErrorContains(t, err, `failed to decode etcd config for key "k050"`)
+}
+
 func TestEtcdCollectors_Collect_error(t *testing.T) {
 	mock := &MockEtcdGetter{
 		Err: fmt.Errorf("any"),
@@ -276,6 +305,217 @@ func TestEtcdAllCollector_Collect_decode_error(t *testing.T) {
 	}
 }
 
+type MockEtcdPagedGetter struct {
+	cluster.EtcdGetter
+	Kvs   []*mvccpb.KeyValue
+	Limit int
+	Keys  []string
+	Revs  []int64
+}
+
+func (g *MockEtcdPagedGetter) Get(ctx context.Context, key string,
+	opts ...clientv3.OpOption) (*clientv3.GetResponse, error) {
+	op := clientv3.OpGet(key, opts...)
+	g.Keys = append(g.Keys, key)
+	g.Revs = append(g.Revs, op.Rev())
+
+	resp := &clientv3.GetResponse{
+		Header: &etcdserverpb.ResponseHeader{Revision: 10},
+	}
+	for _, kv := range g.Kvs {
+		if string(kv.Key) < key || string(kv.Key) >= string(op.RangeBytes()) {
+			continue
+		}
+		if len(resp.Kvs) == g.Limit {
+			resp.More = true
+			break
+		}
+		resp.Kvs = append(resp.Kvs, kv)
+	}
+	return resp, nil
+}
+
+func TestNewEtcdPagedCollector(t *testing.T) {
+	var collector cluster.Collector
+
+	collector = cluster.NewEtcdPagedCollector(&MockEtcdPagedGetter{}, "", 1, 0)
+	assert.NotNil(t, collector)
+}
+
+func TestEtcdPagedCollector_Collect_pages(t *testing.T) {
+	mock := &MockEtcdPagedGetter{
+		Kvs: []*mvccpb.KeyValue{
+			&mvccpb.KeyValue{
+				Key:   []byte("/foo/config/a"),
+				Value: []byte("foo: 1\nbar: 1"),
+			},
+			&mvccpb.KeyValue{
+				Key:   []byte("/foo/config/b"),
+				Value: []byte("foo: 2\nzoo: 2"),
+			},
+			&mvccpb.KeyValue{
+				Key:   []byte("/foo/config/c"),
+				Value: []byte("zoo: 3\nbaz: 3"),
+			},
+			&mvccpb.KeyValue{
+				Key:   []byte("/foo/config0"),
+				Value: []byte("any: 4"),
+			},
+		},
+		Limit: 2,
+	}
+
+	config, err := cluster.NewEtcdPagedCollector(mock, "/foo", 2, 0).Collect()
+	require.NoError(t, err)
+	assert.Equal(t, `bar: 1
+baz: 3
+foo: 1
+zoo: 2
+`, config.String())
+	assert.Equal(t, []string{"/foo/config/", "/foo/config/b\x00"}, mock.Keys)
+	assert.Equal(t, []int64{0, 10}, mock.Revs)
+}
+
+func TestEtcdPagedCollector_Collect_empty(t *testing.T) {
+	mock := &MockEtcdPagedGetter{Limit: 2}
+
+	config, err := cluster.NewEtcdPagedCollector(mock, "/foo", 2, 0).Collect()
+	assert.Nil(t, config)
+	assert.EqualError(t, err,
+		`a configuration data not found in etcd for prefix "/foo/config/"`)
+}
+
+func TestEtcdPagedCollector_Collect_decode_error(t *testing.T) {
+	mock := &MockEtcdPagedGetter{
+		Kvs: []*mvccpb.KeyValue{
+			&mvccpb.KeyValue{
+				Key:   []byte("/foo/config/a"),
+				Value: []byte("foo: 1"),
+			},
+			&mvccpb.KeyValue{
+				Key:   []byte("/foo/config/b"),
+				Value: []byte("f: a\n- b\n"),
+			},
+		},
+		Limit: 1,
+	}
+
+	config, err := cluster.NewEtcdPagedCollector(mock, "/foo", 1, 0).Collect()
+	assert.Nil(t, config)
+	assert.ErrorContains(t, err,
+		`failed to decode etcd config for key "/foo/config/b"`)
+}
+
+type MockEtcdGetWatcher struct {
+	MockEtcdGetter
+	Gets      int
+	WatchChan chan clientv3.WatchResponse
+	WatchKey  string
+	WatchOpts []clientv3.OpOption
+}
+
+func (w *MockEtcdGetWatcher) Get(ctx context.Context, key string,
+	opts ...clientv3.OpOption) (*clientv3.GetResponse, error) {
+	w.Gets++
+	return w.MockEtcdGetter.Get(ctx, key, opts...)
+}
+
+func (w *MockEtcdGetWatcher) Watch(ctx context.Context, key string,
+	opts ...clientv3.OpOption) clientv3.WatchChan {
+	w.WatchKey = key
+	w.WatchOpts = opts
+	w.WatchChan = make(chan clientv3.WatchResponse)
+	return w.WatchChan
+}
+
+func TestNewEtcdAllCache(t *testing.T) {
+	var collector cluster.Collector
+
+	collector = cluster.NewEtcdAllCache(&MockEtcdGetWatcher{}, "", 0)
+	assert.NotNil(t, collector)
+}
+
+func TestEtcdAllCache_Collect_watch(t *testing.T) {
+	mock := &MockEtcdGetWatcher{
+		MockEtcdGetter: MockEtcdGetter{
+			Kvs: []*mvccpb.KeyValue{
+				&mvccpb.KeyValue{
+					Key:   []byte("a"),
+					Value: []byte("foo: 1"),
+				},
+			},
+		},
+	}
+	cache := cluster.NewEtcdAllCache(mock, "/foo", 0)
+	defer cache.Close()
+
+	config, err := cache.Collect()
+	require.NoError(t, err)
+	assert.Equal(t, `foo: 1
+`, config.String())
+	assert.Equal(t, "/foo/config/", mock.Key)
+	assert.Equal(t, "/foo/config/", mock.WatchKey)
+	assert.Len(t, mock.WatchOpts, 1)
+
+	mock.WatchChan <- clientv3.WatchResponse{
+		Events: []*clientv3.Event{
+			&clientv3.Event{
+				Type: clientv3.EventTypePut,
+				Kv: &mvccpb.KeyValue{
+					Key:   []byte("b"),
+					Value: []byte("bar: 2"),
+				},
+			},
+			&clientv3.Event{
+				Type: clientv3.EventTypeDelete,
+				Kv: &mvccpb.KeyValue{
+					Key: []byte("a"),
+				},
+			},
+		},
+	}
+	assert.Eventually(t, func() bool {
+		config, err := cache.Collect()
+		return err == nil && config.String() == "bar: 2\n"
+	}, time.Second, 10*time.Millisecond)
+	assert.Equal(t, 1, mock.Gets)
+}
+
+func TestEtcdAllCache_Collect_watch_closed(t *testing.T) {
+	mock := &MockEtcdGetWatcher{
+		MockEtcdGetter: MockEtcdGetter{
+			Kvs: []*mvccpb.KeyValue{
+				&mvccpb.KeyValue{
+					Key:   []byte("a"),
+					Value: []byte("foo: 1"),
+				},
+			},
+		},
+	}
+	cache := cluster.NewEtcdAllCache(mock, "/foo", 0)
+	defer cache.Close()
+
+	_, err := cache.Collect()
+	require.NoError(t, err)
+
+	close(mock.WatchChan)
+	assert.Eventually(t, func() bool {
+		_, err := cache.Collect()
+		return err == nil && mock.Gets == 2
+	}, time.Second, 10*time.Millisecond)
+}
+
+func TestEtcdAllCache_Collect_empty(t *testing.T) {
+	mock := &MockEtcdGetWatcher{}
+	cache := cluster.NewEtcdAllCache(mock, "/foo", 0)
+	defer cache.Close()
+
+	config, err := cache.Collect()
+	assert.Nil(t, config)
+	assert.EqualError(t, err,
+		`a configuration data not found in etcd for prefix "/foo/config/"`)
+}
+
 func TestNewEtcdKeyCollector(t *testing.T) {
 	var collector cluster.Collector
 
@@ -472,6 +712,125 @@ func TestEtcdAllDataPublisher_Publish_txn_inputs(t *testing.T) {
 	}
 }
 
+func TestEtcdDiffDataPublisher_Publish_txn_inputs(t *testing.T) {
+	cases := []struct {
+		Name    string
+		Key     string
+		Kvs     []*mvccpb.KeyValue
+		Txn     bool
+		IfLen   int
+		Puts    int
+		Deletes int
+	}{
+		{
+			Name:  "no get keys",
+			Txn:   true,
+			IfLen: 1,
+			Puts:  1,
+		},
+		{
+			Name: "same value",
+			Kvs: []*mvccpb.KeyValue{
+				&mvccpb.KeyValue{
+					Key:   []byte("/foo/config/all"),
+					Value: []byte("data"),
+				},
+			},
+		},
+		{
+			Name: "new value",
+			Kvs: []*mvccpb.KeyValue{
+				&mvccpb.KeyValue{
+					Key:   []byte("/foo/config/all"),
+					Value: []byte("old"),
+				},
+			},
+			Txn:   true,
+			IfLen: 1,
+			Puts:  1,
+		},
+		{
+			Name: "same value with other keys",
+			Kvs: []*mvccpb.KeyValue{
+				&mvccpb.KeyValue{
+					Key: []byte("/foo/config/a"),
+				},
+				&mvccpb.KeyValue{
+					Key:   []byte("/foo/config/all"),
+					Value: []byte("data"),
+				},
+				&mvccpb.KeyValue{
+					Key: []byte("/foo/config/b"),
+				},
+			},
+			Txn:     true,
+			IfLen:   3,
+			Deletes: 2,
+		},
+		{
+			Name: "other keys",
+			Kvs: []*mvccpb.KeyValue{
+				&mvccpb.KeyValue{
+					Key: []byte("/foo/config/a"),
+				},
+			},
+			Txn:     true,
+			IfLen:   2,
+			Puts:    1,
+			Deletes: 1,
+		},
+		{
+			Name: "key same value",
+			Key:  "a",
+			Kvs: []*mvccpb.KeyValue{
+				&mvccpb.KeyValue{
+					Key:   []byte("/foo/config/a"),
+					Value: []byte("data"),
+				},
+			},
+		},
+		{
+			Name:  "key no value",
+			Key:   "a",
+			Txn:   true,
+			IfLen: 1,
+			Puts:  1,
+		},
+	}
+
+	for _, tc := range cases {
+		t.Run(tc.Name, func(t *testing.T) {
+			mock := &MockEtcdTxnGetter{
+				MockEtcdGetter: MockEtcdGetter{
+					Kvs: tc.Kvs,
+				},
+			}
+			publisher := cluster.NewEtcdDiffDataPublisher(mock, "/foo", tc.Key, 0)
+			err := publisher.Publish([]byte("data"))
+			require.NoError(t, err)
+
+			if !tc.Txn {
+				assert.Nil(t, mock.TxnRet)
+				return
+			}
+			require.NotNil(t, mock.TxnRet)
+			assert.Len(t, mock.TxnRet.IfCs, tc.IfLen)
+			assert.Len(t, mock.TxnRet.ElseOps, 0)
+
+			puts, deletes := 0, 0
+			for _, op := range mock.TxnRet.ThenOps {
+				if op.IsPut() {
+					puts++
+				} else if op.IsDelete() {
+					deletes++
+				}
+			}
+			assert.Equal(t, tc.Puts, puts)
+			assert.Equal(t, tc.Deletes, deletes)
+		})
+	}
+}
+
 func TestEtcdDataPublishers_Publish_data_nil(t *testing.T) {
 	cases := []struct {
 		Name      string
@@ -318,6 +318,25 @@ func TestConnectEtcd_invalid_endpoint(t *testing.T) {
 	assert.ErrorContains(t, err, "context deadline exceeded")
 }
 
+func TestConnectEtcdShared(t *testing.T) {
+	inst := startEtcd(t, httpEndpoint, etcdOpts{})
+	defer stopEtcd(t, inst)
+
+	opts := cluster.EtcdOpts{Endpoints: []string{httpEndpoint}, Timeout: timeout}
+	etcd, err := cluster.ConnectEtcdShared(opts)
+	require.NoError(t, err)
+	require.NotNil(t, etcd)
+
+	same, err := cluster.ConnectEtcdShared(opts)
+	require.NoError(t, err)
+	assert.Same(t, etcd, same)
+
+	opts.Timeout = 2 * timeout
+	other, err := cluster.ConnectEtcdShared(opts)
+	require.NoError(t, err)
+	assert.NotSame(t, etcd, other)
+}
+
 func TestEtcdCollectors_single(t *testing.T) {
 	inst := startEtcd(t, httpEndpoint, etcdOpts{})
 	defer stopEtcd(t, inst)
@@ -372,6 +391,28 @@ func TestEtcdAllCollector_merge(t *testing.T) {
 	assert.Equal(t, "car", value)
 }
 
+func TestEtcdPagedCollector_merge(t *testing.T) {
+	inst := startEtcd(t, httpEndpoint, etcdOpts{})
+	defer stopEtcd(t, inst)
+
+	endpoints := []string{httpEndpoint}
+	etcd, err := cluster.ConnectEtcd(cluster.EtcdOpts{Endpoints: endpoints})
+	require.NoError(t, err)
+	require.NotNil(t, etcd)
+	defer etcd.Close()
+
+	etcdPut(t, etcd, "/foo/config/a", "foo: bar")
+	etcdPut(t, etcd, "/foo/config/b", "foo: car\nzoo: car")
+	etcdPut(t, etcd, "/foo/config/c", "zoo: foo\nbar: foo")
+
+	config, err := cluster.NewEtcdPagedCollector(etcd, "/foo/", 1, timeout).Collect()
+	require.NoError(t, err)
+	assert.Equal(t, `bar: foo
+foo: bar
+zoo: car
+`, config.String())
+}
+
 func TestEtcdCollectors_empty(t *testing.T) {
 	inst := startEtcd(t, httpEndpoint, etcdOpts{})
 	defer stopEtcd(t, inst)
@@ -37,17 +37,11 @@ func (factory publishersFactory) NewFile(path string) (DataPublisher, error) {
 // NewEtcd creates a new etcd data publisher.
 func (factory publishersFactory) NewEtcd(etcdcli *clientv3.Client,
 	prefix, key string, timeout time.Duration) (DataPublisher, error) {
-	if key == "" {
-		return NewEtcdAllDataPublisher(etcdcli, prefix, timeout), nil
-	}
-	return NewEtcdKeyDataPublisher(etcdcli, prefix, key, timeout), nil
+	return NewEtcdDiffDataPublisher(etcdcli, prefix, key, timeout), nil
 }
 
 // NewTarantool creates creates a new tarantool config storage data publisher.
 func (factory publishersFactory) NewTarantool(conn connector.Connector,
 	prefix, key string, timeout time.Duration) (DataPublisher, error) {
-	if key == "" {
-		return NewTarantoolAllDataPublisher(conn, prefix, timeout), nil
-	}
-	return NewTarantoolKeyDataPublisher(conn, prefix, key, timeout), nil
+	return NewTarantoolDiffDataPublisher(conn, prefix, key, timeout), nil
 }
@@ -34,22 +34,22 @@ func TestDataPublisherFactory(t *testing.T) {
 		{
 			Name:      "etcd_all",
 			Publisher: noErr(factory.NewEtcd(etcdcli, "foo", "", 1)),
-			Expected:  cluster.NewEtcdAllDataPublisher(etcdcli, "foo", 1),
+			Expected:  cluster.NewEtcdDiffDataPublisher(etcdcli, "foo", "", 1),
 		},
 		{
 			Name:      "etcd_key",
 			Publisher: noErr(factory.NewEtcd(etcdcli, "foo", "bar", 2)),
-			Expected:  cluster.NewEtcdKeyDataPublisher(etcdcli, "foo", "bar", 2),
+			Expected:  cluster.NewEtcdDiffDataPublisher(etcdcli, "foo", "bar", 2),
 		},
 		{
 			Name:      "tarantool_all",
 			Publisher: noErr(factory.NewTarantool(conn, "foo", "", 1)),
-			Expected:  cluster.NewTarantoolAllDataPublisher(conn, "foo", 1),
+			Expected:  cluster.NewTarantoolDiffDataPublisher(conn, "foo", "", 1),
 		},
 		{
 			Name:      "tarantool_key",
 			Publisher: noErr(factory.NewTarantool(conn, "foo", "bar", 2)),
-			Expected:  cluster.NewTarantoolKeyDataPublisher(conn, "foo", "bar", 2),
+			Expected:  cluster.NewTarantoolDiffDataPublisher(conn, "foo", "bar", 2),
 		},
 	}
 
@@ -8,19 +8,99 @@ type SchemaPath struct {
 	Validator Validator
 }
 
-// Validate validates a configuration with the schema.
-func Validate(config *Config, schema []SchemaPath) error {
-	var errs []error
+// CompiledTarantoolSchema is the TarantoolSchema compiled into a path trie.
+var CompiledTarantoolSchema = CompileSchema(TarantoolSchema)
+
+// schemaNode is a node of a compiled schema path trie.
+type schemaNode struct {
+	// path is a full path to the node.
+	path []string
+	// validator validates a value for the path, could be nil.
+	validator Validator
+	// children are nodes for nested paths.
+	children map[string]*schemaNode
+}
+
+// CompiledSchema is a validation schema compiled into a path trie. It allows
+// to validate a configuration by walking the configuration and the trie
+// together, so only paths that exist in both are visited.
+type CompiledSchema struct {
+	root *schemaNode
+}
+
+// CompileSchema compiles the validation schema into a path trie.
+func CompileSchema(schema []SchemaPath) CompiledSchema {
+	root := &schemaNode{}
 	for _, p := range schema {
-		if value, err := config.Get(p.Path); err == nil {
-			if _, err := p.Validator.Validate(value); err != nil {
-				errs = append(errs, wrapValidateErrors(p.Path, err))
+		node := root
+		for i, key := range p.Path {
+			child, ok := node.children[key]
+			if !ok {
+				if node.children == nil {
+					node.children = make(map[string]*schemaNode)
+				}
+				child = &schemaNode{path: p.Path[0 : i+1 : i+1]}
+				node.children[key] = child
 			}
+			node = child
 		}
+		node.validator = p.Validator
 	}
 
+	return CompiledSchema{root: root}
+}
+
+// validateNode validates the value and nested values with the node and its
+// children. It returns the errors with appended validation errors.
+func validateNode(node *schemaNode, value any, errs []error) []error {
+	if value == nil {
+		return errs
+	}
+
+	if node.validator != nil {
+		if _, err := node.validator.Validate(value); err != nil {
+			errs = append(errs, wrapValidateErrors(node.path, err))
+		}
+	}
+
+	if len(node.children) == 0 {
+		return errs
+	}
+	m, ok := value.(map[any]any)
+	if !ok {
+		return errs
+	}
+
+	// Iterate over a smaller set.
+	if len(m) < len(node.children) {
+		for k, v := range m {
+			if key, ok := k.(string); ok {
+				if child, ok := node.children[key]; ok {
+					errs = validateNode(child, v, errs)
+				}
+			}
+		}
+	} else {
+		for key, child := range node.children {
+			if v, ok := m[key]; ok {
+				errs = validateNode(child, v, errs)
+			}
+		}
+	}
+	return errs
+}
+
+// Validate validates a configuration with the compiled schema.
+func (schema CompiledSchema) Validate(config *Config) error {
+	errs := validateNode(schema.root, config.paths, nil)
+
 	if len(errs) == 0 {
 		return nil
 	}
 	return wrapValidateErrors(nil, errs...)
 }
+
+// Validate validates a configuration with the schema.
+func Validate(config *Config, schema []SchemaPath) error {
+	return CompileSchema(schema).Validate(config)
+}
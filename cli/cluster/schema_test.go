@@ -2,6 +2,7 @@ package cluster_test
 
 import (
 	"fmt"
+	"strings"
 	"testing"
 
 	"github.com/stretchr/testify/assert"
@@ -126,3 +127,92 @@ func TestValidate_instance_schema(t *testing.T) {
 		"value \"sessions\" should be one of "+
 			"[read write execute create alter drop usage session]")
 }
+
+func TestCompiledSchema_Validate(t *testing.T) {
+	schema := cluster.CompileSchema([]cluster.SchemaPath{
+		{
+			Path:      []string{"foo"},
+			Validator: cluster.MakeMapValidator(cluster.StringValidator{}, cluster.AnyValidator{}),
+		},
+		{
+			Path:      []string{"foo", "number"},
+			Validator: cluster.NumberValidator{},
+		},
+		{
+			Path:      []string{"foo", "bar", "string"},
+			Validator: cluster.StringValidator{},
+		},
+		{
+			Path:      []string{"zoo", "number"},
+			Validator: cluster.NumberValidator{},
+		},
+	})
+
+	cases := []struct {
+		Name     string
+		Config   map[string]any
+		Expected string
+	}{
+		{"empty", nil, ""},
+		{"unknown", map[string]any{"bar": "foo"}, ""},
+		{"ok", map[string]any{"foo.number": 1, "foo.bar.string": "s"}, ""},
+		{"not_map", map[string]any{"zoo": 1}, ""},
+		{
+			"nested",
+			map[string]any{"foo.number": "foo", "zoo.number": 1},
+			"invalid path \"foo.number\": " +
+				"failed to parse value \"foo\" to type number",
+		},
+		{
+			"several",
+			map[string]any{"foo.bar.string": []any{}, "zoo.number": false},
+			"invalid path \"zoo.number\": " +
+				"unexpected value \"false\" of type bool, expected number\n" +
+				"invalid path \"foo.bar.string\": " +
+				"unexpected value \"[]\" of type []interface {}, expected string",
+		},
+	}
+
+	for _, tc := range cases {
+		t.Run(tc.Name, func(t *testing.T) {
+			config := cluster.NewConfig()
+			for path, value := range tc.Config {
+				err := config.Set(strings.Split(path, "."), value)
+				require.NoError(t, err)
+			}
+
+			err := schema.Validate(config)
+			if tc.Expected == "" {
+				assert.NoError(t, err)
+			} else {
+				assert.EqualError(t, err, tc.Expected)
+			}
+		})
+	}
+}
+
+func TestCompiledTarantoolSchema(t *testing.T) {
+	config := cluster.NewConfig()
+	err := config.Set([]string{"config", "reload"}, "auto")
+	require.NoError(t, err)
+	err = config.Set([]string{"database", "mode"}, "foo")
+	require.NoError(t, err)
+	err = config.Set([]string{"database", "txn_timeout"}, "bar")
+	require.NoError(t, err)
+
+	err = cluster.CompiledTarantoolSchema.Validate(config)
+	require.EqualError(t, err, "invalid path \"database.mode\": "+
+		"value \"foo\" should be one of [ro rw]\n"+
+		"invalid path \"database.txn_timeout\": "+
+		"failed to parse value \"bar\" to type number")
+	errs := err.(interface{ Unwrap() []error }).Unwrap()
+	require.Equal(t, 2, len(errs))
+	assert.Equal(t, []string{"database", "mode"}, errs[0].(cluster.ValidateError).Path())
+	assert.Equal(t, []string{"database", "txn_timeout"},
+		errs[1].(cluster.ValidateError).Path())
+
+	config = cluster.NewConfig()
+	err = config.Set([]string{"database", "mode"}, "rw")
+	require.NoError(t, err)
+	assert.NoError(t, cluster.CompiledTarantoolSchema.Validate(config))
+}
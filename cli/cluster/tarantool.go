@@ -1,6 +1,7 @@
 package cluster
 
 import (
+	"context"
 	"fmt"
 	"time"
 
@@ -41,14 +42,19 @@ func (collector TarantoolAllCollector) Collect() (*Config, error) {
 			prefix)
 	}
 
+	values := make([][]byte, len(resp.Data))
+	for i, data := range resp.Data {
+		values[i] = []byte(data.Value)
+	}
+	configs, errs := collectYamls(values)
+
 	cconfig := NewConfig()
-	for _, data := range resp.Data {
-		if config, err := NewYamlCollector([]byte(data.Value)).Collect(); err != nil {
+	for i, data := range resp.Data {
+		if errs[i] != nil {
 			fmtErr := "failed to decode tarantool config for key %q: %w"
-			return nil, fmt.Errorf(fmtErr, data.Path, err)
-		} else {
-			cconfig.Merge(config)
+			return nil, fmt.Errorf(fmtErr, data.Path, errs[i])
 		}
+		cconfig.Merge(configs[i])
 	}
 
 	return cconfig, nil
@@ -141,6 +147,120 @@ func (publisher TarantoolAllDataPublisher) Publish(data []byte) error {
 	return nil
 }
 
+// TarantoolDiffDataPublisher publishes a data into Tarantool to a prefix or
+// to a key of the prefix. It writes only changes: the value is put only if it
+// differs from the stored one and other keys of the prefix are deleted only
+// if they exist. All changes are made in a single transaction guarded by
+// revisions of the read data.
+type TarantoolDiffDataPublisher struct {
+	evaler  connector.Evaler
+	prefix  string
+	key     string
+	timeout time.Duration
+}
+
+// NewTarantoolDiffDataPublisher creates a new TarantoolDiffDataPublisher
+// object to publish a data to Tarantool with the prefix and the key during
+// the timeout. The data is published to the whole prefix if the key is empty.
+func NewTarantoolDiffDataPublisher(evaler connector.Evaler,
+	prefix, key string, timeout time.Duration) TarantoolDiffDataPublisher {
+	return TarantoolDiffDataPublisher{
+		evaler:  evaler,
+		prefix:  prefix,
+		key:     key,
+		timeout: timeout,
+	}
+}
+
+// tarantoolDiff returns predicates and operations of a transaction that puts
+// the value into the key and deletes other keys read from the path. The
+// predicates ensure that the read data has not been changed and no keys have
+// been created in the path since the read. There are no operations if the
+// data is already up to date.
+func tarantoolDiff(resp tarantoolResponse, path, key, value string) ([]any, []any) {
+	var (
+		predicates []any
+		ops        []any
+		found      bool
+	)
+	// A key created after the read, including the missing target key, has
+	// a greater revision than the read one, like the prefix revision compare
+	// in the etcd diff publisher.
+	revision := resp.Revision
+	for _, data := range resp.Data {
+		if data.ModRevision > revision {
+			revision = data.ModRevision
+		}
+	}
+	predicates = append(predicates, []any{"mod_revision", "<=", revision, path})
+	for _, data := range resp.Data {
+		predicates = append(predicates,
+			[]any{"mod_revision", "==", data.ModRevision, data.Path})
+		if data.Path == key {
+			found = true
+			if data.Value != value {
+				ops = append(ops, []any{"put", key, value})
+			}
+		} else {
+			ops = append(ops, []any{"delete", data.Path})
+		}
+	}
+	if !found {
+		ops = append(ops, []any{"put", key, value})
+	}
+	return predicates, ops
+}
+
+// Publish publishes the configuration into Tarantool to the given prefix or
+// to the given key.
+func (publisher TarantoolDiffDataPublisher) Publish(data []byte) error {
+	prefix := getConfigPrefix(publisher.prefix)
+	path := prefix
+	key := prefix + "all"
+	if publisher.key != "" {
+		key = prefix + publisher.key
+		path = key
+	}
+	var deadline time.Time
+	if publisher.timeout != 0 {
+		deadline = time.Now().Add(publisher.timeout)
+	}
+
+	for {
+		if !deadline.IsZero() && time.Now().After(deadline) {
+			return fmt.Errorf("failed to put data into tarantool: %w",
+				context.DeadlineExceeded)
+		}
+
+		resp, err := tarantoolGet(publisher.evaler, path, publisher.timeout)
+		if err != nil {
+			return err
+		}
+
+		predicates, ops := tarantoolDiff(resp, path, key, string(data))
+		if len(ops) == 0 {
+			return nil
+		}
+
+		args := []any{map[any]any{"predicates": predicates, "on_success": ops}}
+		opts := connector.RequestOpts{ReadTimeout: publisher.timeout}
+		ret, err := publisher.evaler.Eval("return config.storage.txn(...)", args, opts)
+		if err != nil {
+			return fmt.Errorf("failed to put data into tarantool: %w", err)
+		}
+
+		txnResp := tarantoolTxnResponse{}
+		if len(ret) == 1 {
+			if err := mapstructure.Decode(ret[0], &txnResp); err != nil {
+				return fmt.Errorf("failed to map response from tarantool: %q", ret[0])
+			}
+		}
+		if txnResp.Data.IsSuccess == nil || *txnResp.Data.IsSuccess {
+			return nil
+		}
+	}
+}
+
 // TarantoolKeyDataPublisher publishes a data into Tarantool for a prefix
 // and a key.
 type TarantoolKeyDataPublisher struct {
@@ -178,8 +298,16 @@ func (publisher TarantoolKeyDataPublisher) Publish(data []byte) error {
 
 type tarantoolResponse struct {
 	Data []struct {
-		Path  string
-		Value string
+		Path        string
+		Value       string
+		ModRevision int64 `mapstructure:"mod_revision"`
+	}
+	Revision int64
+}
+
+type tarantoolTxnResponse struct {
+	Data struct {
+		IsSuccess *bool `mapstructure:"is_success"`
 	}
 }
 
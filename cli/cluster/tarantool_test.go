@@ -644,3 +644,141 @@ func TestTarantoolKeyDataPublisher_Publish_request_inputs(t *testing.T) {
 		})
 	}
 }
+
+type MockSequenceEvaler struct {
+	connector.Evaler
+	Exprs []string
+	Args  [][]any
+	Rets  [][]any
+}
+
+func (m *MockSequenceEvaler) Eval(expr string, args []any,
+	opts connector.RequestOpts) ([]any, error) {
+	m.Exprs = append(m.Exprs, expr)
+	m.Args = append(m.Args, args)
+	if len(m.Rets) == 0 {
+		return nil, fmt.Errorf("unexpected call")
+	}
+	ret := m.Rets[0]
+	m.Rets = m.Rets[1:]
+	return ret, nil
+}
+
+func TestTarantoolDiffDataPublisher_Publish(t *testing.T) {
+	getExpr := "return config.storage.get(...)"
+	txnExpr := "return config.storage.txn(...)"
+	success := []any{map[any]any{"data": map[any]any{"is_success": true}}}
+	failure := []any{map[any]any{"data": map[any]any{"is_success": false}}}
+	empty := []any{map[any]any{"data": []any{}}}
+	emptyRevision := []any{map[any]any{"data": []any{}, "revision": 7}}
+	same := []any{map[any]any{"data": []any{
+		map[any]any{"path": "/foo/config/all", "value": "data", "mod_revision": 3},
+	}}}
+	other := []any{map[any]any{"data": []any{
+		map[any]any{"path": "/foo/config/a", "value": "a", "mod_revision": 1},
+		map[any]any{"path": "/foo/config/all", "value": "old", "mod_revision": 2},
+	}}}
+
+	cases := []struct {
+		Name          string
+		Key           string
+		Rets          [][]any
+		ExpectedExprs []string
+		ExpectedArgs  [][]any
+	}{
+		{
+			Name:          "same value",
+			Rets:          [][]any{same},
+			ExpectedExprs: []string{getExpr},
+			ExpectedArgs:  [][]any{{"/foo/config/"}},
+		},
+		{
+			Name:          "no value",
+			Rets:          [][]any{empty, success},
+			ExpectedExprs: []string{getExpr, txnExpr},
+			ExpectedArgs: [][]any{
+				{"/foo/config/"},
+				{map[any]any{
+					"predicates": []any{
+						[]any{"mod_revision", "<=", int64(0), "/foo/config/"},
+					},
+					"on_success": []any{
+						[]any{"put", "/foo/config/all", "data"},
+					},
+				}},
+			},
+		},
+		{
+			Name:          "no value with revision",
+			Rets:          [][]any{emptyRevision, success},
+			ExpectedExprs: []string{getExpr, txnExpr},
+			ExpectedArgs: [][]any{
+				{"/foo/config/"},
+				{map[any]any{
+					"predicates": []any{
+						[]any{"mod_revision", "<=", int64(7), "/foo/config/"},
+					},
+					"on_success": []any{
+						[]any{"put", "/foo/config/all", "data"},
+					},
+				}},
+			},
+		},
+		{
+			Name:          "other keys",
+			Rets:          [][]any{other, success},
+			ExpectedExprs: []string{getExpr, txnExpr},
+			ExpectedArgs: [][]any{
+				{"/foo/config/"},
+				{map[any]any{
+					"predicates": []any{
+						[]any{"mod_revision", "<=", int64(2), "/foo/config/"},
+						[]any{"mod_revision", "==", int64(1), "/foo/config/a"},
+						[]any{"mod_revision", "==", int64(2), "/foo/config/all"},
+					},
+					"on_success": []any{
+						[]any{"delete", "/foo/config/a"},
+						[]any{"put", "/foo/config/all", "data"},
+					},
+				}},
+			},
+		},
+		{
+			Name:          "retry",
+			Rets:          [][]any{other, failure, same},
+			ExpectedExprs: []string{getExpr, txnExpr, getExpr},
+		},
+		{
+			Name:          "key",
+			Key:           "a",
+			Rets:          [][]any{empty, success},
+			ExpectedExprs: []string{getExpr, txnExpr},
+			ExpectedArgs: [][]any{
+				{"/foo/config/a"},
+				{map[any]any{
+					"predicates": []any{
+						[]any{"mod_revision", "<=", int64(0), "/foo/config/a"},
+					},
+					"on_success": []any{
+						[]any{"put", "/foo/config/a", "data"},
+					},
+				}},
+			},
+		},
+	}
+
+	for _, tc := range cases {
+		t.Run(tc.Name, func(t *testing.T) {
+			evaler := &MockSequenceEvaler{Rets: tc.Rets}
+
+			publisher := cluster.NewTarantoolDiffDataPublisher(evaler, "/foo", tc.Key, 0)
+			err := publisher.Publish([]byte("data"))
+			require.NoError(t, err)
+
+			assert.Equal(t, tc.ExpectedExprs, evaler.Exprs)
+			if tc.ExpectedArgs != nil {
+				assert.Equal(t, tc.ExpectedArgs, evaler.Args)
+			}
+		})
+	}
+}
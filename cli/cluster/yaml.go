@@ -2,6 +2,8 @@ package cluster
 
 import (
 	"fmt"
+	"runtime"
+	"sync"
 
 	"gopkg.in/yaml.v2"
 )
@@ -29,6 +31,43 @@ func (collector YamlCollector) Collect() (*Config, error) {
 	return config, nil
 }
 
+// collectYamls collects configurations from YAML values with a pool of
+// workers. It returns configurations and errors in the order of the values.
+func collectYamls(values [][]byte) ([]*Config, []error) {
+	configs := make([]*Config, len(values))
+	errs := make([]error, len(values))
+
+	workers := runtime.NumCPU()
+	if workers > len(values) {
+		workers = len(values)
+	}
+	if workers <= 1 {
+		for i, value := range values {
+			configs[i], errs[i] = NewYamlCollector(value).Collect()
+		}
+		return configs, errs
+	}
+
+	indexes := make(chan int)
+	var wg sync.WaitGroup
+	wg.Add(workers)
+	for w := 0; w < workers; w++ {
+		go func() {
+			defer wg.Done()
+			for i := range indexes {
+				configs[i], errs[i] = NewYamlCollector(values[i]).Collect()
+			}
+		}()
+	}
+	for i := range values {
+		indexes <- i
+	}
+	close(indexes)
+	wg.Wait()
+
+	return configs, errs
+}
+
 // YamlConfigPublisher publishes a configuration as YAML via the base
 // publisher.
 type YamlConfigPublisher struct {
@@ -1,19 +1,15 @@
 package cmd
 
 import (
-	"encoding/json"
 	"fmt"
 	"math"
-	"os"
-	"strconv"
+	"runtime"
 
 	"github.com/apex/log"
 	"github.com/spf13/cobra"
 	"github.com/tarantool/tt/cli/checkpoint"
 	"github.com/tarantool/tt/cli/cmdcontext"
 	"github.com/tarantool/tt/cli/modules"
-	"github.com/tarantool/tt/cli/util"
-	"github.com/tarantool/tt/cli/version"
 )
 
 // catFlags contains flags for cat command.
@@ -25,6 +21,9 @@ var catFlags = checkpoint.Opts{
 	Format:     "yaml",
 	Replica:    nil,
 	ShowSystem: false,
+	Jobs:       runtime.NumCPU(),
+	Merge:      false,
+	Index:      false,
 }
 
 // NewCatCmd creates a new cat command.
@@ -52,6 +51,14 @@ func NewCatCmd() *cobra.Command {
 		"Filter the output by replica id. May be passed more than once")
 	catCmd.Flags().BoolVar(&catFlags.ShowSystem, "show-system", catFlags.ShowSystem,
 		"Show the contents of system spaces")
+	catCmd.Flags().IntVar(&catFlags.Jobs, "jobs", catFlags.Jobs,
+		"Count of files decoded in parallel")
+	catCmd.Flags().BoolVar(&catFlags.Merge, "merge", catFlags.Merge,
+		"Merge operations of all files in (replica id, lsn) order")
+	catCmd.Flags().BoolVar(&catFlags.Index, "index", catFlags.Index,
+		"Use and update a sparse lsn index stored near a file to seek to --from")
+	catCmd.Flags().StringVar(&catFlags.StatsFile, "stats-file", catFlags.StatsFile,
+		"Write statistics of processed files into the file in JSON format")
 
 	return catCmd
 }
@@ -62,42 +69,8 @@ func internalCatModule(cmdCtx *cmdcontext.CmdCtx, args []string) error {
 		return fmt.Errorf("it is required to specify at least one .xlog or .snap file")
 	}
 
-	// List of files is passed to lua cat script via environment variable in json format.
-	filesJson, err := json.Marshal(args)
-	if err != nil {
-		util.InternalError("Internal error: problem with creating json params with files: %s",
-			version.GetVersion, err)
-	}
-
-	os.Setenv("TT_CLI_CAT_FILES", string(filesJson))
-	os.Setenv("TT_CLI_CAT_SHOW_SYS", strconv.FormatBool(catFlags.ShowSystem))
-	os.Setenv("TT_CLI_CAT_FORMAT", string(catFlags.Format))
-
-	// List of spaces is passed to lua cat script via environment variable in json format.
-	spacesJson, err := json.Marshal(catFlags.Space)
-	if err != nil {
-		util.InternalError("Internal error: problem with creating json params with spaces: %s",
-			version.GetVersion, err)
-	}
-	if string(spacesJson) != "null" {
-		os.Setenv("TT_CLI_CAT_SPACES", string(spacesJson))
-	}
-
-	os.Setenv("TT_CLI_CAT_FROM", strconv.FormatUint(catFlags.From, 10))
-	os.Setenv("TT_CLI_CAT_TO", strconv.FormatUint(catFlags.To, 10))
-
-	// List of replicas is passed to lua cat script via environment variable in json format.
-	replicasJson, err := json.Marshal(catFlags.Replica)
-	if err != nil {
-		util.InternalError("Internal error: problem with creating json params with replicas: %s",
-			version.GetVersion, err)
-	}
-	if string(replicasJson) != "null" {
-		os.Setenv("TT_CLI_CAT_REPLICAS", string(replicasJson))
-	}
-
 	log.Infof("Running cat with files: %s\n", args)
-	if err := checkpoint.Cat(cmdCtx.Cli.TarantoolCli); err != nil {
+	if err := checkpoint.Cat(args, catFlags); err != nil {
 		return err
 	}
 
@@ -57,6 +57,10 @@ func NewConnectCmd() *cobra.Command {
 			"The command supports the following environment variables:\n\n" +
 			"* " + connect.TarantoolUsernameEnv + " - specifies a username\n" +
 			"* " + connect.TarantoolPasswordEnv + " - specifies a password\n" +
+			"* " + connect.PagerEnv + " - specifies a pager for the interactive" +
+			" console output, the output is not paged if it is not set. Quitting" +
+			" the pager stops formatting of the rest of the output, but the" +
+			" result is received from the instance in whole\n" +
 			"\n" +
 			"You could pass command line arguments to the interpreted SCRIPT" +
 			" or COMMAND passed via -f flag:\n\n" +
@@ -189,6 +193,7 @@ func internalConnectModule(cmdCtx *cmdcontext.CmdCtx, args []string) error {
 		SslCaFile:   connectSslCaFile,
 		SslCiphers:  connectSslCiphers,
 		Interactive: connectInteractive,
+		Pager:       os.Getenv(connect.PagerEnv),
 	}
 
 	var ok bool
@@ -3,6 +3,7 @@ package cmd
 import (
 	"fmt"
 	"os"
+	"runtime"
 
 	"github.com/apex/log"
 	"github.com/spf13/cobra"
@@ -66,6 +67,12 @@ The supported types are: tgz, deb, rpm`,
 	packCmd.Flags().BoolVar(&packCtx.WithoutModules, "without-modules",
 		packCtx.WithoutModules, "Don't include external modules to the result package")
 
+	packCmd.Flags().IntVar(&packCtx.Compress.Level, "compress-level", packCtx.Compress.Level,
+		"Gzip compression level from 1 (fastest) to 9 (best). The default is 6 for tgz and"+
+			" deb, 9 for rpm")
+	packCmd.Flags().IntVar(&packCtx.Compress.Threads, "compress-threads",
+		runtime.NumCPU(), "Count of threads compressing the package in parallel")
+
 	// TarGZ flags.
 	packCmd.Flags().BoolVar(&packCtx.Archive.All, "all", packCtx.Archive.All,
 		"Pack all included artifacts")
@@ -21,11 +21,14 @@ import (
 // playFlags contains flags for play command.
 // Initialized with default values at creation.
 var playFlags = checkpoint.Opts{
-	From:       0,
-	To:         math.MaxUint64,
-	Space:      nil,
-	Replica:    nil,
-	ShowSystem: false,
+	From:        0,
+	To:          math.MaxUint64,
+	Space:       nil,
+	Replica:     nil,
+	ShowSystem:  false,
+	Window:      128,
+	Connections: 1,
+	Partition:   "space",
 }
 
 var (
@@ -60,6 +63,19 @@ func NewPlayCmd() *cobra.Command {
 		"Filter the output by replica id. May be passed more than once")
 	playCmd.Flags().BoolVar(&playFlags.ShowSystem, "show-system", playFlags.ShowSystem,
 		"Show the contents of system spaces")
+	playCmd.Flags().IntVar(&playFlags.Window, "window", playFlags.Window,
+		"Max count of operations sent without waiting for results")
+	playCmd.Flags().IntVar(&playFlags.Connections, "connections", playFlags.Connections,
+		"Count of connections to play operations in parallel")
+	playCmd.Flags().StringVar(&playFlags.Partition, "partition", playFlags.Partition,
+		"Distribute operations between connections by space or key. Partitioning"+
+			" by key does not keep the order of operations with different primary keys")
+	playCmd.Flags().StringVar(&playFlags.Journal, "journal", playFlags.Journal,
+		"Save the progress into the journal file")
+	playCmd.Flags().BoolVar(&playFlags.Resume, "resume", playFlags.Resume,
+		"Resume playing from the progress saved in the journal file")
+	playCmd.Flags().StringVar(&playFlags.StatsFile, "stats-file", playFlags.StatsFile,
+		"Write statistics of playing into the file in JSON format")
 
 	return playCmd
 }
@@ -70,6 +86,38 @@ func internalPlayModule(cmdCtx *cmdcontext.CmdCtx, args []string) error {
 		return fmt.Errorf("it is required to specify an URI and at least one .xlog or .snap file")
 	}
 
+	if playFlags.Partition != "space" && playFlags.Partition != "key" {
+		return fmt.Errorf("unknown partition %q, space or key is expected",
+			playFlags.Partition)
+	}
+
+	if playFlags.Resume && playFlags.Journal == "" {
+		return fmt.Errorf("the journal is required to resume, use --journal")
+	}
+
+	files := args[1:]
+	var resumeVclock checkpoint.Vclock
+	if playFlags.Resume {
+		journal, err := checkpoint.ReadPlayJournal(playFlags.Journal)
+		if err != nil {
+			return err
+		}
+		if files, resumeVclock, err = journal.ResumeFiles(files); err != nil {
+			return err
+		}
+	}
+
+	// Files without operations in the lsn range are not passed to the play script.
+	filtered := checkpoint.FilterFiles(files, playFlags)
+	if len(filtered) == 0 {
+		log.Info("No files with operations to play")
+		return nil
+	}
+	if resumeVclock != nil && filtered[0] != files[0] {
+		resumeVclock = nil
+	}
+	args = append([]string{args[0]}, filtered...)
+
 	// List of files and URI is passed to lua play script via environment variable in json format.
 	filesAndUriJson, err := json.Marshal(args)
 	if err != nil {
@@ -117,6 +165,27 @@ func internalPlayModule(cmdCtx *cmdcontext.CmdCtx, args []string) error {
 
 	os.Setenv("TT_CLI_PLAY_FROM", strconv.FormatUint(playFlags.From, 10))
 	os.Setenv("TT_CLI_PLAY_TO", strconv.FormatUint(playFlags.To, 10))
+	os.Setenv("TT_CLI_PLAY_WINDOW", strconv.Itoa(playFlags.Window))
+	os.Setenv("TT_CLI_PLAY_CONNECTIONS", strconv.Itoa(playFlags.Connections))
+	os.Setenv("TT_CLI_PLAY_PARTITION", playFlags.Partition)
+	if playFlags.Journal != "" {
+		os.Setenv("TT_CLI_PLAY_JOURNAL", playFlags.Journal)
+	}
+	if playFlags.StatsFile != "" {
+		os.Setenv("TT_CLI_PLAY_STATS_FILE", playFlags.StatsFile)
+	}
+	if resumeVclock != nil {
+		// Rows of the first file up to the vclock are applied already.
+		resumeJson, err := json.Marshal(resumeVclock)
+		if err != nil {
+			util.InternalError(
+				"Internal error: problem with creating json params with a vclock: %s",
+				version.GetVersion,
+				err,
+			)
+		}
+		os.Setenv("TT_CLI_PLAY_RESUME_VCLOCK", string(resumeJson))
+	}
 
 	// List of replicas is passed to lua play script via environment variable in json format.
 	replicasJson, err := json.Marshal(playFlags.Replica)
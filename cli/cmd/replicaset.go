@@ -3,6 +3,7 @@ package cmd
 import (
 	"fmt"
 	"strings"
+	"time"
 
 	"github.com/spf13/cobra"
 
@@ -31,6 +32,10 @@ var (
 	replicasetSslCertFile string
 	replicasetSslCaFile   string
 	replicasetSslCiphers  string
+
+	replicasetMonitor         bool
+	replicasetMonitorInterval time.Duration
+	replicasetFormat          string
 )
 
 // NewReplicasetCmd creates a replicaset command.
@@ -53,7 +58,10 @@ func NewReplicasetCmd() *cobra.Command {
 			"The command supports the following environment variables:\n\n" +
 			"* " + connect.TarantoolUsernameEnv + " - specifies a username\n" +
 			"* " + connect.TarantoolPasswordEnv + " - specifies a password\n" +
-			"\n",
+			"\n" +
+			"With --monitor the command keeps connections to instances, polls " +
+			"the topology\nwith the --interval and prints only changes: " +
+			"leaders, modes and instances.\n",
 		Run: func(cmd *cobra.Command, args []string) {
 			cmdCtx.CommandName = cmd.Name()
 			err := modules.RunCmd(&cmdCtx, cmd.CommandPath(), &modulesInfo,
@@ -80,6 +88,12 @@ func NewReplicasetCmd() *cobra.Command {
 		`path to a trusted certificate authorities (CA) file for the URI case`)
 	statusCmd.Flags().StringVar(&replicasetSslCiphers, "sslciphers", "",
 		`colon-separated (:) list of SSL cipher suites for the URI case`)
+	statusCmd.Flags().StringVar(&replicasetFormat, "format", replicasetcmd.FormatText,
+		`output format: text or json, json includes a replication state`)
+	statusCmd.Flags().BoolVar(&replicasetMonitor, "monitor", false,
+		`poll the topology and print only its changes`)
+	statusCmd.Flags().DurationVar(&replicasetMonitorInterval, "interval",
+		replicasetcmd.DefaultMonitorInterval, `an interval between polls for --monitor`)
 	replicasetCmd.AddCommand(statusCmd)
 
 	return replicasetCmd
@@ -152,12 +166,20 @@ func internalReplicasetStatusModule(cmdCtx *cmdcontext.CmdCtx, args []string) er
 		defer conn.Close()
 	}
 
-	return replicasetcmd.Status(replicasetcmd.StatusCtx{
+	statusCtx := replicasetcmd.StatusCtx{
 		RunningCtx:    runningCtx,
 		IsApplication: isApplication,
 		Conn:          conn,
 		Orchestrator:  orchestrator,
-	})
+		Format:        replicasetFormat,
+	}
+	if replicasetMonitor {
+		return replicasetcmd.Monitor(replicasetcmd.MonitorCtx{
+			StatusCtx: statusCtx,
+			Interval:  replicasetMonitorInterval,
+		})
+	}
+	return replicasetcmd.Status(statusCtx)
 }
 
 // getOrchestartor returns a chosen orchestrator or an unknown one.
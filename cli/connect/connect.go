@@ -38,6 +38,8 @@ type ConnectCtx struct {
 	Interactive bool
 	// ConnectTarget contains connection target string: URI or instance name.
 	ConnectTarget string
+	// Pager is a command to page the interactive console output.
+	Pager string
 }
 
 const (
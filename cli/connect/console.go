@@ -51,6 +51,9 @@ type Console struct {
 	format     formatter.Format
 	formatOpts formatter.Opts
 	quit       bool
+	// pager is a command to page the output. The output is written to
+	// stdout if it is empty.
+	pager string
 
 	history *commandHistory
 
@@ -93,6 +96,11 @@ func NewConsole(connOpts connector.ConnectOpts, connectCtx ConnectCtx, title str
 		quit: false,
 	}
 
+	// The pager is useful only for an interactive session.
+	if terminal.IsTerminal(syscall.Stdin) && terminal.IsTerminal(syscall.Stdout) {
+		console.pager = connectCtx.Pager
+	}
+
 	var err error
 
 	// Initialize console history.
@@ -250,12 +258,12 @@ func getExecutor(console *Console) func(string) {
 			data = results[0]
 		}
 
-		output, err := formatter.MakeOutput(console.format, data, console.formatOpts)
+		err := writeOutput(console.pager, func(w io.Writer) error {
+			return formatter.WriteOutput(w, console.format, data, console.formatOpts)
+		})
 		if err != nil {
 			log.Errorf("Unable to format output: %s", err)
 			log.Infof("Source YAML:\n%s", data)
-		} else {
-			fmt.Print(output)
 		}
 
 		console.input = ""
@@ -0,0 +1,107 @@
+package connect
+
+import (
+	"bufio"
+	"errors"
+	"io"
+	"os"
+	"os/exec"
+	"syscall"
+
+	"github.com/apex/log"
+)
+
+// PagerEnv is an environment variable with a pager command for the console
+// output. The generic PAGER variable is not used: it is set in most shells,
+// and paging of every short result is annoying. The output is paged only if
+// the variable is set.
+const PagerEnv = "TT_CLI_PAGER"
+
+// pagerBufferSize is a size of the buffer between the formatter and
+// the pager.
+const pagerBufferSize = 32 * 1024
+
+// pager streams output into a pager process. The pipe to the process
+// provides a backpressure: a write blocks until the pager reads previous
+// data.
+type pager struct {
+	cmd    *exec.Cmd
+	stdin  io.WriteCloser
+	writer *bufio.Writer
+}
+
+// startPager starts the pager command.
+func startPager(command string) (*pager, error) {
+	cmd := exec.Command("/bin/sh", "-c", command)
+	cmd.Stdout = os.Stdout
+	cmd.Stderr = os.Stderr
+
+	stdin, err := cmd.StdinPipe()
+	if err != nil {
+		return nil, err
+	}
+	if err := cmd.Start(); err != nil {
+		return nil, err
+	}
+
+	return &pager{
+		cmd:    cmd,
+		stdin:  stdin,
+		writer: bufio.NewWriterSize(stdin, pagerBufferSize),
+	}, nil
+}
+
+// Write writes data into the pager. It returns an error if the pager has
+// been closed by a user.
+func (p *pager) Write(data []byte) (int, error) {
+	return p.writer.Write(data)
+}
+
+// Close flushes the buffered data and waits for the pager exit.
+func (p *pager) Close() error {
+	err := p.writer.Flush()
+	if closeErr := p.stdin.Close(); err == nil {
+		err = closeErr
+	}
+	// The pager exit status is not interesting, it could be non-zero if
+	// the output was interrupted.
+	p.cmd.Wait()
+	if isPagerClosed(err) {
+		return nil
+	}
+	return err
+}
+
+// isPagerClosed returns true if the error means that the pager has been
+// closed before the whole output was written.
+func isPagerClosed(err error) bool {
+	return errors.Is(err, syscall.EPIPE) || errors.Is(err, os.ErrClosed)
+}
+
+// writeOutput writes the output with the write function into the pager if
+// the pager is specified or into stdout. The formatting stops if the pager
+// has been closed.
+func writeOutput(pagerCmd string, write func(w io.Writer) error) error {
+	if pagerCmd == "" {
+		writer := bufio.NewWriterSize(os.Stdout, pagerBufferSize)
+		if err := write(writer); err != nil {
+			writer.Flush()
+			return err
+		}
+		return writer.Flush()
+	}
+
+	p, err := startPager(pagerCmd)
+	if err != nil {
+		log.Warnf("Unable to start the pager %q: %s", pagerCmd, err)
+		return writeOutput("", write)
+	}
+	err = write(p)
+	if closeErr := p.Close(); err == nil {
+		err = closeErr
+	}
+	if isPagerClosed(err) {
+		return nil
+	}
+	return err
+}
@@ -1,6 +1,7 @@
 package formatter
 
 import (
+	"io"
 	"strings"
 )
 
@@ -59,19 +60,51 @@ func (f Format) String() string {
 	}
 }
 
+// yamlChunkSize is a maximum size of a chunk of YAML output written at once.
+const yamlChunkSize = 64 * 1024
+
 // MakeOutput returns formatted output from a YAML data depending on
 // the specified output format and passed formatting options.
 func MakeOutput(format Format, data string, opts Opts) (string, error) {
+	var builder strings.Builder
+	if err := WriteOutput(&builder, format, data, opts); err != nil {
+		return "", err
+	}
+	return builder.String(), nil
+}
+
+// WriteOutput writes formatted output from a YAML data depending on
+// the specified output format and passed formatting options to the writer.
+// The output is formatted and written in chunks, so the formatting stops
+// as soon as the writer returns an error.
+func WriteOutput(w io.Writer, format Format, data string, opts Opts) error {
 	switch format {
 	case YamlFormat:
-		return data + "\n", nil
+		return writeYamlOutput(w, data)
 	case LuaFormat:
-		return makeLuaOutput(data)
+		return writeLuaOutput(w, data)
 	case TableFormat:
-		return makeTableOutput(data, false, opts)
+		return writeTableOutput(w, data, false, opts)
 	case TTableFormat:
-		return makeTableOutput(data, true, opts)
+		return writeTableOutput(w, data, true, opts)
 	default:
 		panic("Unknown render case")
 	}
 }
+
+// writeYamlOutput writes the YAML data as is by chunks.
+func writeYamlOutput(w io.Writer, data string) error {
+	for len(data) > yamlChunkSize {
+		// Try to split the data by lines.
+		end := strings.LastIndexByte(data[:yamlChunkSize], '\n') + 1
+		if end == 0 {
+			end = yamlChunkSize
+		}
+		if _, err := io.WriteString(w, data[:end]); err != nil {
+			return err
+		}
+		data = data[end:]
+	}
+	_, err := io.WriteString(w, data+"\n")
+	return err
+}
@@ -2,9 +2,12 @@ package formatter_test
 
 import (
 	"fmt"
+	"io"
+	"strings"
 	"testing"
 
 	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
 	"github.com/tarantool/tt/cli/formatter"
 )
 
@@ -332,3 +335,48 @@ func TestFormatter_MakeOutputFormat(t *testing.T) {
 		})
 	}
 }
+
+// limitedWriter fails after the limit of writes.
+type limitedWriter struct {
+	writes int
+	limit  int
+}
+
+func (w *limitedWriter) Write(data []byte) (int, error) {
+	if w.writes >= w.limit {
+		return 0, io.ErrClosedPipe
+	}
+	w.writes++
+	return len(data), nil
+}
+
+func TestFormatter_WriteOutput(t *testing.T) {
+	input := "---\n- [1, 2]\n- {'a': 1}\n- 'foo'\n- {'b': 2}\n...\n"
+	formats := []formatter.Format{
+		formatter.YamlFormat,
+		formatter.LuaFormat,
+		formatter.TableFormat,
+		formatter.TTableFormat,
+	}
+
+	for _, format := range formats {
+		t.Run(fmt.Sprint(format), func(t *testing.T) {
+			opts := formatter.Opts{
+				Graphics:     true,
+				TableDialect: formatter.DefaultTableDialect,
+			}
+			expected, err := formatter.MakeOutput(format, input, opts)
+			require.NoError(t, err)
+
+			var builder strings.Builder
+			err = formatter.WriteOutput(&builder, format, input, opts)
+			require.NoError(t, err)
+			assert.Equal(t, expected, builder.String())
+
+			writer := limitedWriter{limit: 0}
+			err = formatter.WriteOutput(&writer, format, input, opts)
+			assert.ErrorIs(t, err, io.ErrClosedPipe)
+			assert.Equal(t, 0, writer.writes)
+		})
+	}
+}
@@ -2,6 +2,7 @@ package formatter
 
 import (
 	"fmt"
+	"io"
 
 	"gopkg.in/yaml.v2"
 )
@@ -44,25 +45,28 @@ func luaEncodeElement(elem any) string {
 	}
 }
 
-// makeLuaOutput returns Lua-compatible string from the yaml string input.
-func makeLuaOutput(input string) (string, error) {
+// writeLuaOutput writes Lua-compatible string from the yaml string input.
+// Each element is encoded and written separately.
+func writeLuaOutput(w io.Writer, input string) error {
 	// Handle empty input from remote console.
 	if input == "---\n...\n" {
-		return ";\n", nil
+		_, err := io.WriteString(w, ";\n")
+		return err
 	}
 
 	var decoded []any
-	if err := yaml.Unmarshal([]byte(input), &decoded); err == nil {
-		var res string
-		for i, unpackedVal := range decoded {
-			if i < len(decoded)-1 {
-				res += luaEncodeElement(unpackedVal) + ", "
-			} else {
-				res += luaEncodeElement(unpackedVal)
-			}
+	if err := yaml.Unmarshal([]byte(input), &decoded); err != nil {
+		return fmt.Errorf("cannot render lua: %w", err)
+	}
+	for i, unpackedVal := range decoded {
+		res := luaEncodeElement(unpackedVal)
+		if i < len(decoded)-1 {
+			res += ", "
+		}
+		if _, err := io.WriteString(w, res); err != nil {
+			return err
 		}
-		return res + ";\n", nil
-	} else {
-		return "", fmt.Errorf("cannot render lua: %w", err)
 	}
+	_, err := io.WriteString(w, ";\n")
+	return err
 }
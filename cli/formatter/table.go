@@ -3,6 +3,7 @@ package formatter
 import (
 	"encoding/json"
 	"fmt"
+	"io"
 	"sort"
 	"strconv"
 	"strings"
@@ -342,10 +343,10 @@ func isMapKeysEqual(x map[string]any, y map[string]any) bool {
 	return true
 }
 
-// renderBatch parses renders batch and return tables as string for it.
-func renderBatch(batch []any, transpose bool, opts Opts) (string, error) {
+// renderBatch renders the batch and writes tables for it.
+func renderBatch(w io.Writer, batch []any, transpose bool, opts Opts) error {
 	if isSingleType(batch, scalarNodeType) {
-		return renderScalars(batch, transpose, opts)
+		return writeString(w, renderScalars, batch, transpose, opts)
 	} else if isSingleType(batch, mapNodeType) {
 		var anyMaps []map[string]any
 		for _, node := range batch {
@@ -364,47 +365,59 @@ func renderBatch(batch []any, transpose bool, opts Opts) (string, error) {
 			mapsBatchs[batchPointer] = append(mapsBatchs[batchPointer], anyMaps[i+1])
 		}
 
-		var res, batchRes string
-		var err error
 		for _, batch := range mapsBatchs {
 			if len(batch) != 0 {
-				batchRes, err = renderEqualMaps(batch, transpose, opts)
+				batchRes, err := renderEqualMaps(batch, transpose, opts)
 				if err != nil {
-					return "", err
+					return err
 				}
 				if !opts.Graphics {
 					batchRes += "\n"
 				}
-				res += batchRes
+				if _, err := io.WriteString(w, batchRes); err != nil {
+					return err
+				}
 			}
 		}
 
-		return res, nil
+		return nil
 	} else if isSingleType(batch, arrayNodeType) {
-		return renderArrays(batch, transpose, opts)
+		return writeString(w, renderArrays, batch, transpose, opts)
 	} else {
-		return "", fmt.Errorf("unknown parsing case with current render batch")
+		return fmt.Errorf("unknown parsing case with current render batch")
 	}
 }
 
-// renderBatches combines multiple batches into one string.
-func renderBatches(batches [][]any, transpose bool, opts Opts) (string, error) {
-	var result string
+// writeString renders the batch with the render function and writes
+// the result.
+func writeString(w io.Writer,
+	render func(batch []any, transpose bool, opts Opts) (string, error),
+	batch []any, transpose bool, opts Opts) error {
+	res, err := render(batch, transpose, opts)
+	if err != nil {
+		return err
+	}
+	_, err = io.WriteString(w, res)
+	return err
+}
+
+// renderBatches renders batches one by one and writes them. It stops on
+// the first error.
+func renderBatches(w io.Writer, batches [][]any, transpose bool, opts Opts) error {
 	for _, batch := range batches {
 		if len(batch) != 0 {
-			batchStr, err := renderBatch(batch, transpose, opts)
-			if err != nil {
-				return "", fmt.Errorf("cannot render tables: %w", err)
+			if err := renderBatch(w, batch, transpose, opts); err != nil {
+				return fmt.Errorf("cannot render tables: %w", err)
 			}
-			result += batchStr
 			if !opts.Graphics {
-				result += "\n"
+				if _, err := io.WriteString(w, "\n"); err != nil {
+					return err
+				}
 			}
 		}
 	}
 
-	return result, nil
-
+	return nil
 }
 
 type metadataField struct {
@@ -435,8 +448,8 @@ func remapMetadataRows(meta metadataRows) []any {
 	return nodes
 }
 
-// makeTableOutput returns tables as string for table/ttable output formats.
-func makeTableOutput(input string, transpose bool, opts Opts) (string, error) {
+// writeTableOutput writes tables for table/ttable output formats.
+func writeTableOutput(w io.Writer, input string, transpose bool, opts Opts) error {
 	// Handle empty input from remote console.
 	if input == "---\n- \n...\n" || input == "---\n-\n...\n" {
 		input = "--- ['']\n...\n"
@@ -453,7 +466,7 @@ func makeTableOutput(input string, transpose bool, opts Opts) (string, error) {
 		// Failed. Try to read it as an array.
 		nodes, err = decodeYamlArr(input)
 		if err != nil {
-			return "", fmt.Errorf("not yaml array, cannot render tables: %s", err)
+			return fmt.Errorf("not yaml array, cannot render tables: %s", err)
 		}
 	}
 
@@ -472,5 +485,5 @@ func makeTableOutput(input string, transpose bool, opts Opts) (string, error) {
 		batches[batchPointer] = append(batches[batchPointer], nodes[i+1])
 	}
 
-	return renderBatches(batches, transpose, opts)
+	return renderBatches(w, batches, transpose, opts)
 }
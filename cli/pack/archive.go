@@ -20,19 +20,10 @@ type archivePacker struct {
 // Run of ArchivePacker packs the bundle into tarball.
 func (packer *archivePacker) Run(cmdCtx *cmdcontext.CmdCtx, packCtx *PackCtx,
 	opts *config.CliOpts) error {
-	bundlePath, err := prepareBundle(cmdCtx, packCtx, opts, true)
+	appList, err := collectBundleApps(cmdCtx, packCtx, opts)
 	if err != nil {
 		return err
 	}
-	defer func() {
-		err := os.RemoveAll(bundlePath)
-		if err != nil {
-			log.Warnf("Failed to remove a temporary directory %s: %s",
-				bundlePath, err.Error())
-		}
-	}()
-
-	log.Debugf("The package structure is created in: %s", bundlePath)
 
 	tgzSuffix, err := getTgzSuffix()
 	if err != nil {
@@ -43,6 +34,47 @@ func (packer *archivePacker) Run(cmdCtx *cmdcontext.CmdCtx, packCtx *PackCtx,
 		return err
 	}
 
+	currentDir, err := os.Getwd()
+	if err != nil {
+		return err
+	}
+	tarName = filepath.Join(currentDir, tarName)
+
+	if canStreamBundle(packCtx, opts, appList) {
+		// There is nothing to build or sign in the bundle, so the tarball
+		// is written directly from the sources.
+		log.Infof("Creating tarball.")
+		if err = writeTgzBundle(cmdCtx, packCtx, opts, appList, tarName); err != nil {
+			removeTarball(tarName)
+		}
+	} else {
+		err = packer.writeStagedBundle(cmdCtx, packCtx, opts, appList, tarName)
+	}
+	if err != nil {
+		return err
+	}
+	log.Infof("Bundle is packed successfully to %s.", tarName)
+	return nil
+}
+
+// writeStagedBundle prepares the bundle in a temporary directory and packs it
+// into the tarball.
+func (packer *archivePacker) writeStagedBundle(cmdCtx *cmdcontext.CmdCtx, packCtx *PackCtx,
+	opts *config.CliOpts, appList []util.AppListEntry, tarName string) error {
+	bundlePath, err := stageBundle(cmdCtx, packCtx, opts, appList, true)
+	if err != nil {
+		return err
+	}
+	defer func() {
+		err := os.RemoveAll(bundlePath)
+		if err != nil {
+			log.Warnf("Failed to remove a temporary directory %s: %s",
+				bundlePath, err.Error())
+		}
+	}()
+
+	log.Debugf("The package structure is created in: %s", bundlePath)
+
 	if packCtx.CartridgeCompat {
 		// Generate VERSION file.
 		if err := generateVersionFile(bundlePath, cmdCtx, packCtx); err != nil {
@@ -56,22 +88,18 @@ func (packer *archivePacker) Run(cmdCtx *cmdcontext.CmdCtx, packCtx *PackCtx,
 	}
 
 	log.Infof("Creating tarball.")
-
-	currentDir, err := os.Getwd()
-	if err != nil {
+	if err = WriteTgzArchive(bundlePath, tarName, packCtx.Compress); err != nil {
+		removeTarball(tarName)
 		return err
 	}
-	tarName = filepath.Join(currentDir, tarName)
+	return nil
+}
 
-	err = WriteTgzArchive(bundlePath, tarName)
-	if err != nil {
-		if err := os.Remove(tarName); err != nil {
-			log.Warnf("Failed to remove a tarball file %s: %s", tarName, err)
-		}
-		return err
+// removeTarball removes a partially written tarball.
+func removeTarball(tarName string) {
+	if err := os.Remove(tarName); err != nil {
+		log.Warnf("Failed to remove a tarball file %s: %s", tarName, err)
 	}
-	log.Infof("Bundle is packed successfully to %s.", tarName)
-	return nil
 }
 
 // generateVersionLuaFile generates VERSION.lua file (for cartridge-cli compatibility).
@@ -84,8 +112,7 @@ func generateVersionLuaFile(bundlePath string, packCtx *PackCtx) error {
 		log.Warnf("File %s will be overwritten", versionLuaFileName)
 	}
 
-	err := os.WriteFile(versionLuaFilePath,
-		[]byte(fmt.Sprintf("return '%s'", packCtx.Version)), 0644)
+	err := os.WriteFile(versionLuaFilePath, versionLuaFileContent(packCtx), 0644)
 	if err != nil {
 		return fmt.Errorf("failed to write VERSION.lua file %s: %s", versionLuaFilePath, err)
 	}
@@ -93,10 +120,33 @@ func generateVersionLuaFile(bundlePath string, packCtx *PackCtx) error {
 	return nil
 }
 
+// versionLuaFileContent returns a content of VERSION.lua file.
+func versionLuaFileContent(packCtx *PackCtx) []byte {
+	return []byte(fmt.Sprintf("return '%s'", packCtx.Version))
+}
+
 // generateVersionFile generates VERSION file (for cartridge-cli compatibility).
 func generateVersionFile(bundlePath string, cmdCtx *cmdcontext.CmdCtx, packCtx *PackCtx) error {
 	log.Infof("Generate %s file", versionFileName)
 
+	content, err := versionFileContent(filepath.Join(bundlePath, packCtx.Name), cmdCtx, packCtx)
+	if err != nil {
+		return err
+	}
+
+	versionFilePath := filepath.Join(bundlePath, packCtx.Name, versionFileName)
+	err = os.WriteFile(versionFilePath, content, 0644)
+	if err != nil {
+		return fmt.Errorf("failed to write VERSION file %s: %s", versionFilePath, err)
+	}
+
+	return nil
+}
+
+// versionFileContent returns a content of VERSION file with versions of the
+// application, tarantool and rocks of the application.
+func versionFileContent(appPath string, cmdCtx *cmdcontext.CmdCtx,
+	packCtx *PackCtx) ([]byte, error) {
 	var versionFileLines []string
 
 	// Application version.
@@ -106,13 +156,13 @@ func generateVersionFile(bundlePath string, cmdCtx *cmdcontext.CmdCtx, packCtx *
 	// Tarantool version.
 	tntVersion, err := cmdCtx.Cli.TarantoolCli.GetVersion()
 	if err != nil {
-		return err
+		return nil, err
 	}
 	tarantoolVersionLine := fmt.Sprintf("TARANTOOL=%s", tntVersion.Str)
 	versionFileLines = append(versionFileLines, tarantoolVersionLine)
 
 	// Rocks versions.
-	rocksVersionsMap, err := LuaGetRocksVersions(filepath.Join(bundlePath, packCtx.Name))
+	rocksVersionsMap, err := LuaGetRocksVersions(appPath)
 
 	if err != nil {
 		log.Warnf("Can't process rocks manifest file. Dependency information can't be "+
@@ -131,13 +181,7 @@ func generateVersionFile(bundlePath string, cmdCtx *cmdcontext.CmdCtx, packCtx *
 		}
 	}
 
-	versionFilePath := filepath.Join(bundlePath, packCtx.Name, versionFileName)
-	err = os.WriteFile(versionFilePath, []byte(strings.Join(versionFileLines, "\n")+"\n"), 0644)
-	if err != nil {
-		return fmt.Errorf("failed to write VERSION file %s: %s", versionFilePath, err)
-	}
-
-	return nil
+	return []byte(strings.Join(versionFileLines, "\n") + "\n"), nil
 }
 
 // getTgzSuffix returns suffix for a tarball.
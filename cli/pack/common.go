@@ -9,7 +9,6 @@ import (
 	"strings"
 
 	"github.com/apex/log"
-	"github.com/otiai10/copy"
 	"github.com/tarantool/tt/cli/build"
 	"github.com/tarantool/tt/cli/cmdcontext"
 	"github.com/tarantool/tt/cli/config"
@@ -113,6 +112,18 @@ func skipArtifacts(cliOpts *config.CliOpts) func(src string) (bool, error) {
 // Returns a path to the prepared directory or error if it failed.
 func prepareBundle(cmdCtx *cmdcontext.CmdCtx, packCtx *PackCtx,
 	cliOpts *config.CliOpts, buildRocks bool) (string, error) {
+	appList, err := collectBundleApps(cmdCtx, packCtx, cliOpts)
+	if err != nil {
+		return "", err
+	}
+	return stageBundle(cmdCtx, packCtx, cliOpts, appList, buildRocks)
+}
+
+// stageBundle copies the environment with the applications into a temporary
+// directory for packing. Returns a path to the prepared directory or error if
+// it failed.
+func stageBundle(cmdCtx *cmdcontext.CmdCtx, packCtx *PackCtx,
+	cliOpts *config.CliOpts, appList []util.AppListEntry, buildRocks bool) (string, error) {
 	var err error
 	var signer integrity.Signer = nil
 
@@ -148,71 +159,19 @@ func prepareBundle(cmdCtx *cmdcontext.CmdCtx, packCtx *PackCtx,
 	}
 
 	// Copy modules step.
-	if !packCtx.CartridgeCompat && cliOpts.Modules != nil && cliOpts.Modules.Directory != "" &&
-		!packCtx.WithoutModules {
-		if err = copy.Copy(cliOpts.Modules.Directory,
-			util.JoinPaths(basePath, newOpts.Modules.Directory)); err != nil {
+	if withModules(packCtx, cliOpts) {
+		if err = copyTree(cliOpts.Modules.Directory,
+			util.JoinPaths(basePath, newOpts.Modules.Directory), nil); err != nil {
 			log.Warnf("Failed to copy modules from %q: %s", cliOpts.Modules.Directory, err)
 		}
 	}
 
-	// Collect app list step.
-	appList := []util.AppListEntry{}
-	if packCtx.AppList == nil {
-		appList, err = util.CollectAppList(cmdCtx.Cli.ConfigDir, cliOpts.Env.InstancesEnabled,
-			true)
-		if err != nil {
-			return "", err
-		}
-	} else {
-		for _, appName := range packCtx.AppList {
-			if util.IsApp(filepath.Join(cliOpts.Env.InstancesEnabled, appName)) {
-				appList = append(appList, util.AppListEntry{
-					Name:     appName,
-					Location: filepath.Join(cliOpts.Env.InstancesEnabled, appName),
-				})
-			} else {
-				log.Warnf("Skip packing of '%s': specified name is not an application.", appName)
-			}
-		}
-	}
-
-	if len(appList) == 0 {
-		err = fmt.Errorf("there are no apps found in instance_enabled directory")
-		return "", err
-	}
-
-	if packCtx.CartridgeCompat && len(appList) != 1 {
-		err = fmt.Errorf("cannot pack multiple applications in compat mode")
-		return "", err
-	}
-
-	{
-		appsToPack := ""
-		for _, appInfo := range appList {
-			appsToPack += appInfo.Name + " "
-		}
-		if packCtx.CartridgeCompat {
-			if packCtx.Name != "" {
-				// Need to change application name.
-				appList[0].Name = packCtx.Name
-			} else {
-				// Need to collect application name for
-				// VERSION and VERSION.lua files.
-				packCtx.Name = appList[0].Name
-			}
-		}
-		log.Infof("Apps to pack: %s", appsToPack)
-	}
-
 	pkgBin := util.JoinPaths(basePath, newOpts.Env.BinDir)
 	if packCtx.CartridgeCompat {
 		pkgBin = util.JoinPaths(basePath, packCtx.Name)
 	}
 	// Copy binaries step.
-	if cliOpts.Env.BinDir != "" &&
-		((!packCtx.TarantoolIsSystem && !packCtx.WithoutBinaries) ||
-			packCtx.WithBinaries) {
+	if withBinaries(packCtx, cliOpts) {
 		err = copyBinaries(cmdCtx.Cli.TarantoolCli, pkgBin)
 		if err != nil {
 			return "", err
@@ -283,6 +242,70 @@ func prepareBundle(cmdCtx *cmdcontext.CmdCtx, packCtx *PackCtx,
 	return basePath, nil
 }
 
+// collectBundleApps collects a list of applications to pack.
+func collectBundleApps(cmdCtx *cmdcontext.CmdCtx, packCtx *PackCtx,
+	cliOpts *config.CliOpts) ([]util.AppListEntry, error) {
+	var err error
+	appList := []util.AppListEntry{}
+	if packCtx.AppList == nil {
+		appList, err = util.CollectAppList(cmdCtx.Cli.ConfigDir, cliOpts.Env.InstancesEnabled,
+			true)
+		if err != nil {
+			return nil, err
+		}
+	} else {
+		for _, appName := range packCtx.AppList {
+			if util.IsApp(filepath.Join(cliOpts.Env.InstancesEnabled, appName)) {
+				appList = append(appList, util.AppListEntry{
+					Name:     appName,
+					Location: filepath.Join(cliOpts.Env.InstancesEnabled, appName),
+				})
+			} else {
+				log.Warnf("Skip packing of '%s': specified name is not an application.", appName)
+			}
+		}
+	}
+
+	if len(appList) == 0 {
+		return nil, fmt.Errorf("there are no apps found in instance_enabled directory")
+	}
+
+	if packCtx.CartridgeCompat && len(appList) != 1 {
+		return nil, fmt.Errorf("cannot pack multiple applications in compat mode")
+	}
+
+	{
+		appsToPack := ""
+		for _, appInfo := range appList {
+			appsToPack += appInfo.Name + " "
+		}
+		if packCtx.CartridgeCompat {
+			if packCtx.Name != "" {
+				// Need to change application name.
+				appList[0].Name = packCtx.Name
+			} else {
+				// Need to collect application name for
+				// VERSION and VERSION.lua files.
+				packCtx.Name = appList[0].Name
+			}
+		}
+		log.Infof("Apps to pack: %s", appsToPack)
+	}
+	return appList, nil
+}
+
+// withModules returns true if the modules directory is packed.
+func withModules(packCtx *PackCtx, cliOpts *config.CliOpts) bool {
+	return !packCtx.CartridgeCompat && cliOpts.Modules != nil &&
+		cliOpts.Modules.Directory != "" && !packCtx.WithoutModules
+}
+
+// withBinaries returns true if tt and tarantool binaries are packed.
+func withBinaries(packCtx *PackCtx, cliOpts *config.CliOpts) bool {
+	return cliOpts.Env.BinDir != "" &&
+		((!packCtx.TarantoolIsSystem && !packCtx.WithoutBinaries) || packCtx.WithBinaries)
+}
+
 // createPackageStructure initializes a standard package structure in passed directory.
 func createPackageStructure(destPath string, cartridgeCompat bool,
 	newCliOpts *config.CliOpts) error {
@@ -307,15 +330,15 @@ func createPackageStructure(destPath string, cartridgeCompat bool,
 	return nil
 }
 
-// copyAppSrc copies a source file or directory to the directory, that will be packed.
-func copyAppSrc(appPath string, appName string, basePath string,
-	skipFunc func(src string) (bool, error)) error {
+// resolveAppSrc returns a real path to the application source and a name of
+// the application in the package.
+func resolveAppSrc(appPath string, appName string) (string, string, error) {
 	// In compat mode there must be only one application, so there will be no symlinks.
 	// However, without the compat flag, encountering symlink must change appName.
 	previousPath := appPath
 	appPath, err := filepath.EvalSymlinks(previousPath)
 	if err != nil {
-		return err
+		return "", "", err
 	}
 
 	// In compat mode will be false.
@@ -324,16 +347,22 @@ func copyAppSrc(appPath string, appName string, basePath string,
 	}
 
 	if _, err = os.Stat(appPath); err != nil {
+		return "", "", err
+	}
+	return appPath, appName, nil
+}
+
+// copyAppSrc copies a source file or directory to the directory, that will be packed.
+func copyAppSrc(appPath string, appName string, basePath string,
+	skipFunc func(src string) (bool, error)) error {
+	appPath, appName, err := resolveAppSrc(appPath, appName)
+	if err != nil {
 		return err
 	}
 
 	// Copying application.
 	log.Debugf("Copying application source %q -> %q", appPath, filepath.Join(basePath, appName))
-	err = copy.Copy(appPath, filepath.Join(basePath, appName), copy.Options{
-		Skip: func(src string) (bool, error) {
-			return skipFunc(src)
-		},
-	})
+	err = copyTree(appPath, filepath.Join(basePath, appName), skipFunc)
 	if err != nil {
 		return err
 	}
@@ -387,7 +416,7 @@ func copyArtifacts(packCtx PackCtx, basePath string,
 			}
 			for _, toCopy := range copyInfo {
 				log.Debugf("Copying %q -> %q", toCopy.src, toCopy.dest)
-				if err := copy.Copy(toCopy.src, toCopy.dest); err != nil {
+				if err := copyTree(toCopy.src, toCopy.dest, nil); err != nil {
 					log.Warnf("Failed to copy artifacts: %s", err)
 				}
 			}
@@ -591,12 +620,12 @@ func normalizeGitVersion(packageVersion string) (string, error) {
 	return fmt.Sprintf("%s.%s.%s.%s", major, minor, patch, count), nil
 }
 
-// copyBinaries copies tarantool and tt binaries from the current
-// tt environment to the passed destination path.
-func copyBinaries(tntCli cmdcontext.TarantoolCli, destPath string) error {
+// findBinaries returns paths to tt and tarantool binaries of the current
+// tt environment.
+func findBinaries(tntCli cmdcontext.TarantoolCli) (string, string, error) {
 	ttBin, err := os.Executable()
 	if err != nil {
-		return err
+		return "", "", err
 	}
 	realPath, err := filepath.EvalSymlinks(ttBin)
 	if err != nil {
@@ -606,11 +635,6 @@ func copyBinaries(tntCli cmdcontext.TarantoolCli, destPath string) error {
 		ttBin = realPath
 	}
 
-	err = copy.Copy(ttBin, filepath.Join(destPath, filepath.Base(ttBin)))
-	if err != nil {
-		return err
-	}
-
 	tntBin, err := filepath.EvalSymlinks(tntCli.Executable)
 	if err != nil {
 		log.Warnf("Failed to access %s: %s", tntBin, err)
@@ -618,8 +642,23 @@ func copyBinaries(tntCli cmdcontext.TarantoolCli, destPath string) error {
 	if tntBin == "" {
 		tntBin = tntCli.Executable
 	}
+	return ttBin, tntBin, nil
+}
+
+// copyBinaries copies tarantool and tt binaries from the current
+// tt environment to the passed destination path.
+func copyBinaries(tntCli cmdcontext.TarantoolCli, destPath string) error {
+	ttBin, tntBin, err := findBinaries(tntCli)
+	if err != nil {
+		return err
+	}
+
+	err = copyTree(ttBin, filepath.Join(destPath, filepath.Base(ttBin)), nil)
+	if err != nil {
+		return err
+	}
 
-	err = copy.Copy(tntBin, filepath.Join(destPath, "tarantool"))
+	err = copyTree(tntBin, filepath.Join(destPath, "tarantool"), nil)
 	if err != nil {
 		return err
 	}
@@ -0,0 +1,246 @@
+package pack
+
+import (
+	"io"
+	"os"
+	"path/filepath"
+	"runtime"
+	"sync"
+	"sync/atomic"
+
+	"golang.org/x/sys/unix"
+)
+
+const (
+	// copyBufferSize is a size of a buffer used by a worker to copy a file.
+	copyBufferSize = 128 * 1024
+	// tmpDirPermissions are permissions of a copied directory until all its
+	// entries are copied.
+	tmpDirPermissions = 0755
+)
+
+// copyWorkers is a count of workers copying files of a tree. Copying is
+// bound by a latency of file system calls, so there are more workers than CPUs.
+var copyWorkers = 4 * runtime.NumCPU()
+
+// copyFileJob describes a regular file to copy.
+type copyFileJob struct {
+	src  string
+	dest string
+	mode os.FileMode
+}
+
+// copyDirMode describes permissions of a copied directory to set after
+// copying of all files.
+type copyDirMode struct {
+	path string
+	mode os.FileMode
+}
+
+// treeCopier walks a source tree, creates directories and symlinks and passes
+// regular files to a pool of workers.
+type treeCopier struct {
+	skip func(src string) (bool, error)
+	jobs chan copyFileJob
+	dirs []copyDirMode
+
+	// noClone is set after the first failed reflink.
+	noClone atomic.Bool
+	// noLink is set after the first failed hard link.
+	noLink atomic.Bool
+
+	mutex sync.Mutex
+	err   error
+}
+
+// fail saves the first error of workers.
+func (copier *treeCopier) fail(err error) {
+	copier.mutex.Lock()
+	defer copier.mutex.Unlock()
+	if copier.err == nil {
+		copier.err = err
+	}
+}
+
+// failed returns the first error of workers.
+func (copier *treeCopier) failed() error {
+	copier.mutex.Lock()
+	defer copier.mutex.Unlock()
+	return copier.err
+}
+
+// work copies files until the jobs channel is closed.
+func (copier *treeCopier) work(wg *sync.WaitGroup) {
+	defer wg.Done()
+	buf := make([]byte, copyBufferSize)
+	for job := range copier.jobs {
+		if copier.failed() != nil {
+			continue
+		}
+		if err := copier.stageFile(job, buf); err != nil {
+			copier.fail(err)
+		}
+	}
+}
+
+// copyEntry copies a file, a directory or a symlink.
+func (copier *treeCopier) copyEntry(src, dest string, info os.FileInfo) error {
+	if err := copier.failed(); err != nil {
+		return err
+	}
+	switch {
+	case info.Mode()&os.ModeSymlink != 0:
+		target, err := os.Readlink(src)
+		if err != nil {
+			return err
+		}
+		return os.Symlink(target, dest)
+	case info.IsDir():
+		return copier.copyDir(src, dest, info)
+	default:
+		copier.jobs <- copyFileJob{src: src, dest: dest, mode: info.Mode()}
+		return nil
+	}
+}
+
+// copyDir creates the directory and copies its entries.
+func (copier *treeCopier) copyDir(src, dest string, info os.FileInfo) error {
+	if err := os.MkdirAll(dest, tmpDirPermissions); err != nil {
+		return err
+	}
+	copier.dirs = append(copier.dirs, copyDirMode{path: dest, mode: info.Mode()})
+
+	entries, err := os.ReadDir(src)
+	if err != nil {
+		return err
+	}
+	for _, entry := range entries {
+		entrySrc := filepath.Join(src, entry.Name())
+		if copier.skip != nil {
+			skip, err := copier.skip(entrySrc)
+			if err != nil {
+				return err
+			}
+			if skip {
+				continue
+			}
+		}
+		entryInfo, err := entry.Info()
+		if err != nil {
+			return err
+		}
+		if err := copier.copyEntry(entrySrc, filepath.Join(dest, entry.Name()),
+			entryInfo); err != nil {
+			return err
+		}
+	}
+	return nil
+}
+
+// stageFile puts a regular file into the destination without copying its
+// bytes if possible. The file is cloned with a reflink if a file system
+// supports it, a file that is read-only for the process is hard linked,
+// otherwise the file is copied.
+func (copier *treeCopier) stageFile(job copyFileJob, buf []byte) error {
+	if !copier.noClone.Load() {
+		cloned, err := cloneFile(job)
+		if err != nil || cloned {
+			return err
+		}
+		copier.noClone.Store(true)
+	}
+	// Nothing can change the read-only file via the link in the bundle.
+	if !copier.noLink.Load() && unix.Access(job.src, unix.W_OK) != nil {
+		if err := os.Link(job.src, job.dest); err == nil {
+			return nil
+		}
+		copier.noLink.Store(true)
+	}
+	return copyFile(job, buf)
+}
+
+// cloneFile clones a regular file with its permissions using a reflink.
+// Returns false if the file is not cloned.
+func cloneFile(job copyFileJob) (bool, error) {
+	src, err := os.Open(job.src)
+	if err != nil {
+		return false, err
+	}
+	defer src.Close()
+
+	dest, err := os.Create(job.dest)
+	if err != nil {
+		return false, err
+	}
+	defer dest.Close()
+	if err = reflink(dest, src); err != nil {
+		dest.Close()
+		return false, os.Remove(job.dest)
+	}
+	if err = dest.Chmod(job.mode); err != nil {
+		return false, err
+	}
+	return true, dest.Close()
+}
+
+// copyFile copies a regular file with its permissions.
+func copyFile(job copyFileJob, buf []byte) error {
+	src, err := os.Open(job.src)
+	if err != nil {
+		return err
+	}
+	defer src.Close()
+
+	dest, err := os.Create(job.dest)
+	if err != nil {
+		return err
+	}
+	defer dest.Close()
+	if err = dest.Chmod(job.mode); err != nil {
+		return err
+	}
+	if _, err = io.CopyBuffer(dest, src, buf); err != nil {
+		return err
+	}
+	return dest.Close()
+}
+
+// copyTree copies a file, a symlink or a directory tree from src to dest.
+// Symlinks are copied as is, permissions of files and directories are kept.
+// The skip function is called for each entry inside the src directory and
+// may be nil. Regular files are staged concurrently by a pool of workers
+// with reflinks, hard links or copying, see stageFile.
+func copyTree(src, dest string, skip func(src string) (bool, error)) error {
+	info, err := os.Lstat(src)
+	if err != nil {
+		return err
+	}
+	if err = os.MkdirAll(filepath.Dir(dest), os.ModePerm); err != nil {
+		return err
+	}
+
+	copier := treeCopier{
+		skip: skip,
+		jobs: make(chan copyFileJob, copyWorkers),
+	}
+	var wg sync.WaitGroup
+	for i := 0; i < copyWorkers; i++ {
+		wg.Add(1)
+		go copier.work(&wg)
+	}
+	err = copier.copyEntry(src, dest, info)
+	close(copier.jobs)
+	wg.Wait()
+	if err == nil {
+		err = copier.failed()
+	}
+
+	// Permissions of directories are set after copying of all their files,
+	// so files could be copied into read-only directories too.
+	for i := len(copier.dirs) - 1; i >= 0; i-- {
+		if chmodErr := os.Chmod(copier.dirs[i].path, copier.dirs[i].mode); err == nil {
+			err = chmodErr
+		}
+	}
+	return err
+}
@@ -0,0 +1,149 @@
+package pack
+
+import (
+	"fmt"
+	"os"
+	"path/filepath"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestCopyTree(t *testing.T) {
+	srcDir := t.TempDir()
+	destDir := filepath.Join(t.TempDir(), "dest")
+
+	require.NoError(t, os.MkdirAll(filepath.Join(srcDir, "dir1", "dir2"), 0755))
+	require.NoError(t, os.MkdirAll(filepath.Join(srcDir, "skipped"), 0755))
+	require.NoError(t, os.MkdirAll(filepath.Join(srcDir, "readonly"), 0755))
+	files := map[string]os.FileMode{
+		"file.lua":               0644,
+		"dir1/script.sh":         0755,
+		"dir1/dir2/data.txt":     0600,
+		"skipped/file.txt":       0644,
+		"readonly/readonly.text": 0444,
+	}
+	for i := 0; i < 100; i++ {
+		files[filepath.Join("dir1", "dir2", fmt.Sprintf("file%d.txt", i))] = 0644
+	}
+	for name, mode := range files {
+		path := filepath.Join(srcDir, name)
+		require.NoError(t, os.WriteFile(path, []byte(name), mode))
+		require.NoError(t, os.Chmod(path, mode))
+	}
+	require.NoError(t, os.Chmod(filepath.Join(srcDir, "readonly"), 0555))
+	t.Cleanup(func() {
+		os.Chmod(filepath.Join(srcDir, "readonly"), 0755)
+		os.Chmod(filepath.Join(destDir, "readonly"), 0755)
+	})
+	require.NoError(t, os.Symlink("dir1/script.sh", filepath.Join(srcDir, "link")))
+
+	err := copyTree(srcDir, destDir, func(src string) (bool, error) {
+		return filepath.Base(src) == "skipped", nil
+	})
+	require.NoError(t, err)
+
+	for name, mode := range files {
+		path := filepath.Join(destDir, name)
+		if filepath.Dir(name) == "skipped" {
+			assert.NoFileExists(t, path)
+			continue
+		}
+		data, err := os.ReadFile(path)
+		require.NoError(t, err)
+		assert.Equal(t, name, string(data))
+		info, err := os.Stat(path)
+		require.NoError(t, err)
+		assert.Equal(t, mode, info.Mode().Perm(), name)
+	}
+	assert.NoDirExists(t, filepath.Join(destDir, "skipped"))
+
+	info, err := os.Stat(filepath.Join(destDir, "readonly"))
+	require.NoError(t, err)
+	assert.Equal(t, os.FileMode(0555), info.Mode().Perm())
+
+	target, err := os.Readlink(filepath.Join(destDir, "link"))
+	require.NoError(t, err)
+	assert.Equal(t, "dir1/script.sh", target)
+}
+
+func TestCopyTree_file(t *testing.T) {
+	srcDir := t.TempDir()
+	src := filepath.Join(srcDir, "tarantool")
+	require.NoError(t, os.WriteFile(src, []byte("binary"), 0755))
+	dest := filepath.Join(t.TempDir(), "bin", "tarantool")
+
+	require.NoError(t, copyTree(src, dest, nil))
+	data, err := os.ReadFile(dest)
+	require.NoError(t, err)
+	assert.Equal(t, "binary", string(data))
+	info, err := os.Stat(dest)
+	require.NoError(t, err)
+	assert.Equal(t, os.FileMode(0755), info.Mode().Perm())
+}
+
+func TestCopyTree_errors(t *testing.T) {
+	srcDir := t.TempDir()
+	destDir := t.TempDir()
+
+	err := copyTree(filepath.Join(srcDir, "not_exists"), destDir, nil)
+	assert.ErrorIs(t, err, os.ErrNotExist)
+
+	require.NoError(t, os.WriteFile(filepath.Join(srcDir, "file"), []byte{}, 0644))
+	err = copyTree(srcDir, filepath.Join(destDir, "dest"), func(src string) (bool, error) {
+		return false, os.ErrPermission
+	})
+	assert.ErrorIs(t, err, os.ErrPermission)
+}
+
+func TestCopyTree_staging(t *testing.T) {
+	srcDir := t.TempDir()
+	destDir := filepath.Join(t.TempDir(), "dest")
+	require.NoError(t, os.WriteFile(filepath.Join(srcDir, "writable"), []byte("src"), 0644))
+	require.NoError(t, os.WriteFile(filepath.Join(srcDir, "readonly"), []byte("src"), 0444))
+
+	require.NoError(t, copyTree(srcDir, destDir, nil))
+
+	// A writable file is not shared with the bundle.
+	require.NoError(t, os.WriteFile(filepath.Join(destDir, "writable"), []byte("dest"), 0644))
+	data, err := os.ReadFile(filepath.Join(srcDir, "writable"))
+	require.NoError(t, err)
+	assert.Equal(t, "src", string(data))
+
+	data, err = os.ReadFile(filepath.Join(destDir, "readonly"))
+	require.NoError(t, err)
+	assert.Equal(t, "src", string(data))
+}
+
+func TestStageFile_link(t *testing.T) {
+	if os.Getuid() == 0 {
+		t.Skip("root can write read-only files")
+	}
+	srcDir := t.TempDir()
+	destDir := t.TempDir()
+	for _, name := range []string{"writable", "readonly"} {
+		mode := os.FileMode(0644)
+		if name == "readonly" {
+			mode = 0444
+		}
+		require.NoError(t, os.WriteFile(filepath.Join(srcDir, name), []byte(name), mode))
+	}
+
+	copier := treeCopier{}
+	copier.noClone.Store(true)
+	for _, name := range []string{"writable", "readonly"} {
+		job := copyFileJob{
+			src:  filepath.Join(srcDir, name),
+			dest: filepath.Join(destDir, name),
+		}
+		srcInfo, err := os.Stat(job.src)
+		require.NoError(t, err)
+		job.mode = srcInfo.Mode()
+		require.NoError(t, copier.stageFile(job, make([]byte, copyBufferSize)))
+		destInfo, err := os.Stat(job.dest)
+		require.NoError(t, err)
+		// Only the read-only file is hard linked.
+		assert.Equal(t, name == "readonly", os.SameFile(srcInfo, destInfo), name)
+	}
+}
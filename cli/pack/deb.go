@@ -116,7 +116,7 @@ func (packer *debPacker) Run(cmdCtx *cmdcontext.CmdCtx, packCtx *PackCtx,
 
 	// Create data.tar.gz.
 	dataArchivePath := filepath.Join(packageDir, dataArchiveName)
-	err = WriteTgzArchive(packageDataDir, dataArchivePath)
+	err = WriteTgzArchive(packageDataDir, dataArchivePath, packCtx.Compress)
 	if err != nil {
 		return err
 	}
@@ -132,7 +132,7 @@ func (packer *debPacker) Run(cmdCtx *cmdcontext.CmdCtx, packCtx *PackCtx,
 
 	// Create control.tar.gz.
 	controlArchivePath := filepath.Join(packageDir, controlArchiveName)
-	err = WriteTgzArchive(controlDirPath, controlArchivePath)
+	err = WriteTgzArchive(controlDirPath, controlArchivePath, packCtx.Compress)
 	if err != nil {
 		return err
 	}
@@ -0,0 +1,229 @@
+package pack
+
+import (
+	"bytes"
+	"compress/flate"
+	"compress/gzip"
+	"encoding/binary"
+	"fmt"
+	"hash/crc32"
+	"io"
+	"runtime"
+	"sync"
+)
+
+const (
+	// gzipBlockSize is a size of uncompressed data compressed by a single thread.
+	gzipBlockSize = 1 << 20
+	// gzipDictSize is a size of a deflate window. The tail of a previous block
+	// of this size is a dictionary of the next block.
+	gzipDictSize = 32 << 10
+)
+
+// level returns the compression level or the default one if it is not set.
+func (ctx CompressCtx) level(defaultLevel int) int {
+	if ctx.Level == 0 {
+		return defaultLevel
+	}
+	return ctx.Level
+}
+
+// threads returns the count of compressing threads or the count of CPUs if
+// it is not set.
+func (ctx CompressCtx) threads() int {
+	if ctx.Threads <= 0 {
+		return runtime.NumCPU()
+	}
+	return ctx.Threads
+}
+
+// gzipBlock is a block of data compressed by a thread.
+type gzipBlock struct {
+	data  bytes.Buffer
+	err   error
+	ready chan struct{}
+}
+
+// parallelGzipWriter compresses blocks of data in parallel into a single gzip
+// member readable by any gzip decoder. Every block is compressed with the tail
+// of the previous block as a dictionary and flushed to a byte boundary, so
+// the compressed blocks are concatenated into a single deflate stream.
+type parallelGzipWriter struct {
+	writer io.Writer
+	level  int
+
+	block []byte
+	dict  []byte
+	crc   uint32
+	size  uint32
+
+	// sem limits a count of compressing threads.
+	sem chan struct{}
+	// blocks is a queue of blocks in the order of the data.
+	blocks chan *gzipBlock
+	done   chan struct{}
+	closed bool
+
+	mutex sync.Mutex
+	err   error
+}
+
+// newParallelGzipWriter creates a gzip writer compressing data with the level
+// by the count of threads.
+func newParallelGzipWriter(writer io.Writer, level int,
+	threads int) (*parallelGzipWriter, error) {
+	if level < gzip.HuffmanOnly || level > gzip.BestCompression {
+		return nil, fmt.Errorf("invalid gzip compression level: %d", level)
+	}
+	if threads < 1 {
+		return nil, fmt.Errorf("invalid count of gzip threads: %d", threads)
+	}
+	gzipWriter := &parallelGzipWriter{
+		writer: writer,
+		level:  level,
+		block:  make([]byte, 0, gzipBlockSize),
+		sem:    make(chan struct{}, threads),
+		blocks: make(chan *gzipBlock, threads),
+		done:   make(chan struct{}),
+	}
+	go gzipWriter.writeBlocks()
+	return gzipWriter, nil
+}
+
+// fail saves the first error.
+func (gzipWriter *parallelGzipWriter) fail(err error) {
+	gzipWriter.mutex.Lock()
+	defer gzipWriter.mutex.Unlock()
+	if gzipWriter.err == nil {
+		gzipWriter.err = err
+	}
+}
+
+// failed returns the first error.
+func (gzipWriter *parallelGzipWriter) failed() error {
+	gzipWriter.mutex.Lock()
+	defer gzipWriter.mutex.Unlock()
+	return gzipWriter.err
+}
+
+// header returns a gzip header.
+func (gzipWriter *parallelGzipWriter) header() []byte {
+	header := []byte{0x1f, 0x8b, 8, 0, 0, 0, 0, 0, 0, 255}
+	switch gzipWriter.level {
+	case gzip.BestCompression:
+		header[8] = 2
+	case gzip.BestSpeed:
+		header[8] = 4
+	}
+	return header
+}
+
+// writeBlocks writes the header, compressed blocks in the order of the queue
+// and the trailer into the writer.
+func (gzipWriter *parallelGzipWriter) writeBlocks() {
+	defer close(gzipWriter.done)
+	if _, err := gzipWriter.writer.Write(gzipWriter.header()); err != nil {
+		gzipWriter.fail(err)
+	}
+	for block := range gzipWriter.blocks {
+		<-block.ready
+		if gzipWriter.failed() != nil {
+			continue
+		}
+		if block.err != nil {
+			gzipWriter.fail(block.err)
+			continue
+		}
+		if _, err := gzipWriter.writer.Write(block.data.Bytes()); err != nil {
+			gzipWriter.fail(err)
+		}
+	}
+	if gzipWriter.failed() != nil {
+		return
+	}
+	var trailer [8]byte
+	binary.LittleEndian.PutUint32(trailer[:4], gzipWriter.crc)
+	binary.LittleEndian.PutUint32(trailer[4:], gzipWriter.size)
+	if _, err := gzipWriter.writer.Write(trailer[:]); err != nil {
+		gzipWriter.fail(err)
+	}
+}
+
+// compress compresses the current block in a separate thread.
+func (gzipWriter *parallelGzipWriter) compress(last bool) {
+	data := gzipWriter.block
+	dict := gzipWriter.dict
+	gzipWriter.crc = crc32.Update(gzipWriter.crc, crc32.IEEETable, data)
+	gzipWriter.size += uint32(len(data))
+	if !last {
+		// The block is full, so its tail is the next dictionary.
+		gzipWriter.dict = data[len(data)-gzipDictSize:]
+		gzipWriter.block = make([]byte, 0, gzipBlockSize)
+	}
+
+	block := &gzipBlock{ready: make(chan struct{})}
+	gzipWriter.blocks <- block
+	gzipWriter.sem <- struct{}{}
+	go func() {
+		defer func() {
+			<-gzipWriter.sem
+			close(block.ready)
+		}()
+		flateWriter, err := flate.NewWriterDict(&block.data, gzipWriter.level, dict)
+		if err != nil {
+			block.err = err
+			return
+		}
+		if _, err = flateWriter.Write(data); err != nil {
+			block.err = err
+			return
+		}
+		if last {
+			block.err = flateWriter.Close()
+		} else {
+			block.err = flateWriter.Flush()
+		}
+	}()
+}
+
+// Write compresses the data.
+func (gzipWriter *parallelGzipWriter) Write(data []byte) (int, error) {
+	if gzipWriter.closed {
+		return 0, fmt.Errorf("write to the closed gzip writer")
+	}
+	written := 0
+	for len(data) > 0 {
+		if err := gzipWriter.failed(); err != nil {
+			return written, err
+		}
+		count := min(len(data), gzipBlockSize-len(gzipWriter.block))
+		gzipWriter.block = append(gzipWriter.block, data[:count]...)
+		data = data[count:]
+		written += count
+		if len(gzipWriter.block) == gzipBlockSize {
+			gzipWriter.compress(false)
+		}
+	}
+	return written, nil
+}
+
+// Close compresses the rest of the data and writes the gzip trailer. It does
+// not close the underlying writer.
+func (gzipWriter *parallelGzipWriter) Close() error {
+	if gzipWriter.closed {
+		return nil
+	}
+	gzipWriter.closed = true
+	gzipWriter.compress(true)
+	close(gzipWriter.blocks)
+	<-gzipWriter.done
+	return gzipWriter.failed()
+}
+
+// min returns the minimum of two integers.
+func min(a, b int) int {
+	if a < b {
+		return a
+	}
+	return b
+}
@@ -0,0 +1,70 @@
+package pack
+
+import (
+	"bytes"
+	"compress/gzip"
+	"errors"
+	"io"
+	"math/rand"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestParallelGzipWriter(t *testing.T) {
+	random := rand.New(rand.NewSource(0))
+	data := make([]byte, 2*gzipBlockSize+12345)
+	for i := range data {
+		// Compressible data with matches crossing borders of blocks.
+		data[i] = "tarantool"[random.Intn(9)]
+	}
+
+	for _, size := range []int{0, 1, gzipBlockSize, len(data)} {
+		for _, level := range []int{gzip.BestSpeed, gzip.DefaultCompression,
+			gzip.BestCompression} {
+			for _, threads := range []int{1, 4} {
+				var compressed bytes.Buffer
+				writer, err := newParallelGzipWriter(&compressed, level, threads)
+				require.NoError(t, err)
+				// Write in pieces not aligned with blocks.
+				for offset := 0; offset < size; offset += 100000 {
+					_, err = writer.Write(data[offset:min(size, offset+100000)])
+					require.NoError(t, err)
+				}
+				require.NoError(t, writer.Close())
+
+				reader, err := gzip.NewReader(&compressed)
+				require.NoError(t, err)
+				reader.Multistream(false)
+				decompressed, err := io.ReadAll(reader)
+				require.NoError(t, err)
+				assert.Equalf(t, data[:size], decompressed,
+					"size %d, level %d, threads %d", size, level, threads)
+				assert.Equal(t, 0, compressed.Len())
+			}
+		}
+	}
+}
+
+type failingWriter struct{}
+
+func (failingWriter) Write(data []byte) (int, error) {
+	return 0, errors.New("no space left on device")
+}
+
+func TestParallelGzipWriter_errors(t *testing.T) {
+	_, err := newParallelGzipWriter(io.Discard, 10, 1)
+	assert.ErrorContains(t, err, "invalid gzip compression level: 10")
+	_, err = newParallelGzipWriter(io.Discard, gzip.BestSpeed, 0)
+	assert.ErrorContains(t, err, "invalid count of gzip threads: 0")
+
+	writer, err := newParallelGzipWriter(failingWriter{}, gzip.BestSpeed, 2)
+	require.NoError(t, err)
+	data := make([]byte, 4*gzipBlockSize)
+	for err == nil {
+		_, err = writer.Write(data)
+	}
+	assert.ErrorContains(t, err, "no space left on device")
+	assert.ErrorContains(t, writer.Close(), "no space left on device")
+}
@@ -1,7 +1,9 @@
 package pack
 
 import (
+	"compress/gzip"
 	"errors"
+	"fmt"
 
 	"github.com/tarantool/tt/cli/cmdcontext"
 )
@@ -23,6 +25,15 @@ func FillCtx(cmdCtx *cmdcontext.CmdCtx, packCtx *PackCtx,
 		return errors.New("cannot pack with integrity checks in cartridge-compat mode")
 	}
 
+	if packCtx.Compress.Level < 0 || packCtx.Compress.Level > gzip.BestCompression {
+		return fmt.Errorf("invalid compression level %d, expected from %d to %d",
+			packCtx.Compress.Level, gzip.BestSpeed, gzip.BestCompression)
+	}
+	if packCtx.Compress.Threads < 0 {
+		return fmt.Errorf("invalid count of compression threads %d",
+			packCtx.Compress.Threads)
+	}
+
 	packCtx.TarantoolIsSystem = cmdCtx.Cli.IsSystem
 	packCtx.TarantoolExecutable = cmdCtx.Cli.TarantoolCli.Executable
 	packCtx.Type = args[0]
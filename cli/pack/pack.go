@@ -34,6 +34,8 @@ type PackCtx struct {
 	TarantoolVersion string
 	// IntegrityPrivateKey contains the path to private key for signing hash files.
 	IntegrityPrivateKey string
+	// Compress contains flags of gzip compression of packages.
+	Compress CompressCtx
 }
 
 // ArchiveCtx contains flags specific for tgz type.
@@ -42,6 +44,16 @@ type ArchiveCtx struct {
 	All bool
 }
 
+// CompressCtx contains flags of gzip compression of packages.
+type CompressCtx struct {
+	// Level is a gzip compression level from 1 to 9. A default level of
+	// the package type is used if it is 0.
+	Level int
+	// Threads is a count of threads compressing data in parallel. The count
+	// of CPUs is used if it is 0.
+	Threads int
+}
+
 // RpmDebCtx contains flags specific for RPM/DEB type.
 type RpmDebCtx struct {
 	// WithTarantoolDeps means to add to package dependencies versions
@@ -0,0 +1,13 @@
+package pack
+
+import (
+	"os"
+
+	"golang.org/x/sys/unix"
+)
+
+// reflink makes the dest file share data blocks of the src file. Supported by
+// btrfs, xfs and other copy-on-write file systems.
+func reflink(dest, src *os.File) error {
+	return unix.IoctlFileClone(int(dest.Fd()), int(src.Fd()))
+}
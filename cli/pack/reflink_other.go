@@ -0,0 +1,13 @@
+//go:build !linux
+
+package pack
+
+import (
+	"errors"
+	"os"
+)
+
+// reflink is not supported on the platform.
+func reflink(dest, src *os.File) error {
+	return errors.New("reflinks are not supported")
+}
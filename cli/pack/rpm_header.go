@@ -1,6 +1,7 @@
 package pack
 
 import (
+	"compress/gzip"
 	"fmt"
 	"io/fs"
 	"os"
@@ -156,7 +157,8 @@ func genRpmHeader(relPaths []string, cpioPath, compresedCpioPath, packageFilesDi
 
 		{ID: tagPayloadFormat, Type: rpmTypeString, Value: "cpio"},
 		{ID: tagPayloadCompressor, Type: rpmTypeString, Value: "gzip"},
-		{ID: tagPayloadFlags, Type: rpmTypeString, Value: "5"},
+		{ID: tagPayloadFlags, Type: rpmTypeString,
+			Value: strconv.Itoa(packCtx.Compress.level(gzip.BestCompression))},
 
 		{ID: tagPreinProg, Type: rpmTypeString, Value: "/bin/sh"},
 		{ID: tagPostinProg, Type: rpmTypeString, Value: "/bin/sh"},
@@ -80,7 +80,7 @@ func packRpm(cmdCtx *cmdcontext.CmdCtx, packCtx *PackCtx, opts *config.CliOpts,
 	}
 
 	compresedCpioPath := filepath.Join(packageDir, "cpio.gz")
-	if err := CompressGzip(cpioPath, compresedCpioPath); err != nil {
+	if err := CompressGzip(cpioPath, compresedCpioPath, packCtx.Compress); err != nil {
 		return fmt.Errorf("failed to compress CPIO: %s", err)
 	}
 
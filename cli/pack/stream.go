@@ -0,0 +1,337 @@
+package pack
+
+import (
+	"archive/tar"
+	"bytes"
+	"io"
+	"os"
+	"path/filepath"
+	"sort"
+	"time"
+
+	"github.com/apex/log"
+	"github.com/tarantool/tt/cli/cmdcontext"
+	"github.com/tarantool/tt/cli/config"
+	"github.com/tarantool/tt/cli/configure"
+	"github.com/tarantool/tt/cli/util"
+	"gopkg.in/yaml.v2"
+)
+
+// bundleRootPermissions are permissions of the root directory entry of a
+// streamed bundle, the same as of a temporary directory of a staged bundle.
+const bundleRootPermissions = 0700
+
+// tarBundle writes entries of a bundle into a tar archive directly from
+// sources without staging the bundle in a temporary directory.
+type tarBundle struct {
+	writer *tar.Writer
+	// modTime is a modification time of generated entries.
+	modTime time.Time
+	// dirs contains names of written directories.
+	dirs map[string]bool
+	// generated contains contents of generated files by names. The files
+	// replace files with the same names from sources.
+	generated map[string][]byte
+}
+
+// newTarBundle creates a bundle writing entries into the writer.
+func newTarBundle(writer io.Writer) *tarBundle {
+	return &tarBundle{
+		writer:    tar.NewWriter(writer),
+		modTime:   time.Now(),
+		dirs:      map[string]bool{},
+		generated: map[string][]byte{},
+	}
+}
+
+// writeDir writes a directory entry with its missing parents.
+func (bundle *tarBundle) writeDir(name string, mode os.FileMode) error {
+	name = filepath.Clean(name)
+	if bundle.dirs[name] {
+		return nil
+	}
+	if parent := filepath.Dir(name); parent != name {
+		if err := bundle.writeDir(parent, dirPermissions); err != nil {
+			return err
+		}
+	}
+	bundle.dirs[name] = true
+	return bundle.writer.WriteHeader(&tar.Header{
+		Typeflag: tar.TypeDir,
+		Name:     name,
+		Mode:     int64(mode.Perm()),
+		ModTime:  bundle.modTime,
+	})
+}
+
+// writeSymlink writes a symlink entry.
+func (bundle *tarBundle) writeSymlink(name string, target string) error {
+	if err := bundle.writeDir(filepath.Dir(name), dirPermissions); err != nil {
+		return err
+	}
+	return bundle.writer.WriteHeader(&tar.Header{
+		Typeflag: tar.TypeSymlink,
+		Name:     filepath.Clean(name),
+		Linkname: target,
+		Mode:     0777,
+		ModTime:  bundle.modTime,
+	})
+}
+
+// writeGenerated writes generated files.
+func (bundle *tarBundle) writeGenerated() error {
+	names := make([]string, 0, len(bundle.generated))
+	for name := range bundle.generated {
+		names = append(names, name)
+	}
+	sort.Strings(names)
+	for _, name := range names {
+		if err := bundle.writeDir(filepath.Dir(name), dirPermissions); err != nil {
+			return err
+		}
+		content := bundle.generated[name]
+		err := bundle.writer.WriteHeader(&tar.Header{
+			Typeflag: tar.TypeReg,
+			Name:     name,
+			Size:     int64(len(content)),
+			Mode:     0644,
+			ModTime:  bundle.modTime,
+		})
+		if err != nil {
+			return err
+		}
+		if _, err = bundle.writer.Write(content); err != nil {
+			return err
+		}
+	}
+	return nil
+}
+
+// writeTree writes entries of a file, a symlink or a directory tree like
+// copyTree copies them into a staged bundle.
+func (bundle *tarBundle) writeTree(src string, name string,
+	skip func(src string) (bool, error)) error {
+	info, err := os.Lstat(src)
+	if err != nil {
+		return err
+	}
+	if err = bundle.writeDir(filepath.Dir(name), dirPermissions); err != nil {
+		return err
+	}
+	return bundle.writeEntry(src, filepath.Clean(name), info, skip)
+}
+
+// writeEntry writes an entry of a file, a symlink or a directory with its entries.
+func (bundle *tarBundle) writeEntry(src string, name string, info os.FileInfo,
+	skip func(src string) (bool, error)) error {
+	if _, ok := bundle.generated[name]; ok {
+		log.Debugf("File %s will be overwritten", name)
+		return nil
+	}
+
+	link := ""
+	if info.Mode()&os.ModeSymlink != 0 {
+		var err error
+		if link, err = os.Readlink(src); err != nil {
+			return err
+		}
+	}
+	header, err := tar.FileInfoHeader(info, link)
+	if err != nil {
+		return err
+	}
+	header.Name = name
+
+	if !info.IsDir() {
+		if err := bundle.writer.WriteHeader(header); err != nil {
+			return err
+		}
+		if info.Mode().IsRegular() {
+			return writeFileToWriter(src, bundle.writer)
+		}
+		return nil
+	}
+
+	if !bundle.dirs[name] {
+		bundle.dirs[name] = true
+		if err := bundle.writer.WriteHeader(header); err != nil {
+			return err
+		}
+	}
+	entries, err := os.ReadDir(src)
+	if err != nil {
+		return err
+	}
+	for _, entry := range entries {
+		entrySrc := filepath.Join(src, entry.Name())
+		if skip != nil {
+			skipped, err := skip(entrySrc)
+			if err != nil {
+				return err
+			}
+			if skipped {
+				continue
+			}
+		}
+		entryInfo, err := entry.Info()
+		if err != nil {
+			return err
+		}
+		err = bundle.writeEntry(entrySrc, filepath.Join(name, entry.Name()), entryInfo, skip)
+		if err != nil {
+			return err
+		}
+	}
+	return nil
+}
+
+// close writes the generated files and the tar footer.
+func (bundle *tarBundle) close() error {
+	if err := bundle.writeGenerated(); err != nil {
+		return err
+	}
+	return bundle.writer.Close()
+}
+
+// canStreamBundle returns true if the bundle could be written into an archive
+// directly from sources: nothing is built, signed or collected from instances
+// in the bundle.
+func canStreamBundle(packCtx *PackCtx, cliOpts *config.CliOpts,
+	appList []util.AppListEntry) bool {
+	if packCtx.IntegrityPrivateKey != "" || packCtx.Archive.All {
+		return false
+	}
+
+	dirs := []string{}
+	for _, appInfo := range appList {
+		appPath, err := filepath.EvalSymlinks(appInfo.Location)
+		if err != nil {
+			return false
+		}
+		dirs = append(dirs, appPath)
+	}
+	if withModules(packCtx, cliOpts) {
+		dirs = append(dirs, cliOpts.Modules.Directory)
+	}
+	for _, dir := range dirs {
+		info, err := os.Stat(dir)
+		if err != nil {
+			return false
+		}
+		if !info.IsDir() {
+			continue
+		}
+		// Rocks are built in the staged bundle, see buildAllRocks.
+		if _, err = findRocks(dir); err == nil || err.Error() != "rockspec not found" {
+			return false
+		}
+	}
+	return true
+}
+
+// streamBundle writes the bundle into the writer as a tar archive with the
+// same entries as prepareBundle stages in a temporary directory.
+func streamBundle(cmdCtx *cmdcontext.CmdCtx, packCtx *PackCtx, cliOpts *config.CliOpts,
+	appList []util.AppListEntry, writer io.Writer) error {
+	bundle := newTarBundle(writer)
+	newOpts := createNewOpts(cliOpts, packCtx.CartridgeCompat)
+
+	if err := bundle.writeDir(".", bundleRootPermissions); err != nil {
+		return err
+	}
+
+	// Generated files.
+	var envBuf bytes.Buffer
+	if err := yaml.NewEncoder(&envBuf).Encode(newOpts); err != nil {
+		return err
+	}
+	if packCtx.CartridgeCompat {
+		bundle.generated[filepath.Join(appList[0].Name, configure.ConfigName)] = envBuf.Bytes()
+
+		appPath, _, err := resolveAppSrc(appList[0].Location, appList[0].Name)
+		if err != nil {
+			return err
+		}
+		log.Infof("Generate %s file", versionFileName)
+		content, err := versionFileContent(appPath, cmdCtx, packCtx)
+		if err != nil {
+			log.Warnf("Failed to generate VERSION file: %s", err)
+		} else {
+			bundle.generated[filepath.Join(packCtx.Name, versionFileName)] = content
+		}
+		log.Infof("Generate %s file", versionLuaFileName)
+		bundle.generated[filepath.Join(packCtx.Name, versionLuaFileName)] =
+			versionLuaFileContent(packCtx)
+	} else {
+		bundle.generated[configure.ConfigName] = envBuf.Bytes()
+	}
+
+	// Modules. The directory keeps permissions of the source directory.
+	if withModules(packCtx, cliOpts) {
+		err := bundle.writeTree(cliOpts.Modules.Directory, newOpts.Modules.Directory, nil)
+		if err != nil {
+			log.Warnf("Failed to copy modules from %q: %s", cliOpts.Modules.Directory, err)
+		}
+	}
+	if !packCtx.CartridgeCompat {
+		for _, dir := range []string{newOpts.Env.BinDir, newOpts.Modules.Directory,
+			newOpts.Env.IncludeDir, newOpts.Env.InstancesEnabled} {
+			if err := bundle.writeDir(dir, dirPermissions); err != nil {
+				return err
+			}
+		}
+	}
+
+	// Binaries.
+	if withBinaries(packCtx, cliOpts) {
+		pkgBin := newOpts.Env.BinDir
+		if packCtx.CartridgeCompat {
+			pkgBin = packCtx.Name
+		}
+		ttBin, tntBin, err := findBinaries(cmdCtx.Cli.TarantoolCli)
+		if err != nil {
+			return err
+		}
+		if err = bundle.writeTree(ttBin, filepath.Join(pkgBin, filepath.Base(ttBin)),
+			nil); err != nil {
+			return err
+		}
+		if err = bundle.writeTree(tntBin, filepath.Join(pkgBin, "tarantool"), nil); err != nil {
+			return err
+		}
+	}
+
+	// Applications.
+	for _, appInfo := range appList {
+		appName := filepath.Base(appInfo.Location)
+		if packCtx.CartridgeCompat {
+			appName = appInfo.Name
+		}
+		appPath, appName, err := resolveAppSrc(appInfo.Location, appName)
+		if err != nil {
+			return err
+		}
+		log.Debugf("Writing application source %q -> %q", appPath, appName)
+		if err = bundle.writeTree(appPath, appName, skipArtifacts(cliOpts)); err != nil {
+			return err
+		}
+
+		if !packCtx.CartridgeCompat {
+			err = bundle.writeSymlink(filepath.Join(newOpts.Env.InstancesEnabled, appInfo.Name),
+				filepath.Join("..", filepath.Base(appPath)))
+			if err != nil {
+				return err
+			}
+		}
+	}
+
+	return bundle.close()
+}
+
+// writeTgzBundle writes the bundle directly into a TGZ archive.
+func writeTgzBundle(cmdCtx *cmdcontext.CmdCtx, packCtx *PackCtx, cliOpts *config.CliOpts,
+	appList []util.AppListEntry, destFilePath string) error {
+	return writeTgz(destFilePath, packCtx.Compress, func(writer io.Writer) error {
+		return streamBundle(cmdCtx, packCtx, cliOpts, appList, writer)
+	})
+}
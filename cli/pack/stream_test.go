@@ -0,0 +1,98 @@
+package pack
+
+import (
+	"archive/tar"
+	"bytes"
+	"io"
+	"os"
+	"path/filepath"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+	"github.com/tarantool/tt/cli/cmdcontext"
+	"github.com/tarantool/tt/cli/configure"
+	"github.com/tarantool/tt/cli/util"
+)
+
+type tarEntry struct {
+	typeflag byte
+	linkname string
+	content  string
+}
+
+func readTarEntries(t *testing.T, reader io.Reader) map[string]tarEntry {
+	t.Helper()
+	entries := map[string]tarEntry{}
+	tarReader := tar.NewReader(reader)
+	for {
+		header, err := tarReader.Next()
+		if err == io.EOF {
+			break
+		}
+		require.NoError(t, err)
+		content, err := io.ReadAll(tarReader)
+		require.NoError(t, err)
+		entry := tarEntry{typeflag: header.Typeflag, content: string(content)}
+		if header.Typeflag == tar.TypeSymlink {
+			entry.linkname = header.Linkname
+		}
+		require.NotContains(t, entries, header.Name)
+		entries[header.Name] = entry
+	}
+	return entries
+}
+
+func Test_streamBundle(t *testing.T) {
+	cliOpts, configPath, err := configure.GetCliOpts("testdata/env1/tt.yaml")
+	require.NoError(t, err)
+	cmdCtx := &cmdcontext.CmdCtx{
+		Cli: cmdcontext.CliCtx{
+			ConfigDir: filepath.Dir(configPath),
+		},
+	}
+	packCtx := &PackCtx{WithoutBinaries: true}
+
+	appList, err := collectBundleApps(cmdCtx, packCtx, cliOpts)
+	require.NoError(t, err)
+	require.True(t, canStreamBundle(packCtx, cliOpts, appList))
+
+	var streamed bytes.Buffer
+	require.NoError(t, streamBundle(cmdCtx, packCtx, cliOpts, appList, &streamed))
+
+	bundleDir, err := stageBundle(cmdCtx, packCtx, cliOpts, appList, false)
+	require.NoError(t, err)
+	defer os.RemoveAll(bundleDir)
+	var staged bytes.Buffer
+	require.NoError(t, WriteTarArchive(bundleDir, &staged))
+
+	streamedEntries := readTarEntries(t, &streamed)
+	assert.Equal(t, readTarEntries(t, &staged), streamedEntries)
+	assert.Contains(t, streamedEntries, "tt.yaml")
+	assert.Equal(t, "../multi", streamedEntries["instances.enabled/multi"].linkname)
+	assert.NotContains(t, streamedEntries, "multi/var/lib")
+}
+
+func Test_canStreamBundle(t *testing.T) {
+	cliOpts, configPath, err := configure.GetCliOpts("testdata/env1/tt.yaml")
+	require.NoError(t, err)
+	cmdCtx := &cmdcontext.CmdCtx{
+		Cli: cmdcontext.CliCtx{
+			ConfigDir: filepath.Dir(configPath),
+		},
+	}
+	appList, err := collectBundleApps(cmdCtx, &PackCtx{}, cliOpts)
+	require.NoError(t, err)
+
+	assert.True(t, canStreamBundle(&PackCtx{}, cliOpts, appList))
+	assert.False(t, canStreamBundle(&PackCtx{IntegrityPrivateKey: "key.pem"}, cliOpts, appList))
+	assert.False(t, canStreamBundle(&PackCtx{Archive: ArchiveCtx{All: true}}, cliOpts, appList))
+
+	// Rocks of the application are built in the staged bundle.
+	appDir := t.TempDir()
+	require.NoError(t, os.WriteFile(filepath.Join(appDir, "app-scm-1.rockspec"), []byte{}, 0644))
+	assert.False(t, canStreamBundle(&PackCtx{}, cliOpts, append(appList, util.AppListEntry{
+		Name:     "app",
+		Location: appDir,
+	})))
+}
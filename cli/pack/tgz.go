@@ -13,21 +13,35 @@ import (
 )
 
 // WriteTgzArchive creates TGZ archive of specified path.
-func WriteTgzArchive(srcDirPath string, destFilePath string) error {
+func WriteTgzArchive(srcDirPath string, destFilePath string, compress CompressCtx) error {
+	return writeTgz(destFilePath, compress, func(writer io.Writer) error {
+		return WriteTarArchive(srcDirPath, writer)
+	})
+}
+
+// writeTgz creates TGZ file with a tar archive written by the function.
+func writeTgz(destFilePath string, compress CompressCtx,
+	writeTar func(writer io.Writer) error) error {
 	destFile, err := os.Create(destFilePath)
 	if err != nil {
 		return fmt.Errorf("failed to create result TGZ file %s: %s", destFilePath, err)
 	}
+	defer destFile.Close()
 
-	gzipWriter := gzip.NewWriter(destFile)
-	defer gzipWriter.Close()
-
-	err = WriteTarArchive(srcDirPath, gzipWriter)
+	gzipWriter, err := newParallelGzipWriter(destFile,
+		compress.level(gzip.DefaultCompression), compress.threads())
 	if err != nil {
 		return err
 	}
 
-	return nil
+	if err = writeTar(gzipWriter); err != nil {
+		gzipWriter.Close()
+		return err
+	}
+	if err = gzipWriter.Close(); err != nil {
+		return err
+	}
+	return destFile.Close()
 }
 
 // WriteTarArchive creates Tar archive of specified path
@@ -83,8 +97,8 @@ func WriteTarArchive(srcDirPath string, compressWriter io.Writer) error {
 	return nil
 }
 
-// CompressGzip compresses specified file with gzip.BestCompression level.
-func CompressGzip(srcFilePath string, destFilePath string) error {
+// CompressGzip compresses specified file with gzip.BestCompression level by default.
+func CompressGzip(srcFilePath string, destFilePath string, compress CompressCtx) error {
 	// Src file reader.
 	srcFileReader, err := os.Open(srcFilePath)
 	if err != nil {
@@ -100,15 +114,20 @@ func CompressGzip(srcFilePath string, destFilePath string) error {
 	defer destFile.Close()
 
 	// Dest file GZIP writer.
-	gzipWriter, err := gzip.NewWriterLevel(destFile, gzip.BestCompression)
+	gzipWriter, err := newParallelGzipWriter(destFile,
+		compress.level(gzip.BestCompression), compress.threads())
 	if err != nil {
 		_ = os.Remove(destFilePath)
 		return fmt.Errorf("failed to create GZIP writer %s: %s", destFilePath, err)
 	}
-	defer gzipWriter.Flush()
 
 	// Compressing itself.
 	if _, err := io.Copy(gzipWriter, srcFileReader); err != nil {
+		gzipWriter.Close()
+		_ = os.Remove(destFilePath)
+		return err
+	}
+	if err := gzipWriter.Close(); err != nil {
 		_ = os.Remove(destFilePath)
 		return err
 	}
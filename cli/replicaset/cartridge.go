@@ -84,6 +84,7 @@ func (c *CartridgeInstance) GetReplicasets() (Replicasets, error) {
 type CartridgeApplication struct {
 	runningCtx running.RunningCtx
 	preferred  connector.Evaler
+	evalOpts   ParallelEvalOpts
 }
 
 // NewCartridgeApplication creates a new CartridgeApplication object.
@@ -107,60 +108,72 @@ func (c *CartridgeApplication) GetReplicasets() (Replicasets, error) {
 	if c.preferred != nil {
 		replicasets, err = NewCartridgeInstance(c.preferred).GetReplicasets()
 	} else {
-		err = EvalAny(c.runningCtx.Instances, InstanceEvalFunc(
-			func(_ running.InstanceCtx, evaler connector.Evaler) (bool, error) {
-				var err error
-				replicasets, err = NewCartridgeInstance(evaler).GetReplicasets()
-				return true, err
+		err = EvalAnyParallel(c.runningCtx.Instances, c.evalOpts,
+			func(_ running.InstanceCtx, evaler connector.Evaler) (Replicasets, error) {
+				return NewCartridgeInstance(evaler).GetReplicasets()
 			},
-		))
+			func(_ running.InstanceCtx, instanceReplicasets Replicasets) error {
+				replicasets = instanceReplicasets
+				return nil
+			})
 	}
 	if err != nil {
 		return replicasets, fmt.Errorf("failed to get topology: %w", err)
 	}
 
-	err = EvalForeachAlive(c.runningCtx.Instances, InstanceEvalFunc(
-		func(ictx running.InstanceCtx, evaler connector.Evaler) (bool, error) {
-			var err error
-			replicasets, err = updateCartridgeInstance(evaler, &ictx, replicasets)
-			return false, err
+	err = EvalForeachAliveParallel(c.runningCtx.Instances, c.evalOpts,
+		func(_ running.InstanceCtx, evaler connector.Evaler) (cartridgeInstanceInfo, error) {
+			return getCartridgeInstanceInfo(evaler)
 		},
-	))
+		func(ictx running.InstanceCtx, info cartridgeInstanceInfo) (bool, error) {
+			replicasets = applyCartridgeInstanceInfo(info, &ictx, replicasets)
+			return false, nil
+		})
 
 	return recalculateMasters(replicasets), err
 }
 
-// updateCartridgeInstance receives and updates an additional instance
-// information about the instance in the replicasets.
-func updateCartridgeInstance(evaler connector.Evaler,
-	ictx *running.InstanceCtx, replicasets Replicasets) (Replicasets, error) {
-	info := []struct {
-		UUID string
-		RW   bool
-	}{}
+// cartridgeInstanceInfo is an additional information about an instance with
+// the Cartridge orchestrator.
+type cartridgeInstanceInfo struct {
+	UUID        string
+	RW          bool
+	Replication *Replication
+}
+
+// getCartridgeInstanceInfo receives an additional instance information.
+func getCartridgeInstanceInfo(evaler connector.Evaler) (cartridgeInstanceInfo, error) {
+	info := []cartridgeInstanceInfo{}
 
 	args := []any{}
 	opts := connector.RequestOpts{}
-	data, err := evaler.Eval(cartridgeGetInstanceInfoBody, args, opts)
+	data, err := evaler.Eval(getReplicationInfoFunc+cartridgeGetInstanceInfoBody, args, opts)
 	if err != nil {
-		return replicasets, err
+		return cartridgeInstanceInfo{}, err
 	}
 
 	if err := mapstructure.Decode(data, &info); err != nil {
-		return replicasets, fmt.Errorf("failed to parse a response: %w", err)
+		return cartridgeInstanceInfo{}, fmt.Errorf("failed to parse a response: %w", err)
 	}
 	if len(info) != 1 {
-		return replicasets, fmt.Errorf("unexpected response")
+		return cartridgeInstanceInfo{}, fmt.Errorf("unexpected response")
 	}
+	return info[0], nil
+}
 
+// applyCartridgeInstanceInfo updates the instance in the replicasets with
+// the additional instance information.
+func applyCartridgeInstanceInfo(info cartridgeInstanceInfo,
+	ictx *running.InstanceCtx, replicasets Replicasets) Replicasets {
 	for _, replicaset := range replicasets.Replicasets {
 		for i, _ := range replicaset.Instances {
-			if replicaset.Instances[i].UUID == info[0].UUID {
-				if info[0].RW {
+			if replicaset.Instances[i].UUID == info.UUID {
+				if info.RW {
 					replicaset.Instances[i].Mode = ModeRW
 				} else {
 					replicaset.Instances[i].Mode = ModeRead
 				}
+				replicaset.Instances[i].Replication = info.Replication
 				if ictx != nil {
 					replicaset.Instances[i].InstanceCtx = *ictx
 					replicaset.Instances[i].InstanceCtxFound = true
@@ -168,5 +181,16 @@ func updateCartridgeInstance(evaler connector.Evaler,
 			}
 		}
 	}
-	return replicasets, nil
+	return replicasets
+}
+
+// updateCartridgeInstance receives and updates an additional instance
+// information about the instance in the replicasets.
+func updateCartridgeInstance(evaler connector.Evaler,
+	ictx *running.InstanceCtx, replicasets Replicasets) (Replicasets, error) {
+	info, err := getCartridgeInstanceInfo(evaler)
+	if err != nil {
+		return replicasets, err
+	}
+	return applyCartridgeInstanceInfo(info, ictx, replicasets), nil
 }
@@ -30,6 +30,8 @@ type cconfigTopology struct {
 	InstanceUUID string
 	// InstanceRW is true when the current instance is in RW mode.
 	InstanceRW bool
+	// Replication is a replication state of the current instance.
+	Replication *Replication
 }
 
 // CConfigInstance is an instance with the centralized config orchestrator.
@@ -71,6 +73,7 @@ func (c *CConfigInstance) GetReplicasets() (Replicasets, error) {
 // orchestrator.
 type CConfigApplication struct {
 	runningCtx running.RunningCtx
+	evalOpts   ParallelEvalOpts
 }
 
 // NewCConfigApplication creates a new CartridgeApplication object.
@@ -85,12 +88,11 @@ func NewCConfigApplication(runningCtx running.RunningCtx) *CConfigApplication {
 func (c *CConfigApplication) GetReplicasets() (Replicasets, error) {
 	var topologies []cconfigTopology
 
-	err := EvalForeachAlive(c.runningCtx.Instances, InstanceEvalFunc(
-		func(ictx running.InstanceCtx, evaler connector.Evaler) (bool, error) {
-			topology, err := getCConfigInstanceTopology(evaler)
-			if err != nil {
-				return true, err
-			}
+	err := EvalForeachAliveParallel(c.runningCtx.Instances, c.evalOpts,
+		func(_ running.InstanceCtx, evaler connector.Evaler) (cconfigTopology, error) {
+			return getCConfigInstanceTopology(evaler)
+		},
+		func(ictx running.InstanceCtx, topology cconfigTopology) (bool, error) {
 			for i, _ := range topology.Instances {
 				if topology.Instances[i].UUID == topology.InstanceUUID {
 					topology.Instances[i].InstanceCtx = ictx
@@ -100,7 +102,7 @@ func (c *CConfigApplication) GetReplicasets() (Replicasets, error) {
 
 			topologies = append(topologies, topology)
 			return false, nil
-		}))
+		})
 	if err != nil {
 		return Replicasets{}, err
 	}
@@ -118,7 +120,7 @@ func getCConfigInstanceTopology(evaler connector.Evaler) (cconfigTopology, error
 
 	args := []any{}
 	opts := connector.RequestOpts{}
-	data, err := evaler.Eval(cconfigGetInstanceTopologyBody, args, opts)
+	data, err := evaler.Eval(getReplicationInfoFunc+cconfigGetInstanceTopologyBody, args, opts)
 	if err != nil {
 		return topology, err
 	}
@@ -138,6 +140,7 @@ func getCConfigInstanceTopology(evaler connector.Evaler) (cconfigTopology, error
 			} else {
 				topology.Instances[i].Mode = ModeRead
 			}
+			topology.Instances[i].Replication = topology.Replication
 		}
 	}
 
@@ -195,6 +198,9 @@ func updateCConfigInstances(replicaset *Replicaset, topology cconfigTopology) {
 			if instance.Mode == ModeUnknown {
 				instance.Mode = tinstance.Mode
 			}
+			if instance.Replication == nil {
+				instance.Replication = tinstance.Replication
+			}
 			if !instance.InstanceCtxFound {
 				instance.InstanceCtx = tinstance.InstanceCtx
 				instance.InstanceCtxFound = tinstance.InstanceCtxFound
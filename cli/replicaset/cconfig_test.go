@@ -317,6 +317,88 @@ func TestCConfigInstance_GetReplicasets_failover(t *testing.T) {
 	}
 }
 
+func TestCConfigInstance_GetReplicasets_replication(t *testing.T) {
+	cases := []struct {
+		Name       string
+		LeaderUUID string
+		RW         bool
+		LSNBehind  int64
+	}{
+		{"leader", "someinstanceuuid", true, 0},
+		{"replica", "otherinstanceuuid", false, -1},
+		{"no_leader_rw", "", true, 0},
+		{"no_leader_ro", "", false, -1},
+	}
+
+	for _, tc := range cases {
+		t.Run(tc.Name, func(t *testing.T) {
+			evaler := &instanceMockEvaler{
+				Ret: [][]any{
+					[]any{
+						map[any]any{
+							"uuid":         "somereplicasetuuid",
+							"leaderuuid":   tc.LeaderUUID,
+							"instanceuuid": "someinstanceuuid",
+							"instancerw":   tc.RW,
+							"instances": []any{
+								map[any]any{
+									"uuid": "someinstanceuuid",
+								},
+							},
+							"replication": map[any]any{
+								"id": uint64(1),
+								"vclock": map[any]any{
+									uint64(1): uint64(10),
+									uint64(2): uint64(5),
+								},
+								"upstreams": []any{
+									map[any]any{
+										"uuid":   "otherinstanceuuid",
+										"status": "follow",
+										"lag":    0.5,
+										"idle":   int64(1),
+									},
+								},
+								"downstreams": []any{
+									map[any]any{
+										"uuid":   "otherinstanceuuid",
+										"status": "follow",
+										"vclock": map[any]any{
+											uint64(1): uint64(8),
+										},
+									},
+								},
+							},
+						},
+					},
+				},
+			}
+
+			getter := replicaset.NewCConfigInstance(evaler)
+
+			replicasets, err := getter.GetReplicasets()
+			assert.NoError(t, err)
+			assert.Len(t, replicasets.Replicasets, 1)
+			assert.Len(t, replicasets.Replicasets[0].Instances, 1)
+			assert.Equal(t, &replicaset.Replication{
+				ID:     1,
+				Vclock: replicaset.Vclock{1: 10, 2: 5},
+				Upstreams: []replicaset.Upstream{
+					{UUID: "otherinstanceuuid", Status: "follow", Lag: 0.5, Idle: 1},
+				},
+				Downstreams: []replicaset.Downstream{
+					{
+						UUID:   "otherinstanceuuid",
+						Status: "follow",
+						Vclock: replicaset.Vclock{1: 8},
+					},
+				},
+				LSNBehind: tc.LSNBehind,
+			}, replicasets.Replicasets[0].Instances[0].Replication)
+		})
+	}
+}
+
 func TestCConfigInstance_GetReplicasets_errors(t *testing.T) {
 	cases := []struct {
 		Name     string
@@ -0,0 +1,260 @@
+package replicasetcmd
+
+import (
+	"context"
+	"fmt"
+	"os"
+	"os/signal"
+	"syscall"
+	"time"
+
+	"github.com/tarantool/tt/cli/replicaset"
+)
+
+// DefaultMonitorInterval is a default interval between topology polls.
+const DefaultMonitorInterval = time.Second
+
+// pollResult is a result of a topology poll.
+type pollResult struct {
+	replicasets replicaset.Replicasets
+	err         error
+}
+
+// MonitorCtx contains information about replicaset status monitor execution
+// context.
+type MonitorCtx struct {
+	StatusCtx
+	// Interval is an interval between topology polls.
+	Interval time.Duration
+}
+
+// Monitor shows a replicaset status and then polls the topology with the
+// interval until an interrupt. Only changes of the topology are printed.
+// Connections to instances are kept between polls. A request to an instance
+// times out after the interval, so a stuck instance does not stall polls.
+func Monitor(monitorCtx MonitorCtx) error {
+	interval := monitorCtx.Interval
+	if interval <= 0 {
+		interval = DefaultMonitorInterval
+	}
+
+	orchestrator, err := getOrchestrator(monitorCtx.StatusCtx)
+	if err != nil {
+		return err
+	}
+
+	ctx, stop := signal.NotifyContext(context.Background(),
+		os.Interrupt, syscall.SIGTERM)
+	defer stop()
+
+	pool := replicaset.NewConnectionPool()
+	defer pool.Close()
+	// The interrupt cancels evaluations of a poll.
+	evalOpts := replicaset.ParallelEvalOpts{
+		Pool:    pool,
+		Timeout: interval,
+		Context: ctx,
+	}
+	discovery := func() (replicaset.Replicasets, error) {
+		if monitorCtx.IsApplication {
+			return replicaset.DiscoveryApplicationPool(monitorCtx.RunningCtx,
+				orchestrator, evalOpts)
+		}
+		return replicaset.DiscoveryInstance(
+			replicaset.NewTimeoutEvaler(monitorCtx.Conn, interval), orchestrator)
+	}
+	// poll runs the discovery in the background, so an interrupt is handled
+	// even if the discovery blocks. It returns true on the interrupt.
+	poll := func() (replicaset.Replicasets, bool, error) {
+		result := make(chan pollResult, 1)
+		go func() {
+			replicasets, err := discovery()
+			result <- pollResult{replicasets: replicasets, err: err}
+		}()
+		select {
+		case <-ctx.Done():
+			// Restore the default signals handling, so the next interrupt
+			// terminates the process if the discovery is still stuck.
+			stop()
+			// The cancelled discovery finishes soon, wait for it before
+			// the pool is closed.
+			<-result
+			return replicaset.Replicasets{}, true, nil
+		case res := <-result:
+			return res.replicasets, false, res.err
+		}
+	}
+
+	prev, interrupted, err := poll()
+	if interrupted || err != nil {
+		return err
+	}
+	if err := statusReplicasets(prev); err != nil {
+		return err
+	}
+	// Avoid the orchestrator detection on each poll.
+	orchestrator = prev.Orchestrator
+	prev = sortAliases(fillAliases(prev))
+
+	ticker := time.NewTicker(interval)
+	defer ticker.Stop()
+
+	var prevErr string
+	for {
+		select {
+		case <-ctx.Done():
+			return nil
+		case <-ticker.C:
+		}
+
+		now := time.Now().Format(time.RFC3339)
+		cur, interrupted, err := poll()
+		if interrupted {
+			return nil
+		}
+		if err != nil {
+			// Print the same error only once.
+			if err.Error() != prevErr {
+				prevErr = err.Error()
+				fmt.Printf("%s discovery failed: %s\n", now, err)
+			}
+			continue
+		}
+		prevErr = ""
+
+		cur = sortAliases(fillAliases(cur))
+		for _, delta := range diffReplicasets(prev, cur) {
+			fmt.Println(now, delta)
+		}
+		prev = cur
+	}
+}
+
+// leaderAlias returns an alias of the replicaset leader.
+func leaderAlias(replicaset replicaset.Replicaset) string {
+	if replicaset.LeaderUUID == "" {
+		return "none"
+	}
+	for _, instance := range replicaset.Instances {
+		if instance.UUID == replicaset.LeaderUUID {
+			return instance.Alias
+		}
+	}
+	return replicaset.LeaderUUID
+}
+
+// diffReplication returns a list of changes between replication states of an
+// instance. A lag is reported only when the instance starts or stops to fall
+// behind the leader to avoid a report on each poll.
+func diffReplication(alias string, prev, cur replicaset.Replication) []string {
+	var deltas []string
+
+	if (prev.LSNBehind > 0) != (cur.LSNBehind > 0) {
+		deltas = append(deltas, fmt.Sprintf("instance %s: LSN behind %d -> %d",
+			alias, prev.LSNBehind, cur.LSNBehind))
+	}
+
+	prevStatuses := map[string]string{}
+	for _, upstream := range prev.Upstreams {
+		prevStatuses[upstream.UUID] = upstream.Status
+	}
+	for _, upstream := range cur.Upstreams {
+		prevStatus, ok := prevStatuses[upstream.UUID]
+		if ok && prevStatus != upstream.Status {
+			delta := fmt.Sprintf("instance %s: upstream %s status %s -> %s",
+				alias, upstream.UUID, prevStatus, upstream.Status)
+			if upstream.Message != "" {
+				delta += ": " + upstream.Message
+			}
+			deltas = append(deltas, delta)
+		}
+	}
+	return deltas
+}
+
+// diffInstances returns a list of changes between instances of a replicaset.
+func diffInstances(prev, cur replicaset.Replicaset) []string {
+	var deltas []string
+
+	prevInstances := map[string]replicaset.Instance{}
+	for _, instance := range prev.Instances {
+		prevInstances[instance.UUID] = instance
+	}
+	curInstances := map[string]bool{}
+	for _, instance := range cur.Instances {
+		curInstances[instance.UUID] = true
+
+		prevInstance, ok := prevInstances[instance.UUID]
+		if !ok {
+			deltas = append(deltas, fmt.Sprintf("replicaset %s: instance added: %s",
+				cur.Alias, instanceToString(instance)))
+			continue
+		}
+		if prevInstance.Mode != instance.Mode {
+			deltas = append(deltas, fmt.Sprintf("instance %s: mode %s -> %s",
+				instance.Alias, prevInstance.Mode, instance.Mode))
+		}
+		if prevInstance.URI != instance.URI {
+			deltas = append(deltas, fmt.Sprintf("instance %s: URI %s -> %s",
+				instance.Alias, prevInstance.URI, instance.URI))
+		}
+		if prevInstance.Replication != nil && instance.Replication != nil {
+			deltas = append(deltas, diffReplication(instance.Alias,
+				*prevInstance.Replication, *instance.Replication)...)
+		}
+	}
+	for _, instance := range prev.Instances {
+		if !curInstances[instance.UUID] {
+			deltas = append(deltas, fmt.Sprintf("replicaset %s: instance removed: %s",
+				prev.Alias, instance.Alias))
+		}
+	}
+	return deltas
+}
+
+// diffReplicasets returns a list of changes between two topology snapshots.
+func diffReplicasets(prev, cur replicaset.Replicasets) []string {
+	var deltas []string
+	if prev.Orchestrator != cur.Orchestrator {
+		deltas = append(deltas, fmt.Sprintf("orchestrator %s -> %s",
+			prev.Orchestrator, cur.Orchestrator))
+	}
+	if prev.State != cur.State {
+		deltas = append(deltas, fmt.Sprintf("replicasets state %s -> %s",
+			prev.State, cur.State))
+	}
+
+	prevReplicasets := map[string]replicaset.Replicaset{}
+	for _, replicaset := range prev.Replicasets {
+		prevReplicasets[replicaset.UUID] = replicaset
+	}
+	curReplicasets := map[string]bool{}
+	for _, replicaset := range cur.Replicasets {
+		curReplicasets[replicaset.UUID] = true
+
+		prevReplicaset, ok := prevReplicasets[replicaset.UUID]
+		if !ok {
+			deltas = append(deltas, "replicaset added:\n"+replicasetToString(replicaset))
+			continue
+		}
+		if prevReplicaset.Failover != replicaset.Failover {
+			deltas = append(deltas, fmt.Sprintf("replicaset %s: failover %s -> %s",
+				replicaset.Alias, prevReplicaset.Failover, replicaset.Failover))
+		}
+		if prevReplicaset.Master != replicaset.Master {
+			deltas = append(deltas, fmt.Sprintf("replicaset %s: master %s -> %s",
+				replicaset.Alias, prevReplicaset.Master, replicaset.Master))
+		}
+		if prevReplicaset.LeaderUUID != replicaset.LeaderUUID {
+			deltas = append(deltas, fmt.Sprintf("replicaset %s: leader %s -> %s",
+				replicaset.Alias, leaderAlias(prevReplicaset), leaderAlias(replicaset)))
+		}
+		deltas = append(deltas, diffInstances(prevReplicaset, replicaset)...)
+	}
+	for _, replicaset := range prev.Replicasets {
+		if !curReplicasets[replicaset.UUID] {
+			deltas = append(deltas, "replicaset removed: "+replicaset.Alias)
+		}
+	}
+	return deltas
+}
@@ -0,0 +1,117 @@
+package replicasetcmd
+
+import (
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+
+	"github.com/tarantool/tt/cli/replicaset"
+)
+
+func TestDiffReplicasets_same(t *testing.T) {
+	replicasets := replicaset.Replicasets{
+		State:        replicaset.StateBootstrapped,
+		Orchestrator: replicaset.OrchestratorCentralizedConfig,
+		Replicasets: []replicaset.Replicaset{
+			{
+				UUID:       "rs1",
+				Alias:      "rs1",
+				LeaderUUID: "i1",
+				Master:     replicaset.MasterSingle,
+				Instances: []replicaset.Instance{
+					{UUID: "i1", Alias: "i1", Mode: replicaset.ModeRW},
+				},
+			},
+		},
+	}
+	assert.Empty(t, diffReplicasets(replicasets, replicasets))
+}
+
+func TestDiffReplicasets_changes(t *testing.T) {
+	prev := replicaset.Replicasets{
+		State:        replicaset.StateBootstrapped,
+		Orchestrator: replicaset.OrchestratorCentralizedConfig,
+		Replicasets: []replicaset.Replicaset{
+			{
+				UUID:       "rs1",
+				Alias:      "rs1",
+				LeaderUUID: "i1",
+				Master:     replicaset.MasterSingle,
+				Instances: []replicaset.Instance{
+					{UUID: "i1", Alias: "i1", URI: "uri1", Mode: replicaset.ModeRW},
+					{UUID: "i2", Alias: "i2", URI: "uri2", Mode: replicaset.ModeRead},
+					{UUID: "i3", Alias: "i3", URI: "uri3", Mode: replicaset.ModeRead},
+				},
+			},
+			{
+				UUID:  "rs2",
+				Alias: "rs2",
+			},
+		},
+	}
+	cur := replicaset.Replicasets{
+		State:        replicaset.StateBootstrapped,
+		Orchestrator: replicaset.OrchestratorCentralizedConfig,
+		Replicasets: []replicaset.Replicaset{
+			{
+				UUID:       "rs1",
+				Alias:      "rs1",
+				LeaderUUID: "i2",
+				Master:     replicaset.MasterMulti,
+				Instances: []replicaset.Instance{
+					{UUID: "i1", Alias: "i1", URI: "uri1", Mode: replicaset.ModeRW},
+					{UUID: "i2", Alias: "i2", URI: "uri2", Mode: replicaset.ModeRW},
+					{UUID: "i4", Alias: "i4", URI: "uri4", Mode: replicaset.ModeRead},
+				},
+			},
+		},
+	}
+
+	assert.Equal(t, []string{
+		"replicaset rs1: master single -> multi",
+		"replicaset rs1: leader i1 -> i2",
+		"instance i2: mode read -> rw",
+		"replicaset rs1: instance added: i4 uri4 read",
+		"replicaset rs1: instance removed: i3",
+		"replicaset removed: rs2",
+	}, diffReplicasets(prev, cur))
+}
+
+func TestDiffReplicasets_replication(t *testing.T) {
+	newReplicasets := func(behind int64, status, message string) replicaset.Replicasets {
+		return replicaset.Replicasets{
+			Replicasets: []replicaset.Replicaset{
+				{
+					UUID:  "rs1",
+					Alias: "rs1",
+					Instances: []replicaset.Instance{
+						{
+							UUID:  "i1",
+							Alias: "i1",
+							Replication: &replicaset.Replication{
+								Upstreams: []replicaset.Upstream{
+									{UUID: "i2", Status: status, Message: message},
+								},
+								LSNBehind: behind,
+							},
+						},
+					},
+				},
+			},
+		}
+	}
+
+	assert.Empty(t, diffReplicasets(newReplicasets(0, "follow", ""),
+		newReplicasets(0, "follow", "")))
+	assert.Empty(t, diffReplicasets(newReplicasets(3, "follow", ""),
+		newReplicasets(5, "follow", "")))
+	assert.Equal(t, []string{
+		"instance i1: LSN behind 0 -> 5",
+		"instance i1: upstream i2 status follow -> stopped: broken",
+	}, diffReplicasets(newReplicasets(0, "follow", ""),
+		newReplicasets(5, "stopped", "broken")))
+	assert.Equal(t, []string{
+		"instance i1: LSN behind 5 -> 0",
+	}, diffReplicasets(newReplicasets(5, "follow", ""),
+		newReplicasets(0, "follow", "")))
+}
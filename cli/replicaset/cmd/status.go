@@ -1,6 +1,7 @@
 package replicasetcmd
 
 import (
+	"encoding/json"
 	"fmt"
 	"sort"
 	"strings"
@@ -21,10 +22,25 @@ type StatusCtx struct {
 	Conn connector.Connector
 	// Orchestrator is a forced orchestator choice.
 	Orchestrator replicaset.Orchestrator
+	// Format is an output format: FormatText or FormatJson. FormatText is
+	// used if empty.
+	Format string
 }
 
+const (
+	// FormatText is a human-readable output format.
+	FormatText = "text"
+	// FormatJson is a JSON output format.
+	FormatJson = "json"
+)
+
 // Status shows a replicaset status.
 func Status(statusCtx StatusCtx) error {
+	if statusCtx.Format != "" && statusCtx.Format != FormatText &&
+		statusCtx.Format != FormatJson {
+		return fmt.Errorf("unsupported output format: %q", statusCtx.Format)
+	}
+
 	orchestrator, err := getOrchestrator(statusCtx)
 	if err != nil {
 		return err
@@ -40,10 +56,14 @@ func Status(statusCtx StatusCtx) error {
 		return err
 	}
 
+	if statusCtx.Format == FormatJson {
+		return statusReplicasetsJson(replicasets)
+	}
 	return statusReplicasets(replicasets)
 }
 
-// getOrchestrator determinates a used orchestrator type.
+// getOrchestrator determinates a used orchestrator type. An orchestrator of
+// an application is determined and cached by the discovery.
 func getOrchestrator(statusCtx StatusCtx) (replicaset.Orchestrator, error) {
 	if statusCtx.Orchestrator != replicaset.OrchestratorUnknown {
 		return statusCtx.Orchestrator, nil
@@ -52,22 +72,7 @@ func getOrchestrator(statusCtx StatusCtx) (replicaset.Orchestrator, error) {
 	if statusCtx.Conn != nil {
 		return replicaset.EvalOrchestrator(statusCtx.Conn)
 	}
-
-	var orchestrator replicaset.Orchestrator
-	eval := func(_ running.InstanceCtx, evaler connector.Evaler) (bool, error) {
-		instanceOrchestrator, err := replicaset.EvalOrchestrator(evaler)
-		if err == nil {
-			orchestrator = instanceOrchestrator
-		}
-		return true, err
-	}
-
-	instances := statusCtx.RunningCtx.Instances
-	if err := replicaset.EvalAny(instances, replicaset.InstanceEvalFunc(eval)); err != nil {
-		return orchestrator,
-			fmt.Errorf("unable to determinate orchestrator: %w", err)
-	}
-	return orchestrator, nil
+	return replicaset.OrchestratorUnknown, nil
 }
 
 // statusReplicasets show the current status of known replicasets.
@@ -91,6 +96,86 @@ func statusReplicasets(replicasets replicaset.Replicasets) error {
 	return nil
 }
 
+// instanceJson is a JSON representation of an instance.
+type instanceJson struct {
+	Alias       string                  `json:"alias"`
+	UUID        string                  `json:"uuid"`
+	URI         string                  `json:"uri"`
+	Mode        string                  `json:"mode"`
+	Replication *replicaset.Replication `json:"replication,omitempty"`
+}
+
+// replicasetJson is a JSON representation of a replicaset.
+type replicasetJson struct {
+	Alias      string         `json:"alias"`
+	UUID       string         `json:"uuid"`
+	LeaderUUID string         `json:"leader_uuid,omitempty"`
+	Failover   string         `json:"failover"`
+	Provider   string         `json:"provider,omitempty"`
+	Master     string         `json:"master"`
+	Roles      []string       `json:"roles,omitempty"`
+	Instances  []instanceJson `json:"instances"`
+}
+
+// replicasetsJson is a JSON representation of replicasets.
+type replicasetsJson struct {
+	Orchestrator string           `json:"orchestrator"`
+	State        string           `json:"state"`
+	Replicasets  []replicasetJson `json:"replicasets"`
+}
+
+// toReplicasetsJson converts replicasets into a JSON representation.
+func toReplicasetsJson(replicasets replicaset.Replicasets) replicasetsJson {
+	ret := replicasetsJson{
+		Orchestrator: replicasets.Orchestrator.String(),
+		State:        replicasets.State.String(),
+		Replicasets:  []replicasetJson{},
+	}
+	for _, replicas := range replicasets.Replicasets {
+		rs := replicasetJson{
+			Alias:      replicas.Alias,
+			UUID:       replicas.UUID,
+			LeaderUUID: replicas.LeaderUUID,
+			Failover:   replicas.Failover.String(),
+			Master:     replicas.Master.String(),
+			Roles:      replicas.Roles,
+			Instances:  []instanceJson{},
+		}
+		if replicas.StateProvider != replicaset.StateProviderUnknown {
+			rs.Provider = replicas.StateProvider.String()
+		}
+		for _, instance := range replicas.Instances {
+			rs.Instances = append(rs.Instances, instanceJson{
+				Alias:       instance.Alias,
+				UUID:        instance.UUID,
+				URI:         instance.URI,
+				Mode:        instance.Mode.String(),
+				Replication: instance.Replication,
+			})
+		}
+		ret.Replicasets = append(ret.Replicasets, rs)
+	}
+	return ret
+}
+
+// statusReplicasetsJson shows the current status of known replicasets in
+// JSON format.
+func statusReplicasetsJson(replicasets replicaset.Replicasets) error {
+	if replicasets.State == replicaset.StateUnknown {
+		return fmt.Errorf("unknown or empty replicasets configuration")
+	}
+
+	replicasets = fillAliases(replicasets)
+	replicasets = sortAliases(replicasets)
+
+	data, err := json.MarshalIndent(toReplicasetsJson(replicasets), "", "  ")
+	if err != nil {
+		return fmt.Errorf("failed to encode a status: %w", err)
+	}
+	fmt.Println(string(data))
+	return nil
+}
+
 // fillAliases fills missed aliases with UUID. The case: Tarantool 1.10 without
 // an orchestrator.
 func fillAliases(replicasets replicaset.Replicasets) replicaset.Replicasets {
@@ -0,0 +1,81 @@
+package replicasetcmd
+
+import (
+	"encoding/json"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+
+	"github.com/tarantool/tt/cli/replicaset"
+)
+
+func TestToReplicasetsJson(t *testing.T) {
+	replicasets := replicaset.Replicasets{
+		State:        replicaset.StateBootstrapped,
+		Orchestrator: replicaset.OrchestratorCentralizedConfig,
+		Replicasets: []replicaset.Replicaset{
+			{
+				UUID:       "rs1",
+				Alias:      "rs1",
+				LeaderUUID: "i1",
+				Master:     replicaset.MasterSingle,
+				Failover:   replicaset.FailoverManual,
+				Instances: []replicaset.Instance{
+					{
+						UUID:  "i1",
+						Alias: "i1",
+						URI:   "uri1",
+						Mode:  replicaset.ModeRW,
+						Replication: &replicaset.Replication{
+							ID:     1,
+							Vclock: replicaset.Vclock{1: 10},
+							Downstreams: []replicaset.Downstream{
+								{UUID: "i2", Status: "follow", Lag: 0.5},
+							},
+						},
+					},
+					{UUID: "i2", Alias: "i2", URI: "uri2", Mode: replicaset.ModeRead},
+				},
+			},
+		},
+	}
+
+	data, err := json.Marshal(toReplicasetsJson(replicasets))
+	require.NoError(t, err)
+	assert.JSONEq(t, `{
+		"orchestrator": "centralized config",
+		"state": "bootstrapped",
+		"replicasets": [{
+			"alias": "rs1",
+			"uuid": "rs1",
+			"leader_uuid": "i1",
+			"failover": "manual",
+			"master": "single",
+			"instances": [{
+				"alias": "i1",
+				"uuid": "i1",
+				"uri": "uri1",
+				"mode": "rw",
+				"replication": {
+					"id": 1,
+					"vclock": {"1": 10},
+					"upstreams": null,
+					"downstreams": [{
+						"uuid": "i2",
+						"status": "follow",
+						"lag": 0.5,
+						"idle": 0,
+						"vclock": null
+					}],
+					"lsn_behind": 0
+				}
+			}, {
+				"alias": "i2",
+				"uuid": "i2",
+				"uri": "uri2",
+				"mode": "read"
+			}]
+		}]
+	}`, string(data))
+}
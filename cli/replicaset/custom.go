@@ -28,6 +28,8 @@ type customTopology struct {
 	InstanceUUID string
 	// InstanceRW is true when the current instance is in RW mode.
 	InstanceRW bool
+	// Replication is a replication state of the current instance.
+	Replication *Replication
 }
 
 // CustomInstance is an instance with custom/unknown orchestrator. In this
@@ -69,6 +71,7 @@ func (c *CustomInstance) GetReplicasets() (Replicasets, error) {
 type CustomApplication struct {
 	runningCtx running.RunningCtx
 	conn       connector.Connector
+	evalOpts   ParallelEvalOpts
 }
 
 // NewCustomApplication creates a new CustomApplication object.
@@ -83,12 +86,11 @@ func NewCustomApplication(runningCtx running.RunningCtx) *CustomApplication {
 func (c *CustomApplication) GetReplicasets() (Replicasets, error) {
 	var topologies []customTopology
 
-	err := EvalForeachAlive(c.runningCtx.Instances, InstanceEvalFunc(
-		func(ictx running.InstanceCtx, evaler connector.Evaler) (bool, error) {
-			topology, err := getCustomInstanceTopology(ictx.InstName, evaler)
-			if err != nil {
-				return true, err
-			}
+	err := EvalForeachAliveParallel(c.runningCtx.Instances, c.evalOpts,
+		func(ictx running.InstanceCtx, evaler connector.Evaler) (customTopology, error) {
+			return getCustomInstanceTopology(ictx.InstName, evaler)
+		},
+		func(ictx running.InstanceCtx, topology customTopology) (bool, error) {
 			for i, _ := range topology.Instances {
 				if topology.Instances[i].UUID == topology.InstanceUUID {
 					topology.Instances[i].InstanceCtx = ictx
@@ -98,7 +100,7 @@ func (c *CustomApplication) GetReplicasets() (Replicasets, error) {
 
 			topologies = append(topologies, topology)
 			return false, nil
-		}))
+		})
 	if err != nil {
 		return Replicasets{}, err
 	}
@@ -113,7 +115,7 @@ func getCustomInstanceTopology(name string,
 
 	args := []any{}
 	opts := connector.RequestOpts{}
-	data, err := evaler.Eval(customGetInstanceTopologyBody, args, opts)
+	data, err := evaler.Eval(getReplicationInfoFunc+customGetInstanceTopologyBody, args, opts)
 	if err != nil {
 		return topology, err
 	}
@@ -133,6 +135,7 @@ func getCustomInstanceTopology(name string,
 			} else {
 				topology.Instances[i].Mode = ModeRead
 			}
+			topology.Instances[i].Replication = topology.Replication
 			if topology.Instances[i].Alias == "" {
 				topology.Instances[i].Alias = name
 			}
@@ -194,6 +197,9 @@ func updateCustomInstances(replicaset *Replicaset, topology customTopology) {
 			if instance.Mode == ModeUnknown {
 				instance.Mode = tinstance.Mode
 			}
+			if instance.Replication == nil {
+				instance.Replication = tinstance.Replication
+			}
 			if !instance.InstanceCtxFound {
 				instance.InstanceCtx = tinstance.InstanceCtx
 				instance.InstanceCtxFound = tinstance.InstanceCtxFound
@@ -1,36 +1,149 @@
 package replicaset
 
 import (
+	"crypto/sha256"
+	"encoding/hex"
 	"fmt"
+	"os"
+	"path/filepath"
+	"strings"
+
+	"github.com/apex/log"
 
 	"github.com/tarantool/tt/cli/connector"
 	"github.com/tarantool/tt/cli/running"
 )
 
+// orchestratorCacheFile is a name of a file with a cached orchestrator in
+// a run directory of an application instance.
+const orchestratorCacheFile = "tt_orchestrator.cache"
+
+// appFingerprint returns a fingerprint of application files and running
+// instances. It changes if the application is updated or an instance is
+// restarted.
+func appFingerprint(app running.RunningCtx) string {
+	hash := sha256.New()
+	writeStat := func(path string) {
+		if path == "" {
+			return
+		}
+		if info, err := os.Stat(path); err == nil {
+			fmt.Fprintf(hash, "%s %d %d\n", path, info.Size(), info.ModTime().UnixNano())
+		} else {
+			fmt.Fprintf(hash, "%s -\n", path)
+		}
+	}
+
+	appDirs := map[string]bool{}
+	for _, instance := range app.Instances {
+		if !appDirs[instance.AppDir] && instance.AppDir != "" {
+			appDirs[instance.AppDir] = true
+			entries, _ := os.ReadDir(instance.AppDir)
+			for _, entry := range entries {
+				writeStat(filepath.Join(instance.AppDir, entry.Name()))
+			}
+		}
+		writeStat(instance.InstanceScript)
+		writeStat(instance.ClusterConfigPath)
+		writeStat(instance.PIDFile)
+		writeStat(instance.ConsoleSocket)
+	}
+	return hex.EncodeToString(hash.Sum(nil))
+}
+
+// getOrchestratorCachePath returns a path to the orchestrator cache file of
+// the application or an empty string.
+func getOrchestratorCachePath(app running.RunningCtx) string {
+	if len(app.Instances) == 0 || app.Instances[0].RunDir == "" {
+		return ""
+	}
+	return filepath.Join(app.Instances[0].RunDir, orchestratorCacheFile)
+}
+
+// loadCachedOrchestrator returns a cached orchestrator of the application or
+// OrchestratorUnknown if the cache does not exist or is outdated.
+func loadCachedOrchestrator(app running.RunningCtx) Orchestrator {
+	path := getOrchestratorCachePath(app)
+	if path == "" {
+		return OrchestratorUnknown
+	}
+
+	data, err := os.ReadFile(path)
+	if err != nil {
+		return OrchestratorUnknown
+	}
+	fingerprint, orchestrator, found := strings.Cut(string(data), "\n")
+	if !found || fingerprint != appFingerprint(app) {
+		return OrchestratorUnknown
+	}
+	return ParseOrchestrator(strings.TrimSpace(orchestrator))
+}
+
+// saveCachedOrchestrator saves the orchestrator of the application into
+// the cache. The cache is optional, so errors are ignored.
+func saveCachedOrchestrator(app running.RunningCtx, orchestrator Orchestrator) {
+	path := getOrchestratorCachePath(app)
+	if path == "" {
+		return
+	}
+
+	data := fmt.Sprintf("%s\n%s\n", appFingerprint(app), orchestrator)
+	if err := os.WriteFile(path, []byte(data), 0644); err != nil {
+		log.Debugf("failed to save an orchestrator cache %q: %s", path, err)
+	}
+}
+
 // DiscoveryApplication retrieves replicasets information for instances in an
 // application. If orchestrator == OrchestratorUnknown then it tries to
-// determinate an orchestrator.
+// determinate an orchestrator. The determined orchestrator is cached until
+// the application files are changed or instances are restarted.
 func DiscoveryApplication(app running.RunningCtx,
 	orchestrator Orchestrator) (Replicasets, error) {
-	if orchestrator == OrchestratorUnknown {
-		eval := func(_ running.InstanceCtx, evaler connector.Evaler) (bool, error) {
-			var err error
-			orchestrator, err = EvalOrchestrator(evaler)
-			return true, err
-		}
+	// Share connections between orchestrator detection and topology
+	// collection.
+	pool := NewConnectionPool()
+	defer pool.Close()
+
+	return DiscoveryApplicationPool(app, orchestrator, ParallelEvalOpts{Pool: pool})
+}
 
-		if err := EvalAny(app.Instances, InstanceEvalFunc(eval)); err != nil {
+// DiscoveryApplicationPool is the same as DiscoveryApplication, but it uses
+// the evaluation options. The options could contain a pool of connections to
+// keep connections between discoveries and a timeout of a request to an
+// instance.
+func DiscoveryApplicationPool(app running.RunningCtx,
+	orchestrator Orchestrator, evalOpts ParallelEvalOpts) (Replicasets, error) {
+	if orchestrator == OrchestratorUnknown {
+		orchestrator = loadCachedOrchestrator(app)
+	}
+	if orchestrator == OrchestratorUnknown {
+		err := EvalAnyParallel(app.Instances, evalOpts,
+			func(_ running.InstanceCtx, evaler connector.Evaler) (Orchestrator, error) {
+				return EvalOrchestrator(evaler)
+			},
+			func(_ running.InstanceCtx, instanceOrchestrator Orchestrator) error {
+				orchestrator = instanceOrchestrator
+				return nil
+			})
+		if err != nil {
 			return Replicasets{}, fmt.Errorf("unable to determinate orchestrator: %w", err)
 		}
+		saveCachedOrchestrator(app, orchestrator)
 	}
 
 	switch orchestrator {
 	case OrchestratorCartridge:
-		return NewCartridgeApplication(app, nil).GetReplicasets()
+		application := NewCartridgeApplication(app, nil)
+		application.evalOpts = evalOpts
+		return application.GetReplicasets()
 	case OrchestratorCentralizedConfig:
-		return NewCConfigApplication(app).GetReplicasets()
+		application := NewCConfigApplication(app)
+		application.evalOpts = evalOpts
+		return application.GetReplicasets()
 	case OrchestratorCustom:
-		return NewCustomApplication(app).GetReplicasets()
+		application := NewCustomApplication(app)
+		application.evalOpts = evalOpts
+		return application.GetReplicasets()
 	default:
 		return Replicasets{}, fmt.Errorf("orchestrator is not supported: %s", orchestrator)
 	}
@@ -1,7 +1,10 @@
 package replicaset
 
 import (
+	"context"
 	"fmt"
+	"sync"
+	"time"
 
 	"github.com/apex/log"
 
@@ -86,3 +89,351 @@ func evalForeach(instances []running.InstanceCtx,
 	}
 	return nil
 }
+
+// DefaultEvalWorkers is a default maximum count of instances evaluated
+// concurrently.
+const DefaultEvalWorkers = 16
+
+// DefaultEvalTimeout is a default timeout of a request to an instance in
+// a concurrent evaluation.
+const DefaultEvalTimeout = 5 * time.Second
+
+// ParallelEvalOpts describes options of a concurrent evaluation.
+type ParallelEvalOpts struct {
+	// Workers is a maximum count of instances evaluated concurrently.
+	// DefaultEvalWorkers is used if it is 0.
+	Workers int
+	// Timeout is a default timeout of a request to an instance.
+	// DefaultEvalTimeout is used if it is 0. There is no timeout if it is
+	// negative.
+	Timeout time.Duration
+	// Pool is a pool of connections to use. A new connection is established
+	// for each evaluation if it is nil.
+	Pool *ConnectionPool
+	// Context cancels the evaluation: pending instances are skipped and
+	// in-flight connections are closed. The evaluation is not cancellable if
+	// it is nil.
+	Context context.Context
+}
+
+// pooledConn is a connection in a pool. It serializes requests.
+type pooledConn struct {
+	mutex sync.Mutex
+	conn  connector.Connector
+}
+
+// Eval passes Lua expression for evaluation.
+func (conn *pooledConn) Eval(expr string, args []any,
+	opts connector.RequestOpts) ([]any, error) {
+	conn.mutex.Lock()
+	defer conn.mutex.Unlock()
+	return conn.conn.Eval(expr, args, opts)
+}
+
+// ConnectionPool keeps connections to instances, so several evaluations over
+// the same instances share connections. It is safe for concurrent use.
+type ConnectionPool struct {
+	mutex sync.Mutex
+	conns map[string]*pooledConn
+}
+
+// NewConnectionPool creates a new empty connection pool.
+func NewConnectionPool() *ConnectionPool {
+	return &ConnectionPool{
+		conns: map[string]*pooledConn{},
+	}
+}
+
+// connect returns a pooled connection to the instance. A new connection is
+// established if there is no connection in the pool.
+func (pool *ConnectionPool) connect(instance running.InstanceCtx) (connector.Evaler, error) {
+	pool.mutex.Lock()
+	defer pool.mutex.Unlock()
+
+	if conn, ok := pool.conns[instance.ConsoleSocket]; ok {
+		return conn, nil
+	}
+
+	conn, err := connectInstance(instance)
+	if err != nil {
+		return nil, err
+	}
+	pooled := &pooledConn{conn: conn}
+	pool.conns[instance.ConsoleSocket] = pooled
+	return pooled, nil
+}
+
+// discard closes and removes a connection to the instance from the pool.
+func (pool *ConnectionPool) discard(instance running.InstanceCtx) {
+	pool.mutex.Lock()
+	defer pool.mutex.Unlock()
+
+	if conn, ok := pool.conns[instance.ConsoleSocket]; ok {
+		conn.conn.Close()
+		delete(pool.conns, instance.ConsoleSocket)
+	}
+}
+
+// Close closes all connections in the pool.
+func (pool *ConnectionPool) Close() {
+	pool.mutex.Lock()
+	defer pool.mutex.Unlock()
+
+	for _, conn := range pool.conns {
+		conn.conn.Close()
+	}
+	pool.conns = map[string]*pooledConn{}
+}
+
+// connectMutex serializes concurrent connections to instances.
+var connectMutex sync.Mutex
+
+// timeoutEvaler sets a default timeout for requests.
+type timeoutEvaler struct {
+	evaler  connector.Evaler
+	timeout time.Duration
+}
+
+// NewTimeoutEvaler creates an evaler that sets the default timeout for
+// requests without a timeout. There is no timeout if it is 0.
+func NewTimeoutEvaler(evaler connector.Evaler, timeout time.Duration) connector.Evaler {
+	return timeoutEvaler{
+		evaler:  evaler,
+		timeout: timeout,
+	}
+}
+
+// Eval passes Lua expression for evaluation with the default timeout.
+func (evaler timeoutEvaler) Eval(expr string, args []any,
+	opts connector.RequestOpts) ([]any, error) {
+	if opts.ReadTimeout == 0 {
+		opts.ReadTimeout = evaler.timeout
+	}
+	return evaler.evaler.Eval(expr, args, opts)
+}
+
+// parallelResult is a result of a concurrent evaluation for an instance.
+type parallelResult[T any] struct {
+	// value is a fetched value.
+	value T
+	// connectErr is a connection error.
+	connectErr error
+	// err is a fetch error.
+	err error
+}
+
+// EvalForeachParallel is a concurrent version of EvalForeach. The fetch
+// function is called for each instance concurrently by a bounded pool of
+// workers, so it must be safe for concurrent use. The handle function is
+// called for fetched values in the order of instances. It could return true
+// or an error to stop execution, the remaining evaluations are cancelled in
+// the case.
+func EvalForeachParallel[T any](instances []running.InstanceCtx,
+	opts ParallelEvalOpts,
+	fetch func(instance running.InstanceCtx, evaler connector.Evaler) (T, error),
+	handle func(instance running.InstanceCtx, value T) (bool, error)) error {
+	return evalForeachParallel(instances, opts, fetch, handle, false)
+}
+
+// EvalForeachAliveParallel is a concurrent version of EvalForeachAlive. See
+// EvalForeachParallel for details.
+func EvalForeachAliveParallel[T any](instances []running.InstanceCtx,
+	opts ParallelEvalOpts,
+	fetch func(instance running.InstanceCtx, evaler connector.Evaler) (T, error),
+	handle func(instance running.InstanceCtx, value T) (bool, error)) error {
+	return evalForeachParallel(instances, opts, fetch, handle, true)
+}
+
+// EvalAnyParallel is a concurrent version of EvalAny. It tries to connect to
+// instances concurrently and handles a value from the first connectable
+// instance in the order of instances. Other evaluations are cancelled.
+func EvalAnyParallel[T any](instances []running.InstanceCtx,
+	opts ParallelEvalOpts,
+	fetch func(instance running.InstanceCtx, evaler connector.Evaler) (T, error),
+	handle func(instance running.InstanceCtx, value T) error) error {
+	return EvalForeachAliveParallel(instances, opts, fetch,
+		func(instance running.InstanceCtx, value T) (bool, error) {
+			// Always return true to stop execution on the first instance.
+			return true, handle(instance, value)
+		})
+}
+
+// connectInstance establishes a new connection to the instance.
+func connectInstance(instance running.InstanceCtx) (connector.Connector, error) {
+	// connector.Connect could change the working directory of the process
+	// to connect to a socket, so connections are established one by one.
+	connectMutex.Lock()
+	defer connectMutex.Unlock()
+
+	return connector.Connect(connector.ConnectOpts{
+		Network: "unix",
+		Address: instance.ConsoleSocket,
+	})
+}
+
+// evalInstance connects to the instance and fetches a value. The connection
+// is closed if the context is cancelled before the fetch is finished.
+func evalInstance[T any](ctx context.Context, instance running.InstanceCtx,
+	opts ParallelEvalOpts,
+	fetch func(instance running.InstanceCtx, evaler connector.Evaler) (T, error),
+) parallelResult[T] {
+	var result parallelResult[T]
+	if ctx.Err() != nil {
+		result.err = ctx.Err()
+		return result
+	}
+
+	var (
+		evaler    connector.Evaler
+		interrupt func()
+	)
+	if opts.Pool != nil {
+		conn, err := opts.Pool.connect(instance)
+		if err != nil {
+			result.connectErr = err
+			return result
+		}
+		evaler = conn
+		interrupt = func() { opts.Pool.discard(instance) }
+	} else {
+		conn, err := connectInstance(instance)
+		if err != nil {
+			result.connectErr = err
+			return result
+		}
+		defer conn.Close()
+		evaler = conn
+		interrupt = func() { conn.Close() }
+	}
+
+	var (
+		mutex    sync.Mutex
+		finished bool
+	)
+	done := make(chan struct{})
+	go func() {
+		select {
+		case <-ctx.Done():
+			mutex.Lock()
+			if !finished {
+				interrupt()
+			}
+			mutex.Unlock()
+		case <-done:
+		}
+	}()
+
+	result.value, result.err = fetch(instance, NewTimeoutEvaler(evaler, opts.Timeout))
+	if result.err != nil && opts.Pool != nil {
+		// The connection could be broken, reconnect next time.
+		opts.Pool.discard(instance)
+	}
+
+	mutex.Lock()
+	finished = true
+	mutex.Unlock()
+	close(done)
+	return result
+}
+
+// evalForeachParallel is an internal implementation of concurrent iteration
+// over instances.
+func evalForeachParallel[T any](instances []running.InstanceCtx,
+	opts ParallelEvalOpts,
+	fetch func(instance running.InstanceCtx, evaler connector.Evaler) (T, error),
+	handle func(instance running.InstanceCtx, value T) (bool, error),
+	skipConnectError bool) error {
+	if len(instances) == 0 {
+		return fmt.Errorf("no instances to connect")
+	}
+
+	workers := opts.Workers
+	if workers <= 0 {
+		workers = DefaultEvalWorkers
+	}
+	if workers > len(instances) {
+		workers = len(instances)
+	}
+	// A stuck instance should not stall the whole evaluation.
+	if opts.Timeout == 0 {
+		opts.Timeout = DefaultEvalTimeout
+	} else if opts.Timeout < 0 {
+		opts.Timeout = 0
+	}
+
+	parent := opts.Context
+	if parent == nil {
+		parent = context.Background()
+	}
+	ctx, cancel := context.WithCancel(parent)
+	var wg sync.WaitGroup
+	defer func() {
+		// Cancel and wait for the remaining evaluations.
+		cancel()
+		wg.Wait()
+	}()
+
+	results := make([]chan parallelResult[T], len(instances))
+	for i := range results {
+		results[i] = make(chan parallelResult[T], 1)
+	}
+
+	indexes := make(chan int)
+	wg.Add(workers)
+	for w := 0; w < workers; w++ {
+		go func() {
+			defer wg.Done()
+			for i := range indexes {
+				results[i] <- evalInstance(ctx, instances[i], opts, fetch)
+			}
+		}()
+	}
+	go func() {
+		defer close(indexes)
+		for i := range instances {
+			select {
+			case indexes <- i:
+			case <-ctx.Done():
+				return
+			}
+		}
+	}()
+
+	connected := 0
+	for i, instance := range instances {
+		var result parallelResult[T]
+		select {
+		case result = <-results[i]:
+		case <-ctx.Done():
+			// The evaluation is cancelled by the context from the options,
+			// the instance could be not evaluated at all.
+			return ctx.Err()
+		}
+		if result.connectErr != nil {
+			if !skipConnectError {
+				return fmt.Errorf("failed to connect to '%s:%s': %w",
+					instance.AppName, instance.InstName, result.connectErr)
+			} else {
+				log.Debugf("failed to connect to '%s:%s': %s",
+					instance.AppName, instance.InstName, result.connectErr)
+				continue
+			}
+		}
+
+		connected++
+		if result.err != nil {
+			return result.err
+		}
+		done, err := handle(instance, result.value)
+		if err != nil {
+			return err
+		}
+		if done {
+			break
+		}
+	}
+	if connected == 0 {
+		return fmt.Errorf("failed to connect to any instance")
+	}
+	return nil
+}
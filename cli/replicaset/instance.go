@@ -20,4 +20,7 @@ type Instance struct {
 	// InstanceCtxFound is true if an instance is connectable and could be
 	// determined.
 	InstanceCtxFound bool
+	// Replication is a replication state of the instance. It is nil if the
+	// instance is not connectable.
+	Replication *Replication
 }
@@ -3,6 +3,7 @@
 package replicaset_test
 
 import (
+	"context"
 	"fmt"
 	"log"
 	"os"
@@ -434,6 +435,238 @@ func TestEvalForeachAlive_error(t *testing.T) {
 	}
 }
 
+func fetchListen(t *testing.T) func(running.InstanceCtx,
+	connector.Evaler) (any, error) {
+	return func(_ running.InstanceCtx, evaler connector.Evaler) (any, error) {
+		data, err := evaler.Eval("return box.cfg.listen", []any{}, connector.RequestOpts{})
+		require.NoError(t, err)
+		return data, nil
+	}
+}
+
+func TestEvalForeachParallel(t *testing.T) {
+	var instances []running.InstanceCtx
+	for i := 0; i < 3*replicaset.DefaultEvalWorkers; i++ {
+		instances = append(instances, running.InstanceCtx{
+			AppName:       fmt.Sprintf("app%d", i),
+			ConsoleSocket: console,
+		})
+	}
+
+	var handled []running.InstanceCtx
+	err := replicaset.EvalForeachParallel(instances, replicaset.ParallelEvalOpts{},
+		fetchListen(t),
+		func(instance running.InstanceCtx, value any) (bool, error) {
+			assert.Equal(t, []any{"127.0.0.1:3013"}, value)
+			handled = append(handled, instance)
+			return false, nil
+		})
+	assert.NoError(t, err)
+	assert.Equal(t, instances, handled)
+}
+
+func TestEvalForeachParallel_stops(t *testing.T) {
+	validInstance := running.InstanceCtx{
+		AppName:       "foo",
+		ConsoleSocket: console,
+	}
+	invalidInstance := running.InstanceCtx{
+		AppName:       "app",
+		InstName:      "instance",
+		ConsoleSocket: "unreachetable",
+	}
+
+	cases := []struct {
+		Name      string
+		Instances []running.InstanceCtx
+		Alive     bool
+		Done      bool
+		Error     error
+		Handled   []running.InstanceCtx
+		Expected  string
+	}{
+		{
+			Name:      "failed_to_connect",
+			Instances: []running.InstanceCtx{validInstance, invalidInstance, validInstance},
+			Handled:   []running.InstanceCtx{validInstance},
+			Expected:  "failed to connect to 'app:instance'",
+		},
+		{
+			Name:      "skip_failed_to_connect",
+			Instances: []running.InstanceCtx{validInstance, invalidInstance, validInstance},
+			Alive:     true,
+			Handled:   []running.InstanceCtx{validInstance, validInstance},
+		},
+		{
+			Name:      "done",
+			Instances: []running.InstanceCtx{validInstance, validInstance},
+			Done:      true,
+			Handled:   []running.InstanceCtx{validInstance},
+		},
+		{
+			Name:      "error",
+			Instances: []running.InstanceCtx{validInstance, validInstance},
+			Error:     fmt.Errorf("foo"),
+			Handled:   []running.InstanceCtx{validInstance},
+			Expected:  "foo",
+		},
+	}
+
+	for _, tc := range cases {
+		t.Run(tc.Name, func(t *testing.T) {
+			var handled []running.InstanceCtx
+			handle := func(instance running.InstanceCtx, _ any) (bool, error) {
+				handled = append(handled, instance)
+				return tc.Done, tc.Error
+			}
+
+			var err error
+			if tc.Alive {
+				err = replicaset.EvalForeachAliveParallel(tc.Instances,
+					replicaset.ParallelEvalOpts{Workers: 2}, fetchListen(t), handle)
+			} else {
+				err = replicaset.EvalForeachParallel(tc.Instances,
+					replicaset.ParallelEvalOpts{Workers: 2}, fetchListen(t), handle)
+			}
+			if tc.Expected != "" {
+				assert.ErrorContains(t, err, tc.Expected)
+			} else {
+				assert.NoError(t, err)
+			}
+			assert.Equal(t, tc.Handled, handled)
+		})
+	}
+}
+
+func TestEvalAnyParallel(t *testing.T) {
+	connectable := running.InstanceCtx{
+		AppName:       "foo",
+		ConsoleSocket: console,
+	}
+	instances := []running.InstanceCtx{
+		running.InstanceCtx{ConsoleSocket: "foo"},
+		connectable,
+		running.InstanceCtx{ConsoleSocket: "foo"},
+		connectable,
+	}
+
+	var handled []running.InstanceCtx
+	err := replicaset.EvalAnyParallel(instances, replicaset.ParallelEvalOpts{},
+		fetchListen(t),
+		func(instance running.InstanceCtx, _ any) error {
+			handled = append(handled, instance)
+			return nil
+		})
+	assert.NoError(t, err)
+	assert.Equal(t, []running.InstanceCtx{connectable}, handled)
+
+	err = replicaset.EvalAnyParallel(instances[0:1], replicaset.ParallelEvalOpts{},
+		fetchListen(t),
+		func(instance running.InstanceCtx, _ any) error {
+			return nil
+		})
+	assert.EqualError(t, err, "failed to connect to any instance")
+}
+
+func TestEvalForeachParallel_pool(t *testing.T) {
+	instances := []running.InstanceCtx{
+		running.InstanceCtx{
+			AppName:       "foo",
+			ConsoleSocket: console,
+		},
+	}
+	fetchSession := func(_ running.InstanceCtx, evaler connector.Evaler) (any, error) {
+		data, err := evaler.Eval("return box.session.id()", []any{}, connector.RequestOpts{})
+		require.NoError(t, err)
+		return data, nil
+	}
+	getSession := func(opts replicaset.ParallelEvalOpts) any {
+		var session any
+		err := replicaset.EvalForeachParallel(instances, opts, fetchSession,
+			func(_ running.InstanceCtx, value any) (bool, error) {
+				session = value
+				return false, nil
+			})
+		require.NoError(t, err)
+		return session
+	}
+
+	pool := replicaset.NewConnectionPool()
+	defer pool.Close()
+	opts := replicaset.ParallelEvalOpts{Pool: pool}
+	assert.Equal(t, getSession(opts), getSession(opts))
+	assert.NotEqual(t, getSession(replicaset.ParallelEvalOpts{}),
+		getSession(replicaset.ParallelEvalOpts{}))
+}
+
+func TestEvalForeachParallel_timeout(t *testing.T) {
+	responding := running.InstanceCtx{
+		AppName:       "foo",
+		ConsoleSocket: console,
+	}
+	hanging := running.InstanceCtx{
+		AppName:       "bar",
+		ConsoleSocket: console,
+	}
+	fetch := func(instance running.InstanceCtx, evaler connector.Evaler) (any, error) {
+		expr := "return box.cfg.listen"
+		if instance.AppName == hanging.AppName {
+			// The instance does not respond until the timeout.
+			expr = "require('fiber').sleep(20)"
+		}
+		return evaler.Eval(expr, []any{}, connector.RequestOpts{})
+	}
+
+	cases := []struct {
+		Name    string
+		Timeout time.Duration
+		Max     time.Duration
+	}{
+		{"explicit", 100 * time.Millisecond, 10 * time.Second},
+		{"default", 0, replicaset.DefaultEvalTimeout + 10*time.Second},
+	}
+
+	for _, tc := range cases {
+		t.Run(tc.Name, func(t *testing.T) {
+			var handled []running.InstanceCtx
+			start := time.Now()
+			err := replicaset.EvalForeachParallel(
+				[]running.InstanceCtx{responding, hanging, responding},
+				replicaset.ParallelEvalOpts{Timeout: tc.Timeout}, fetch,
+				func(instance running.InstanceCtx, _ any) (bool, error) {
+					handled = append(handled, instance)
+					return false, nil
+				})
+			assert.Error(t, err)
+			assert.Less(t, time.Since(start), tc.Max)
+			assert.Equal(t, []running.InstanceCtx{responding}, handled)
+		})
+	}
+}
+
+func TestEvalForeachParallel_context(t *testing.T) {
+	instances := []running.InstanceCtx{
+		running.InstanceCtx{
+			AppName:       "foo",
+			ConsoleSocket: console,
+		},
+	}
+	ctx, cancel := context.WithCancel(context.Background())
+	time.AfterFunc(100*time.Millisecond, cancel)
+
+	start := time.Now()
+	err := replicaset.EvalForeachParallel(instances,
+		replicaset.ParallelEvalOpts{Timeout: -1, Context: ctx},
+		func(_ running.InstanceCtx, evaler connector.Evaler) (any, error) {
+			return evaler.Eval("require('fiber').sleep(20)", []any{}, connector.RequestOpts{})
+		},
+		func(_ running.InstanceCtx, _ any) (bool, error) {
+			return false, nil
+		})
+	assert.ErrorIs(t, err, context.Canceled)
+	assert.Less(t, time.Since(start), 10*time.Second)
+}
+
 func TestEvalAny(t *testing.T) {
 	connectable := running.InstanceCtx{
 		AppName:       "foo",
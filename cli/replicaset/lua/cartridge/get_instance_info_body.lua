@@ -1,4 +1,5 @@
 return {
     uuid = box.info().uuid,
     rw   = box.cfg.read_only == false,
+    replication = get_replication_info(),
 }
@@ -19,6 +19,7 @@ local replicaset = {
     instances = {},
     instanceuuid = box_info.uuid,
     instancerw = box.cfg.read_only == false,
+    replication = get_replication_info(),
 }
 
 for _, instance in ipairs(box_info.replication) do
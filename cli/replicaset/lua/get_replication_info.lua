@@ -0,0 +1,45 @@
+local function format_vclock(vclock)
+    local ret = setmetatable({}, {__serialize = 'map'})
+    for id, lsn in pairs(vclock or {}) do
+        -- The zero component is local and it is not replicated.
+        if id ~= 0 then
+            ret[id] = lsn
+        end
+    end
+    return ret
+end
+
+local function get_replication_info()
+    local box_info = box.info()
+    local upstreams = {}
+    local downstreams = {}
+    for _, replica in pairs(box_info.replication) do
+        if replica.upstream ~= nil then
+            table.insert(upstreams, {
+                uuid = replica.uuid,
+                status = replica.upstream.status,
+                lag = replica.upstream.lag,
+                idle = replica.upstream.idle,
+                message = replica.upstream.message,
+            })
+        end
+        if replica.downstream ~= nil then
+            table.insert(downstreams, {
+                uuid = replica.uuid,
+                status = replica.downstream.status,
+                lag = replica.downstream.lag,
+                idle = replica.downstream.idle,
+                message = replica.downstream.message,
+                vclock = format_vclock(replica.downstream.vclock),
+            })
+        end
+    end
+
+    return {
+        id = box_info.id,
+        vclock = format_vclock(box_info.vclock),
+        upstreams = upstreams,
+        downstreams = downstreams,
+    }
+end
+
@@ -67,11 +67,13 @@ func recalculateMaster(replicaset *Replicaset) {
 	}
 }
 
-// recalculateMasters recalculates Replicaset.Master field for all replicasets
-// according to instances information.
+// recalculateMasters recalculates Replicaset.Master field and a replication
+// progress of instances for all replicasets according to instances
+// information.
 func recalculateMasters(replicasets Replicasets) Replicasets {
 	for i, _ := range replicasets.Replicasets {
 		recalculateMaster(&replicasets.Replicasets[i])
+		recalculateLSNBehind(&replicasets.Replicasets[i])
 	}
 
 	return replicasets
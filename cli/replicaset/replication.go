@@ -0,0 +1,105 @@
+package replicaset
+
+import (
+	_ "embed"
+)
+
+// getReplicationInfoFunc defines a Lua function get_replication_info() that
+// returns a replication information of an instance. It should be prepended
+// to a body that uses the function.
+//
+//go:embed lua/get_replication_info.lua
+var getReplicationInfoFunc string
+
+// Vclock is a vector clock of an instance: a replica id to LSN. The local
+// zero component is not included.
+type Vclock map[uint32]uint64
+
+// Upstream describes a replication from a remote instance.
+type Upstream struct {
+	// UUID is a remote instance UUID.
+	UUID string `json:"uuid"`
+	// Status is a replication status.
+	Status string `json:"status"`
+	// Lag is a time difference in seconds between the moment a transaction
+	// was committed on the remote instance and the moment it was received.
+	Lag float64 `json:"lag"`
+	// Idle is a time in seconds since the last received event.
+	Idle float64 `json:"idle"`
+	// Message is an error message, if any.
+	Message string `json:"message,omitempty"`
+}
+
+// Downstream describes a replication to a remote instance.
+type Downstream struct {
+	// UUID is a remote instance UUID.
+	UUID string `json:"uuid"`
+	// Status is a replication status.
+	Status string `json:"status"`
+	// Lag is a time difference in seconds between the moment a transaction
+	// was committed locally and the moment it was confirmed by the remote
+	// instance.
+	Lag float64 `json:"lag"`
+	// Idle is a time in seconds since the last received acknowledgment.
+	Idle float64 `json:"idle"`
+	// Message is an error message, if any.
+	Message string `json:"message,omitempty"`
+	// Vclock is the last vector clock acknowledged by the remote instance.
+	Vclock Vclock `json:"vclock"`
+}
+
+// Replication describes a replication state of an instance.
+type Replication struct {
+	// ID is an instance id in the replicaset.
+	ID uint32 `json:"id"`
+	// Vclock is a vector clock of the instance.
+	Vclock Vclock `json:"vclock"`
+	// Upstreams is a list of replications from remote instances.
+	Upstreams []Upstream `json:"upstreams"`
+	// Downstreams is a list of replications to remote instances.
+	Downstreams []Downstream `json:"downstreams"`
+	// LSNBehind is a count of LSNs that the instance has not applied yet
+	// from the replicaset leader. It is -1 if it could not be calculated.
+	LSNBehind int64 `json:"lsn_behind" mapstructure:"-"`
+}
+
+// lsnBehind returns a count of LSNs in the target vector clock that are not
+// in the vector clock.
+func (vclock Vclock) lsnBehind(target Vclock) int64 {
+	var behind int64
+	for id, lsn := range target {
+		if lsn > vclock[id] {
+			behind += int64(lsn - vclock[id])
+		}
+	}
+	return behind
+}
+
+// recalculateLSNBehind recalculates Replication.LSNBehind field for instances
+// of the replicaset according to the leader vector clock.
+func recalculateLSNBehind(replicaset *Replicaset) {
+	var leader *Instance
+	for i := range replicaset.Instances {
+		instance := &replicaset.Instances[i]
+		if replicaset.LeaderUUID != "" {
+			if instance.UUID == replicaset.LeaderUUID {
+				leader = instance
+			}
+		} else if replicaset.Master == MasterSingle && instance.Mode == ModeRW {
+			leader = instance
+		}
+	}
+
+	for i := range replicaset.Instances {
+		instance := &replicaset.Instances[i]
+		if instance.Replication == nil {
+			continue
+		}
+		instance.Replication.LSNBehind = -1
+		if leader == nil || leader.Replication == nil {
+			continue
+		}
+		instance.Replication.LSNBehind =
+			instance.Replication.Vclock.lsnBehind(leader.Replication.Vclock)
+	}
+}
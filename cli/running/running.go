@@ -306,7 +306,9 @@ func loadInstanceConfig(configPath, instName string) (cluster.InstanceConfig, er
 	// needed instead of the global one.
 	collectors, err := integrity.NewCollectorFactory()
 	if err == integrity.ErrNotConfigured {
-		collectors = cluster.NewCollectorFactory()
+		// The configuration is loaded for each instance and again on an
+		// instance restart, so etcd data is cached.
+		collectors = cluster.NewCachedCollectorFactory()
 	} else if err != nil {
 		return instCfg,
 			fmt.Errorf("failed to create collectors with integrity check: %w", err)
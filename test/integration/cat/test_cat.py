@@ -1,3 +1,4 @@
+import json
 import os
 import re
 import shutil
@@ -18,7 +19,7 @@ def test_cat_non_existent_file(tt_cmd, tmpdir):
     cmd = [tt_cmd, "cat", "path-to-non-existent-file"]
     rc, output = run_command_and_get_output(cmd, cwd=tmpdir)
     assert rc == 1
-    assert re.search(r"No such file or directory", output)
+    assert re.search(r"no such file or directory", output)
 
 
 def test_cat_snap_file(tt_cmd, tmpdir):
@@ -49,3 +50,18 @@ def test_cat_xlog_file(tt_cmd, tmpdir):
     rc, output = run_command_and_get_output(cmd, cwd=tmpdir)
     assert rc == 0
     assert re.search(r"replica_id: 1", output)
+
+
+def test_cat_stats_file(tt_cmd, tmpdir):
+    test_app_path = os.path.join(os.path.dirname(__file__), "test_file", "test.xlog")
+    shutil.copy(test_app_path, tmpdir)
+
+    cmd = [tt_cmd, "cat", "test.xlog", "--show-system", "--stats-file", "stats.json"]
+    rc, output = run_command_and_get_output(cmd, cwd=tmpdir)
+    assert rc == 0
+    assert re.search(r"Cat summary: 1 files, 2 rows read, 2 rows matched", output)
+
+    with open(os.path.join(tmpdir, "stats.json")) as f:
+        stats = json.load(f)
+    assert stats["rows_read"] == 2
+    assert stats["files"][0]["file"] == "test.xlog"
@@ -1,3 +1,4 @@
+import json
 import os
 import re
 import shutil
@@ -55,7 +56,14 @@ def test_play_non_existent_file(tt_cmd, tmpdir):
     assert re.search(r"No such file or directory", output)
 
 
-def test_play_test_remote_instance(tt_cmd, tmpdir):
+@pytest.mark.parametrize("flags", [
+    [],
+    ["--window=1"],
+    ["--window=2"],
+    ["--connections=3"],
+    ["--connections=3", "--partition=key"],
+])
+def test_play_test_remote_instance(tt_cmd, tmpdir, flags):
     # Testing play using remote instance.
     test_app_path = os.path.join(os.path.dirname(__file__), "test_file")
     # Copy the .xlog file to the "run" directory.
@@ -67,7 +75,7 @@ def test_play_test_remote_instance(tt_cmd, tmpdir):
     test_instance.start()
 
     # Play .xlog file to the remote instance.
-    cmd = [tt_cmd, "play", "127.0.0.1:" + test_instance.port, "test.xlog", "--space=999"]
+    cmd = [tt_cmd, "play", "127.0.0.1:" + test_instance.port, "test.xlog", "--space=999", *flags]
     rc, output = run_command_and_get_output(cmd, cwd=tmpdir)
     test_instance.stop()
     assert rc == 0
@@ -83,6 +91,61 @@ def test_play_test_remote_instance(tt_cmd, tmpdir):
     assert re.search(r"[3, 'Ace of Base', 1993]", output)
 
 
+def test_play_journal_resume(tt_cmd, tmpdir):
+    test_app_path = os.path.join(os.path.dirname(__file__), "test_file")
+    shutil.copy(test_app_path + "/test.xlog", tmpdir)
+    journal_path = os.path.join(tmpdir, "play.journal")
+
+    # Resume without a journal file.
+    cmd = [tt_cmd, "play", "127.0.0.1:0", "test.xlog", "--resume"]
+    rc, output = run_command_and_get_output(cmd, cwd=tmpdir)
+    assert rc == 1
+    assert re.search(r"the journal is required to resume", output)
+
+    path_to_lua_utils = os.path.join(os.path.dirname(__file__), "test_file/../../../")
+    test_instance = TarantoolTestInstance(INSTANCE_NAME, test_app_path, path_to_lua_utils, tmpdir)
+    test_instance.start()
+
+    uri = "127.0.0.1:" + test_instance.port
+    cmd = [tt_cmd, "play", uri, "test.xlog", "--space=999", "--journal", journal_path,
+           "--stats-file", "stats.json"]
+    rc, output = run_command_and_get_output(cmd, cwd=tmpdir)
+    assert rc == 0
+    assert re.search(r"Play summary: 1 files", output)
+    assert re.search(r"Play result: completed successfully", output)
+
+    with open(os.path.join(tmpdir, "stats.json")) as f:
+        stats = json.load(f)
+    assert stats["rows_applied"] == stats["spaces"]["999"]["rows_applied"]
+    assert stats["files"][0]["file"] == "test.xlog"
+
+    with open(journal_path) as f:
+        journal = json.load(f)
+    assert journal["file"] == os.path.join(tmpdir, "test.xlog")
+    assert journal["file_done"]
+
+    # All files are played already.
+    cmd = [tt_cmd, "play", uri, "test.xlog", "--space=999", "--journal", journal_path,
+           "--resume"]
+    rc, output = run_command_and_get_output(cmd, cwd=tmpdir)
+    assert rc == 0
+    assert re.search(r"No files with operations to play", output)
+
+    # The file is played by a relative path with "..", and the journal
+    # contains a not cleaned absolute path.
+    subdir = os.path.join(tmpdir, "subdir")
+    os.mkdir(subdir)
+    journal["file"] = os.path.join(subdir, "..", "test.xlog")
+    with open(journal_path, "w") as f:
+        json.dump(journal, f)
+    cmd = [tt_cmd, "play", uri, "../test.xlog", "--space=999", "--journal", journal_path,
+           "--resume"]
+    rc, output = run_command_and_get_output(cmd, cwd=subdir)
+    test_instance.stop()
+    assert rc == 0
+    assert re.search(r"No files with operations to play", output)
+
+
 @pytest.mark.parametrize("opts", [
     pytest.param({"flags": ["--username=test_user", "--password=4"]}),
     pytest.param({"flags": ["--username=fry"]}),